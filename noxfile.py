@@ -11,3 +11,34 @@ def unit_tests(session: nox.Session) -> None:
 
     # run tests
     session.run("pytest", "tests/unit")
+
+
+@nox.session(name="build-resources", python="3.11")
+def build_resources(session: nox.Session) -> None:
+    """Compile csv data resources into their binary formats, and the resources built from them."""
+    # editable install so resources are compiled into the source tree
+    session.install("-e", ".")
+
+    session.run("python", "-m", "game_solvers.common.wordlist")
+    session.run("python", "-m", "game_solvers.games.wordle_tree")
+    session.run("python", "-m", "game_solvers.games.wordle_openings")
+
+
+@nox.session(name="benchmarks", python="3.11")
+def benchmarks(session: nox.Session) -> None:
+    """Benchmark each solver stage and fail on regressions against the committed baseline.
+
+    Arguments are passed to the benchmark command, e.g. ``nox -s benchmarks -- --threshold 0.1 --scales 1,10``.
+    """
+    session.install(".")
+
+    session.run(
+        "python",
+        "-m",
+        "game_solvers",
+        "wordle",
+        "benchmark",
+        "--baseline",
+        "tests/benchmarks/wordle_baseline.json",
+        *session.posargs,
+    )
@@ -1 +1,25 @@
 """Game Solvers Core Package."""
+
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    """Provide ``__version__``, read from the metadata of the installed package when first asked for.
+
+    The version is only declared in ``pyproject.toml``, and reading it lazily keeps importing the package cheap.
+
+    :param name: name of the attribute.
+    :return: the version, or ``unknown`` when the package is not installed.
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        package_version = version("game-solvers")
+    except PackageNotFoundError:
+        package_version = "unknown"
+
+    globals()["__version__"] = package_version
+    return package_version
@@ -1,6 +1,25 @@
 """Main Module."""
 
-from game_solvers.cli import cli_main
+import sys
+from pathlib import Path
+
+from game_solvers import __version__
+
+
+def main() -> None:
+    """Run the CLI, answering ``--version`` without loading the application.
+
+    Scripts checking the version of the installed package run far more often than any command, so the version is
+    reported the same way the CLI reports it without importing the CLI.
+    """
+    if sys.argv[1:] == ["--version"]:
+        print(f"{Path(sys.argv[0]).name} version: {__version__}")
+        return
+
+    from game_solvers.cli import cli_main
 
-if __name__ == "__main__":
     cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,22 @@
 """Module holding PyApp CLI entrypoint.
 
 Logic to be kept to a minimum in this module and call out to other modules.
+
+Modules only some commands need, such as rich reporting, process pools and the asyncio server, are imported within
+those commands, so every other command and ``--help`` start without loading them.
 """
 
+import json
+import os
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
 from pyapp.app import CliApplication, argument
 
-from game_solvers.games.wordle import WordleSolver
+from game_solvers.common.formats import OUTPUT_FORMATS, RICH
+from game_solvers.games.wordle import STRATEGIES, WordleSolver
+from game_solvers.games.wordle_patterns import parse_pattern
 
 app = CliApplication(
     description="Matt's Game Solver",
@@ -15,6 +26,16 @@ cli_main = app.dispatch
 LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 WORDLE_POS_DIGITS = "12345"
 
+WORDLE_PLAY_HELP = """Enter one of the following each turn:
+  CRANE gy..g         a guess and its feedback, g (green), y (yellow) or . (grey) for each letter
+  green A2,Y5         letters with a known position
+  yellow B12,C4       letters known to be in the word, and positions they are not in
+  grey R,C            letters known not to be in the word
+  strategy entropy    change how guesses are ranked, one of {strategies}
+  new                 start a new game
+  help                show this message
+  quit                leave the session"""
+
 
 class WordleCLI:
     """Group of CLI commands that help solve wordle problems."""
@@ -113,6 +134,61 @@ class WordleCLI:
 
         return greys
 
+    @staticmethod
+    def parse_history(input_value: str | None) -> list[tuple[str, int]]:
+        """Validate and parse input data for guesses and the feedback received on each.
+
+        :param input_value: input provided by the user for the guess history.
+        :return: Validated list of upper case guesses and their feedback patterns
+        """
+        if not input_value:
+            return []
+
+        history = []
+        for split in input_value.split(","):
+            guess, _, pattern = split.partition(":")
+            if len(guess) != 5 or any(letter not in LETTERS for letter in guess.upper()):
+                raise ValueError(
+                    f"Each input for history must be a five letter guess, "
+                    f"a colon and its feedback. Input {split} is invalid."
+                )
+
+            history.append((guess.upper(), parse_pattern(pattern)))
+
+        return history
+
+    @staticmethod
+    def play_turn(solver: WordleSolver, input_value: str, strategy: str) -> str:
+        """Apply one line of input from an interactive wordle session.
+
+        :param solver: solver holding the state of the current game.
+        :param input_value: line entered by the user.
+        :param strategy: strategy currently used to rank guesses.
+        :return: the strategy to use from now on.
+        """
+        command, _, value = input_value.strip().partition(" ")
+        command, value = command.lower(), value.strip()
+
+        if command == "strategy":
+            if value.lower() not in STRATEGIES:
+                raise ValueError(f"Strategy must be one of {', '.join(STRATEGIES)}. Input {value} is invalid.")
+            return value.lower()
+
+        if command == "green":
+            solver.add_letters(WordleCLI.parse_green(value), [], [])
+        elif command == "yellow":
+            solver.add_letters([], WordleCLI.parse_yellow(value), [])
+        elif command == "grey":
+            solver.add_letters([], [], WordleCLI.parse_grey(value))
+        elif command == "new":
+            solver.reset()
+        elif value and " " not in value:
+            solver.apply_feedback(command, value)
+        else:
+            raise ValueError(f"Unrecognised input {input_value.strip()}, enter help to list what can be entered.")
+
+        return strategy
+
     # Commands
     @staticmethod
     @group.command(help_text=("Given the current state of a wordle game, " "provide the five best solutions"))
@@ -148,10 +224,412 @@ class WordleCLI:
                 "e.g. `--grey R,C`"
             ),
         ),
+        history_input: str = argument(
+            "--history",
+            default=None,
+            help_text=(
+                "Guesses made and the feedback received on each. "
+                "Should be provided as a comma seperated list of guesses, "
+                "each followed by a colon and its feedback of g (green), y (yellow) or . (grey) for each letter. "
+                "e.g. `--history CRANE:gy..g,SLOTH:..g..`"
+            ),
+        ),
+        strategy: str = argument(
+            "--strategy",
+            default="score",
+            choices=STRATEGIES,
+            help_text=(
+                f"How to rank guesses, one of {', '.join(STRATEGIES)}. "
+                "`score` ranks by letter distribution only, "
+                "`entropy` also ranks every word by the expected information from its feedback, "
+                "`minimax` also ranks every word by the most possible answers its feedback could leave, "
+                "`tree` follows the precomputed decision tree while the game stays on it. "
+                "e.g. `--strategy entropy`"
+            ),
+        ),
+        top: int = argument(
+            "--top",
+            type=int,
+            default=10,
+            help_text="Number of words to show in each list. e.g. `--top 20`",
+        ),
+        output_format: str = argument(
+            "--format",
+            default=RICH,
+            choices=OUTPUT_FORMATS,
+            help_text=(
+                "How to write the solutions. "
+                "`rich` for a report to read in a terminal, "
+                "`json`, `ndjson` or `tsv` for another program to read. "
+                "e.g. `--format ndjson`"
+            ),
+        ),
+        workers: int = argument(
+            "--workers",
+            type=int,
+            default=1,
+            help_text="Number of worker processes to rank guesses with. e.g. `--workers 8`",
+        ),
+        profile: bool = argument(
+            "--profile",
+            action="store_true",
+            default=False,
+            help_text=(
+                "Write the calls, wall time and peak memory of each stage of solving to stderr, as JSON. "
+                "e.g. `--profile`"
+            ),
+        ),
+        profile_dir: str = argument(
+            "--profile-dir",
+            default=None,
+            help_text=(
+                "Folder to also dump a cProfile profile of each stage to, when profiling. "
+                "e.g. `--profile-dir ./profiles`"
+            ),
+        ),
     ):
         """Given the current state of a wordle game, provide the five best solutions."""
         greens = WordleCLI.parse_green(green_letters)
         yellows = WordleCLI.parse_yellow(yellow_letters)
         greys = WordleCLI.parse_grey(grey_letters)
+        history = WordleCLI.parse_history(history_input)
+
+        profiler = None
+        if profile:
+            from game_solvers.common.profiling import StageProfiler
+
+            profiler = StageProfiler(cprofile_dir=Path(profile_dir) if profile_dir else None)
+
+        solver = None
+        try:
+            solver = WordleSolver(greens, yellows, greys, profiler=profiler)
+            solver.ranking_workers = workers
+
+            # feedback narrows the candidates to the words giving the same patterns, no letter rules are involved
+            for guess, pattern in history:
+                solver.apply_feedback(guess, pattern)
+
+            solver.solutions(strategy=strategy, top=top, output_format=output_format)
+        finally:
+            if solver is not None:
+                solver.close()
+            if profiler is not None:
+                profiler.close()
+                report = {"stages": profiler.report(), "profiles": [str(path) for path in profiler.dump_profiles()]}
+                if solver is not None and solver.filter_plan is not None:
+                    report["constraints"] = solver.filter_plan.stats()
+                print(json.dumps(report, indent=2), file=sys.stderr)
+
+    @staticmethod
+    @group.command(help_text="Play a game against every word in the dictionary to measure a strategy")
+    def simulate(
+        *,
+        strategy: str = argument(
+            "--strategy",
+            default="score",
+            choices=STRATEGIES,
+            help_text="How to choose each guess, from the words still possible. e.g. `--strategy entropy`",
+        ),
+        opener: str = argument(
+            "--opener",
+            default=None,
+            help_text="First guess of every game, defaults to the highest scoring word. e.g. `--opener CRANE`",
+        ),
+        sample: int = argument(
+            "--sample",
+            type=int,
+            default=None,
+            help_text="Play against a random sample of this many answers rather than every word. e.g. `--sample 500`",
+        ),
+        seed: int = argument(
+            "--seed",
+            type=int,
+            default=None,
+            help_text="Seed for the random sample of answers. e.g. `--seed 42`",
+        ),
+        workers: int = argument(
+            "--workers",
+            type=int,
+            default=None,
+            help_text="Number of worker processes, defaults to the number of CPUs. e.g. `--workers 4`",
+        ),
+    ):
+        """Play a game against every word in the dictionary to measure a strategy."""
+        import random
+
+        from game_solvers.common.report import report_wordle_simulation
+        from game_solvers.games.wordle_simulation import simulate as simulate_wordle
+
+        words = WordleSolver.prep_words()
+        answers = random.Random(seed).sample(words, min(sample, len(words))) if sample else None  # noqa: S311
+
+        result = simulate_wordle(words, strategy=strategy, opener=opener, answers=answers, workers=workers)
+
+        report_wordle_simulation(
+            result.strategy,
+            result.opener,
+            result.games,
+            result.distribution,
+            result.failure_rate,
+            result.mean_guesses,
+            result.games_per_second,
+        )
+
+    @staticmethod
+    @group.command(help_text="Play a game of wordle interactively, updating the solutions after every turn")
+    def play(
+        *,
+        strategy: str = argument(
+            "--strategy",
+            default="score",
+            choices=STRATEGIES,
+            help_text="How to rank guesses, can be changed during the session. e.g. `--strategy entropy`",
+        ),
+        top: int = argument(
+            "--top",
+            type=int,
+            default=10,
+            help_text="Number of words to show in each list. e.g. `--top 20`",
+        ),
+        workers: int = argument(
+            "--workers",
+            type=int,
+            default=1,
+            help_text="Number of worker processes to rank guesses with. e.g. `--workers 8`",
+        ),
+    ):
+        """Play a game of wordle interactively, updating the solutions after every turn."""
+        # the dictionary and its caches are loaded once and kept warm for every turn of every game
+        solver = WordleSolver([], [], [])
+        solver.ranking_workers = workers
+        print(WORDLE_PLAY_HELP.format(strategies=", ".join(STRATEGIES)))
+
+        try:
+            while True:
+                try:
+                    input_value = input("wordle> ")
+                except EOFError:
+                    break
+
+                if input_value.strip().lower() in ("quit", "exit"):
+                    break
+
+                if not input_value.strip() or input_value.strip().lower() == "help":
+                    print(WORDLE_PLAY_HELP.format(strategies=", ".join(STRATEGIES)))
+                    continue
+
+                try:
+                    strategy = WordleCLI.play_turn(solver, input_value, strategy)
+                except ValueError as err:
+                    print(err)
+                    continue
+
+                solver.solutions(strategy=strategy, top=top)
+        finally:
+            solver.close()
+
+    @staticmethod
+    @group.command(help_text="Rank suggestions for every wordle game state in a JSON lines file")
+    def batch(
+        *,
+        input_path: str = argument(
+            "--input",
+            default="-",
+            help_text="JSON lines file of game states, one request per line, `-` for stdin. e.g. `--input games.jsonl`",
+        ),
+        output_path: str = argument(
+            "--output",
+            default="-",
+            help_text="File to write the JSON lines responses to, `-` for stdout. e.g. `--output ranked.jsonl`",
+        ),
+        strategy: str = argument(
+            "--strategy",
+            default="score",
+            choices=STRATEGIES,
+            help_text="How to rank guesses, for game states not giving their own. e.g. `--strategy entropy`",
+        ),
+        limit: int = argument(
+            "--limit",
+            type=int,
+            default=10,
+            help_text="Number of suggestions per game state, for game states not giving their own. e.g. `--limit 5`",
+        ),
+        workers: int = argument(
+            "--workers",
+            type=int,
+            default=None,
+            help_text="Number of worker processes, defaults to the number of CPUs. e.g. `--workers 4`",
+        ),
+        chunk_size: int = argument(
+            "--chunk-size",
+            type=int,
+            default=256,
+            help_text="Number of game states handed to a worker at a time. e.g. `--chunk-size 100`",
+        ),
+        cache_size: int = argument(
+            "--cache-size",
+            type=int,
+            default=4096,
+            help_text="Most responses each worker caches by game state. e.g. `--cache-size 10000`",
+        ),
+        cache_file: str = argument(
+            "--cache-file",
+            default=None,
+            help_text="SQLite file to also cache responses in, kept between runs. e.g. `--cache-file states.db`",
+        ),
+    ):
+        """Rank suggestions for every wordle game state in a JSON lines file."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        from game_solvers.common.batch import iter_batch
+        from game_solvers.games.wordle_service import handle_request, init_worker, log_cache_stats
+
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be a positive number. Input {chunk_size} is invalid.")
+
+        workers = workers or os.cpu_count() or 1
+
+        with ExitStack() as stack:
+            input_file = sys.stdin if input_path == "-" else stack.enter_context(Path(input_path).open())
+            output_file = sys.stdout if output_path == "-" else stack.enter_context(Path(output_path).open("w"))
+            if workers == 1:
+                executor = None
+                init_worker(cache_size=cache_size, cache_file=cache_file)
+            else:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(workers, initializer=init_worker, initargs=(None, cache_size, cache_file))
+                )
+
+            responses = iter_batch(
+                input_file,
+                handle_request,
+                executor,
+                defaults={"strategy": strategy, "limit": limit},
+                chunk_size=chunk_size,
+                max_pending=2 * workers,
+            )
+            for response in responses:
+                output_file.write(response + "\n")
+
+        # worker processes log their own cache counters as the pool shuts down
+        if workers == 1:
+            log_cache_stats()
+
+    @staticmethod
+    @group.command(help_text="Benchmark each stage of solving a wordle game, checking for regressions")
+    def benchmark(
+        *,
+        output_path: str = argument(
+            "--output",
+            default="benchmark-results.json",
+            help_text="File to write the JSON benchmark results to. e.g. `--output results.json`",
+        ),
+        baseline_path: str = argument(
+            "--baseline",
+            default=None,
+            help_text="JSON benchmark results to compare against. e.g. `--baseline baseline.json`",
+        ),
+        threshold: float = argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help_text="Fraction a benchmark may slow down by before failing. e.g. `--threshold 0.1`",
+        ),
+        scales: str = argument(
+            "--scales",
+            default="1,10,100",
+            help_text="Comma separated multiples of the dictionary size to benchmark on. e.g. `--scales 1,10`",
+        ),
+        repeat: int = argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help_text="Number of measurements of each benchmark, the fastest is kept. e.g. `--repeat 5`",
+        ),
+    ):
+        """Benchmark each stage of solving a wordle game, checking for regressions."""
+        from game_solvers.common.benchmark import (
+            compare_results,
+            read_results,
+            regressions,
+            run_benchmarks,
+            write_results,
+        )
+        from game_solvers.games.wordle_benchmark import wordle_benchmarks
+
+        if not all(scale.isdigit() and int(scale) > 0 for scale in scales.split(",")):
+            raise ValueError(f"Scales must be a comma separated list of positive numbers. Input {scales} is invalid.")
+
+        results = run_benchmarks(wordle_benchmarks(tuple(int(scale) for scale in scales.split(","))), repeat)
+        write_results(results, Path(output_path))
+
+        if not baseline_path:
+            for name, timing in results.items():
+                print(f"{name:<40}{timing['seconds'] * 1000:>12.4f}ms")
+            return 0
+
+        comparison = compare_results(results, read_results(Path(baseline_path)))
+        regressed = regressions(comparison, threshold)
+        for name, baseline_seconds, seconds, change in comparison:
+            flag = "  REGRESSED" if change > threshold else ""
+            print(f"{name:<40}{baseline_seconds * 1000:>12.4f}ms{seconds * 1000:>12.4f}ms{change:>+9.1%}{flag}")
+
+        if regressed:
+            print(f"{len(regressed)} of {len(comparison)} benchmarks slowed down by more than {threshold:.0%}.")
+            return 1
+
+        return 0
+
+
+@app.command(help_text="Answer wordle solver requests, as JSON lines, over a local socket")
+async def serve(
+    *,
+    socket_path: str = argument(
+        "--socket",
+        default=None,
+        help_text="Path of a unix socket to listen on, instead of a TCP port. e.g. `--socket /tmp/game_solvers.sock`",
+    ),
+    host: str = argument(
+        "--host",
+        default="127.0.0.1",
+        help_text="Host to listen on for TCP clients. e.g. `--host 127.0.0.1`",
+    ),
+    port: int = argument(
+        "--port",
+        type=int,
+        default=8765,
+        help_text="Port to listen on for TCP clients. e.g. `--port 8765`",
+    ),
+    workers: int = argument(
+        "--workers",
+        type=int,
+        default=None,
+        help_text="Number of worker processes answering requests, defaults to the number of CPUs. e.g. `--workers 4`",
+    ),
+    cache_size: int = argument(
+        "--cache-size",
+        type=int,
+        default=4096,
+        help_text="Most responses each worker caches by game state. e.g. `--cache-size 10000`",
+    ),
+    cache_file: str = argument(
+        "--cache-file",
+        default=None,
+        help_text="SQLite file to also cache responses in, kept between restarts. e.g. `--cache-file states.db`",
+    ),
+):
+    """Answer wordle solver requests, as JSON lines, over a local socket."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    from game_solvers.common.server import SolverServer
+    from game_solvers.games.wordle_dictionary import load_dictionary
+    from game_solvers.games.wordle_service import handle_request, init_worker
+
+    # load the shared dictionary and its indexes, building the cached pattern matrix, once up front rather than in
+    # every worker on its first request. Forked workers inherit the loaded dictionary
+    load_dictionary().preload()
 
-        WordleSolver(greens, yellows, greys).solutions()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(None, cache_size, cache_file)
+    ) as executor:
+        await SolverServer(handle_request, executor).serve(socket_path, host, port)
@@ -0,0 +1,90 @@
+"""Module for answering a stream of JSON requests in batches.
+
+Request lines are read lazily and grouped into chunks, each chunk answered in a worker process, and responses are
+written in input order, one JSON line per request. At most a fixed number of chunks are in flight at once, so
+memory use depends on the chunk size and number of workers rather than the size of the input.
+
+Responses follow the same format as the solver server, carrying the request's ``id``, or its line number when it
+has none, with ``ok`` and either the handler's response fields or an ``error``.
+"""
+
+import json
+import logging
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future
+from itertools import islice
+from typing import Any
+
+from .server import RequestHandler
+
+logger = logging.getLogger("SolverBatch")
+
+
+def answer_chunk(handler: RequestHandler, defaults: dict[str, Any], chunk: list[tuple[int, str]]) -> list[str]:
+    """Answer a chunk of request lines.
+
+    :param handler: answers one decoded request with the fields of its response, raising ValueError for
+        an invalid request.
+    :param defaults: fields added to every request that does not set them itself.
+    :param chunk: line numbers and request lines, blank lines are skipped.
+    :return: JSON encoded responses, in the order of the requests.
+    """
+    responses = []
+
+    for line_number, line in chunk:
+        if not line.strip():
+            continue
+
+        request_id: Any = line_number
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError(f"Requests must be JSON objects. Input {line.strip()} is invalid.")
+
+            request_id = request.pop("id", line_number)
+            response = {"id": request_id, "ok": True, **handler({**defaults, **request})}
+        except ValueError as err:
+            response = {"id": request_id, "ok": False, "error": str(err)}
+        except Exception:
+            logger.exception("Request %s failed", request_id)
+            response = {"id": request_id, "ok": False, "error": "Internal error, see the log for details."}
+
+        responses.append(json.dumps(response))
+
+    return responses
+
+
+def iter_batch(
+    lines: Iterable[str],
+    handler: RequestHandler,
+    executor: Executor | None = None,
+    defaults: dict[str, Any] | None = None,
+    chunk_size: int = 256,
+    max_pending: int = 4,
+) -> Iterator[str]:
+    """Answer request lines in chunks, yielding responses in input order.
+
+    :param lines: JSON request lines, read lazily.
+    :param handler: answers one decoded request, must be picklable to run in a process pool.
+    :param executor: executor to answer chunks in, chunks are answered in this process when not given.
+    :param defaults: fields added to every request that does not set them itself.
+    :param chunk_size: number of lines per chunk.
+    :param max_pending: most chunks submitted to the executor and not yet yielded at once.
+    :return: iterator of JSON encoded responses.
+    """
+    defaults = defaults or {}
+    numbered = enumerate(lines, start=1)
+    pending: deque[Future[list[str]]] = deque()
+
+    while chunk := list(islice(numbered, chunk_size)):
+        if executor is None:
+            yield from answer_chunk(handler, defaults, chunk)
+            continue
+
+        pending.append(executor.submit(answer_chunk, handler, defaults, chunk))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+
+    while pending:
+        yield from pending.popleft().result()
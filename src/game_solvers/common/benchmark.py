@@ -0,0 +1,116 @@
+"""Module for timing solver stages and gating on regressions against a stored baseline.
+
+Each benchmark times one call of a stage with `timeit`, repeating enough calls per measurement to last at least
+``min_time`` seconds, then taking the fastest of several measurements as the least noisy estimate of its cost.
+
+Results are written as JSON::
+
+    {"version": 1, "python": "3.11.7", "results": {"score_word@1x": {"seconds": 1.2e-06, ...}, ...}}
+
+and compared benchmark by benchmark against a baseline file in the same format, a benchmark regressing when it is
+slower than its baseline by more than the given threshold. Benchmarks missing from either file are not compared.
+"""
+
+import json
+import platform
+import timeit
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+BENCHMARK_VERSION = 1
+
+# default fraction a benchmark may slow down by before it is a regression
+DEFAULT_THRESHOLD = 0.25
+
+
+def time_call(func: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> dict[str, float]:
+    """Time calls of a function.
+
+    :param func: function to time, called with no arguments.
+    :param repeat: number of measurements to take.
+    :param min_time: least time, in seconds, each measurement should take.
+    :return: fastest and mean seconds per call, and the number of calls per measurement.
+    """
+    timer = timeit.Timer(func)
+    number, seconds = timer.autorange()
+
+    # autorange stops at 0.2 seconds, scale up for longer measurements
+    if seconds < min_time:
+        number = max(number, int(number * min_time / max(seconds, 1e-9)))
+
+    timings = [seconds / number for seconds in timer.repeat(repeat, number)]
+
+    return {"seconds": min(timings), "mean_seconds": sum(timings) / len(timings), "number": number}
+
+
+def run_benchmarks(
+    benchmarks: Iterable[tuple[str, Callable[[], object]]], repeat: int = 5, min_time: float = 0.2
+) -> dict[str, dict[str, float]]:
+    """Time every benchmark.
+
+    :param benchmarks: name of each benchmark and the function it times.
+    :param repeat: number of measurements to take of each benchmark.
+    :param min_time: least time, in seconds, each measurement should take.
+    :return: timings of each benchmark, by name.
+    """
+    return {name: time_call(func, repeat, min_time) for name, func in benchmarks}
+
+
+def write_results(results: dict[str, dict[str, float]], path: Path) -> Path:
+    """Write benchmark results to disk as JSON.
+
+    :param results: timings of each benchmark, by name.
+    :param path: path to write the results to.
+    :return: path of the written results.
+    """
+    document = {"version": BENCHMARK_VERSION, "python": platform.python_version(), "results": results}
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+    return path
+
+
+def read_results(path: Path) -> dict[str, dict[str, float]]:
+    """Read benchmark results from disk.
+
+    :param path: path of the results.
+    :return: timings of each benchmark, by name.
+    """
+    document: dict[str, Any] = json.loads(path.read_text())
+
+    if document.get("version") != BENCHMARK_VERSION:
+        raise ValueError(f"Unsupported benchmark results version {document.get('version')}.")
+
+    results: dict[str, dict[str, float]] = document["results"]
+    return results
+
+
+def compare_results(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]]
+) -> list[tuple[str, float, float, float]]:
+    """Compare benchmark results against a baseline.
+
+    :param results: timings of each benchmark, by name.
+    :param baseline: baseline timings of each benchmark, by name.
+    :return: name, baseline seconds, seconds and relative change of every benchmark in both, in name order.
+    """
+    return [
+        (name, baseline[name]["seconds"], timing["seconds"], timing["seconds"] / baseline[name]["seconds"] - 1)
+        for name, timing in sorted(results.items())
+        if name in baseline and baseline[name]["seconds"] > 0
+    ]
+
+
+def regressions(
+    comparison: list[tuple[str, float, float, float]], threshold: float = DEFAULT_THRESHOLD
+) -> list[tuple[str, float, float, float]]:
+    """Select the benchmarks that slowed down by more than the threshold.
+
+    :param comparison: name, baseline seconds, seconds and relative change of each benchmark.
+    :param threshold: fraction a benchmark may slow down by before it is a regression, e.g. ``0.25`` for 25%.
+    :return: the regressed benchmarks.
+    """
+    if threshold < 0:
+        raise ValueError(f"Regression threshold must not be negative. Input {threshold} is invalid.")
+
+    return [row for row in comparison if row[3] > threshold]
@@ -0,0 +1,136 @@
+"""Module for caching solver results by game state.
+
+Results are held in memory by `StateCache`, a least recently used cache bounded to a number of entries, and can be
+backed by a `StateStore` on disk so they survive restarts and are shared between processes. Keys are strings, which
+callers build from a canonical form of the game state so that equivalent states share an entry, and values must be
+JSON encodable to be stored on disk.
+
+Lookups are counted as hits, whether from memory or the store, or misses, and entries dropped to keep within the
+size bound are counted as evictions.
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+class StateStore:
+    """SQLite backed store of cached results, shared by every process using the same file."""
+
+    def __init__(self, path: Path, namespace: str = ""):
+        """Open the store, creating it if required.
+
+        :param path: path of the SQLite database file.
+        :param namespace: prefix separating the entries of different word lists within one file.
+        """
+        self.path = path
+        self.namespace = namespace
+
+        # autocommit, each result is written as soon as it is known. WAL lets workers read while another writes
+        self.connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS states (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def get(self, key: str) -> Any | None:
+        """Read a stored result.
+
+        :param key: key of the result.
+        :return: the decoded result, or None if not stored.
+        """
+        row = self.connection.execute("SELECT value FROM states WHERE key = ?", (self.namespace + key,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a result, replacing any stored under the same key.
+
+        :param key: key of the result.
+        :param value: JSON encodable result.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO states (key, value) VALUES (?, ?)", (self.namespace + key, json.dumps(value))
+        )
+
+    def close(self) -> None:
+        """Close the connection to the store."""
+        self.connection.close()
+
+
+class StateCache:
+    """Least recently used cache of results, optionally backed by a store on disk."""
+
+    def __init__(self, max_size: int = 4096, store: StateStore | None = None):
+        """Initialize the cache.
+
+        :param max_size: most results held in memory, the least recently used are evicted beyond this.
+        :param store: store to read results missing from memory from, and to write every new result to.
+        """
+        if max_size < 1:
+            raise ValueError(f"Cache size must be a positive integer. Input {max_size} is invalid.")
+
+        self.max_size = max_size
+        self.store = store
+        self.entries: OrderedDict[str, Any] = OrderedDict()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """Look up a result, marking it most recently used.
+
+        :param key: key of the result.
+        :return: the cached result, or None if neither memory nor the store holds it.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        value = None if self.store is None else self.store.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.store_hits += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a result, writing it to the store too when there is one.
+
+        :param key: key of the result.
+        :param value: the result, JSON encodable when there is a store, never None.
+        """
+        self._remember(key, value)
+
+        if self.store is not None:
+            self.store.put(key, value)
+
+    def stats(self) -> dict[str, int]:
+        """Count the lookups and evictions of the cache so far.
+
+        :return: number of entries in memory, hits, hits read from the store, misses and evictions.
+        """
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Hold a result in memory as the most recently used, evicting the least recently used beyond the bound.
+
+        :param key: key of the result.
+        :param value: the result.
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
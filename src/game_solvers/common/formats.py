@@ -0,0 +1,68 @@
+"""Module for writing solver results in machine-readable formats.
+
+Results are written straight to a text stream, without building any rich renderables, so output meant for another
+program costs no more than encoding it. Every format holds the same named lists of ranked words:
+
+* ``json`` - one JSON object holding the context of the results and each list as ``[word, score]`` pairs.
+* ``ndjson`` - one JSON object per ranked word, with the list it belongs to and its rank in that list.
+* ``tsv`` - a header row, then one tab-separated row per ranked word, in the same columns as ``ndjson``.
+
+``rich`` is the formatted report for people reading a terminal, written by the report module instead.
+"""
+
+import json
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Any, TextIO
+
+RICH = "rich"
+JSON = "json"
+NDJSON = "ndjson"
+TSV = "tsv"
+OUTPUT_FORMATS = (RICH, JSON, NDJSON, TSV)
+
+TSV_COLUMNS = ("list", "rank", "word", "score")
+
+
+def write_ranked_lists(
+    output_format: str,
+    ranked_lists: Mapping[str, Sequence[tuple[str, float]]],
+    context: dict[str, Any] | None = None,
+    file: TextIO | None = None,
+) -> None:
+    """Write named lists of ranked words in a machine-readable format.
+
+    :param output_format: one of ``json``, ``ndjson`` or ``tsv``.
+    :param ranked_lists: name of each list and its words and scores, best first.
+    :param context: fields describing the results as a whole, only written by ``json``.
+    :param file: stream to write to, defaults to stdout.
+    """
+    file = file or sys.stdout
+
+    if output_format == JSON:
+        document = {**(context or {}), **{name: [list(word) for word in words] for name, words in ranked_lists.items()}}
+        file.write(json.dumps(document) + "\n")
+    elif output_format == NDJSON:
+        file.writelines(
+            json.dumps(dict(zip(TSV_COLUMNS, row, strict=True))) + "\n" for row in _ranked_rows(ranked_lists)
+        )
+    elif output_format == TSV:
+        file.write("\t".join(TSV_COLUMNS) + "\n")
+        file.writelines("\t".join(str(value) for value in row) + "\n" for row in _ranked_rows(ranked_lists))
+    else:
+        raise ValueError(
+            f"Output format must be one of {', '.join(OUTPUT_FORMATS[1:])}. Input {output_format} is invalid."
+        )
+
+
+def _ranked_rows(ranked_lists: Mapping[str, Sequence[tuple[str, float]]]) -> list[tuple[str, int, str, float]]:
+    """Flatten named lists of ranked words into one row per word.
+
+    :param ranked_lists: name of each list and its words and scores, best first.
+    :return: list name, one-indexed rank, word and score of every ranked word.
+    """
+    return [
+        (name, rank, word, score)
+        for name, words in ranked_lists.items()
+        for rank, (word, score) in enumerate(words, start=1)
+    ]
@@ -0,0 +1,110 @@
+"""Module for profiling the stages of a solver.
+
+A `StageProfiler` records, for each named stage, the number of times it ran, the wall time it took and the peak
+memory it allocated, measured with `tracemalloc` from the start of each run. Stages can also each be profiled with
+`cProfile`, and their profiles dumped to a folder for inspection with `pstats` or `snakeviz`.
+
+Code being profiled wraps each stage in `profile_stage`, which does nothing more than return a shared empty context
+when no profiler is given, so instrumented code costs nothing measurable when profiling is off.
+"""
+
+import cProfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+_NO_PROFILE = nullcontext()
+
+
+class StageProfiler:
+    """Records the calls, wall time and peak memory of each stage it is given."""
+
+    def __init__(self, trace_memory: bool = True, cprofile_dir: Path | None = None):
+        """Initialize the profiler, starting to trace memory allocations if asked to.
+
+        :param trace_memory: measure the peak memory of each stage, which slows down allocations while profiling.
+        :param cprofile_dir: folder to dump a cProfile profile of each stage to, stages are not profiled with
+            cProfile when not given.
+        """
+        self.trace_memory = trace_memory
+        self.cprofile_dir = cprofile_dir
+        self.stages: dict[str, dict[str, Any]] = {}
+        self._profiles: dict[str, cProfile.Profile] = {}
+
+        # memory is only traced while a profiler started the tracing, so stop it again in `close`
+        self._started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Record one run of a stage.
+
+        Stages are not nested, as measuring the peak memory of one stage resets the peak of any enclosing it.
+
+        :param name: name of the stage.
+        """
+        record = self.stages.setdefault(name, {"stage": name, "calls": 0, "seconds": 0.0, "peak_bytes": 0})
+        profile = self._profiles.setdefault(name, cProfile.Profile()) if self.cprofile_dir else None
+
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        if profile is not None:
+            profile.enable()
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            record["seconds"] += time.perf_counter() - start
+            if profile is not None:
+                profile.disable()
+            if self.trace_memory:
+                peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+                record["peak_bytes"] = max(record["peak_bytes"], peak_bytes)
+            record["calls"] += 1
+
+    def report(self) -> list[dict[str, Any]]:
+        """Summarise every stage run so far, in the order each first ran.
+
+        :return: the name, number of calls, total wall time in seconds and largest peak memory in bytes of each
+            stage. Peak memory is 0 when not traced.
+        """
+        return [dict(record) for record in self.stages.values()]
+
+    def dump_profiles(self) -> list[Path]:
+        """Dump the cProfile profile of each stage, as ``<stage>.prof`` in the cProfile folder.
+
+        :return: paths of the dumped profiles.
+        """
+        if self.cprofile_dir is None:
+            return []
+
+        self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for name, profile in self._profiles.items():
+            path = self.cprofile_dir.joinpath(f"{name}.prof")
+            profile.dump_stats(path)
+            paths.append(path)
+
+        return paths
+
+    def close(self) -> None:
+        """Stop tracing memory allocations, if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+def profile_stage(profiler: StageProfiler | None, name: str) -> AbstractContextManager[None]:
+    """Record one run of a stage with the given profiler, if there is one.
+
+    :param profiler: profiler to record with, nothing is recorded when not given.
+    :param name: name of the stage.
+    :return: context to run the stage within.
+    """
+    return _NO_PROFILE if profiler is None else profiler.stage(name)
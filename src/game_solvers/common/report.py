@@ -1,8 +1,24 @@
 """Module to provide rich reporting for application."""
 
-from rich.console import Console, Group
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 
+RANKED_WORDS_DESCRIPTIONS = {
+    "entropy": [
+        " * Are any word in the dictionary, even if they do not fit the given criteria",
+        " * Scored the highest expected information, in bits, from their feedback against the possible answers",
+    ],
+    "minimax": [
+        " * Are any word in the dictionary, even if they do not fit the given criteria",
+        " * Scored the fewest possible answers left by their worst-case feedback",
+    ],
+    "tree": [
+        " * Are the next guess of the precomputed decision tree for the feedback given so far",
+        " * Scored the number of possible answers the tree still covers",
+        "Once a game leaves the tree, guesses are ranked by entropy instead",
+    ],
+}
+
 
 def report_wordle_solutions(
     greens: list[tuple[str, int]],
@@ -11,6 +27,9 @@ def report_wordle_solutions(
     scored_words: list[tuple[str, int]],
     non_repeating_words: list[tuple[str, int]],
     new_char_words: list[tuple[str, int]],
+    ranked_words: list[tuple[str, float]] | None = None,
+    strategy: str | None = None,
+    top: int = 10,
 ) -> None:
     """Report wordle solutions to user using rich reporting.
 
@@ -20,6 +39,9 @@ def report_wordle_solutions(
     :param scored_words:
     :param non_repeating_words:
     :param new_char_words:
+    :param ranked_words: guesses ranked by the given strategy, reported in their own panel when provided.
+    :param strategy: name of the strategy used to rank the ranked words.
+    :param top: number of words requested for each list, shown in the panel titles.
     :return:
     """
     console = Console()
@@ -53,7 +75,7 @@ def report_wordle_solutions(
             "",
             *[f"{word} - {score}" for word, score in scored_words],
         ),
-        title="[white]Top 10 Answers[/white]",
+        title=f"[white]Top {top} Answers[/white]",
         title_align="left",
         border_style="dodger_blue2",
     )
@@ -67,7 +89,7 @@ def report_wordle_solutions(
             "",
             *[f"{word} - {score}" for word, score in non_repeating_words],
         ),
-        title="[white]Top 10 [bold]Non-Repeating Letter[/bold] Answers[/white]",
+        title=f"[white]Top {top} [bold]Non-Repeating Letter[/bold] Answers[/white]",
         title_align="left",
         border_style="dodger_blue2",
     )
@@ -82,15 +104,94 @@ def report_wordle_solutions(
             "",
             *[f"{word} - {score}" for word, score in new_char_words],
         ),
-        title="[white]Top 10 [bold]New Letter[/bold] Answers[/white]",
+        title=f"[white]Top {top} [bold]New Letter[/bold] Answers[/white]",
         title_align="left",
         border_style="dodger_blue2",
     )
 
+    panels: list[RenderableType] = [
+        panel_green,
+        panel_yellow,
+        panel_grey,
+        "",
+        panel_answers,
+        "",
+        panel_non_repeated,
+        "",
+        panel_new_char,
+    ]
+
+    if ranked_words is not None and strategy is not None:
+        panel_ranked = Panel(
+            Group(
+                "Words that:",
+                *RANKED_WORDS_DESCRIPTIONS[strategy],
+                "",
+                "These words narrow down the possible answers fastest, use them when there are still many left",
+                "",
+                *[f"{word} - {score}" for word, score in ranked_words],
+            ),
+            title=f"[white]Top {top} [bold]{strategy.title()}[/bold] Guesses[/white]",
+            title_align="left",
+            border_style="dodger_blue2",
+        )
+        panels.extend(["", panel_ranked])
+
     panel_wordle = Panel(
-        Group(panel_green, panel_yellow, panel_grey, "", panel_answers, "", panel_non_repeated, "", panel_new_char),
+        Group(*panels),
         title="[blue]Wordle: Possible Solutions[/blue]",
         border_style="white",
     )
 
     console.print(panel_wordle)
+
+
+def report_wordle_simulation(
+    strategy: str,
+    opener: str,
+    games: int,
+    distribution: dict[int, int],
+    failure_rate: float,
+    mean_guesses: float,
+    games_per_second: float,
+) -> None:
+    """Report the outcome of a wordle simulation to user using rich reporting.
+
+    :param strategy: strategy used to choose each guess.
+    :param opener: first guess of every game.
+    :param games: number of games played.
+    :param distribution: number of games won in each number of guesses.
+    :param failure_rate: fraction of games taking more than six guesses.
+    :param mean_guesses: mean number of guesses taken to win a game.
+    :param games_per_second: games played per second of wall clock time.
+    """
+    console = Console()
+
+    widest = max(distribution.values(), default=0)
+    panel_distribution = Panel(
+        Group(
+            *[
+                f"{guesses:>2} - {'█' * max(1, round(40 * count / widest))} {count}"
+                for guesses, count in distribution.items()
+            ],
+        ),
+        title="[white]Guess Distribution[/white]",
+        title_align="left",
+        border_style="dodger_blue2",
+    )
+
+    panel_simulation = Panel(
+        Group(
+            f"Strategy: [bold]{strategy}[/bold], opening with [bold]{opener}[/bold]",
+            f"Games played: {games}",
+            f"Mean guesses: {mean_guesses:.4f}",
+            f"Failure rate (more than six guesses): {failure_rate:.2%}",
+            f"Games per second: {games_per_second:.1f}",
+            "",
+            panel_distribution,
+        ),
+        title="[blue]Wordle: Simulation[/blue]",
+        border_style="white",
+    )
+
+    console.print(panel_simulation)
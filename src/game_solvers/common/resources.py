@@ -1,6 +1,8 @@
 """Module to hold common methods for access to resources within the package."""
 
 import csv
+import mmap
+import os
 from pathlib import Path
 
 
@@ -9,6 +11,20 @@ def resources_path() -> Path:
     return Path(__file__).parent.parent.absolute().joinpath("resources")
 
 
+def cache_path() -> Path:
+    """Provide path to the folder holding generated caches, creating it if required.
+
+    Uses ``GAME_SOLVERS_CACHE_DIR`` when set, otherwise ``game_solvers`` within the user cache folder.
+    """
+    if cache_dir := os.environ.get("GAME_SOLVERS_CACHE_DIR"):
+        path = Path(cache_dir)
+    else:
+        path = Path(os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")).joinpath("game_solvers")
+
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def read_data_resource(resource_name: str) -> list[list[str]]:
     """Read the data resource from the resources folder using csv reader.
 
@@ -24,3 +40,19 @@ def read_data_resource(resource_name: str) -> list[list[str]]:
     with resource_path.open("r", encoding="UTF-8") as f_open:
         reader = csv.reader(f_open)
         return list(reader)
+
+
+def map_data_resource(resource_name: str) -> mmap.mmap:
+    """Memory-map the data resource from the resources folder as read-only.
+
+    :param resource_name: name of the resource in the data folder.
+
+    :return: read-only memory map of the resource, to be closed by the caller.
+    """
+    resource_path = resources_path().joinpath("data", resource_name)
+
+    if not resource_path.exists():
+        raise FileNotFoundError(f"Data resource '{resource_path}' not found.")
+
+    with resource_path.open("rb") as f_open:
+        return mmap.mmap(f_open.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,133 @@
+"""Module for the local solver server.
+
+The server answers newline-delimited JSON requests over a unix socket or a localhost TCP port. Every request line
+is answered by one response line, carrying the request's ``id`` and how long the request took::
+
+    {"id": 1, "ok": true, "latency_ms": 4.2, ...}
+    {"id": 2, "ok": false, "latency_ms": 0.1, "error": "..."}
+
+A request line longer than `LINE_LIMIT` bytes is answered with an error and the client disconnected, as the rest
+of its stream can no longer be split into requests.
+
+Requests are handled concurrently, from any number of clients and any number in flight per client, so responses
+may arrive in a different order to their requests. Answering a request is CPU-bound, so the handler runs in an
+executor, typically a process pool, and the event loop only reads, writes and waits.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any
+
+logger = logging.getLogger("SolverServer")
+
+LINE_LIMIT = 2**16
+
+RequestHandler = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class SolverServer:
+    """Asyncio server passing JSON requests to a handler running in an executor."""
+
+    def __init__(self, handler: RequestHandler, executor: Executor):
+        """Initialize the server.
+
+        :param handler: answers one decoded request with the fields of its response, raising ValueError for
+            an invalid request. Must be picklable to run in a process pool.
+        :param executor: executor to run the handler in.
+        """
+        self.handler = handler
+        self.executor = executor
+
+    async def respond(self, line: bytes) -> dict[str, Any]:
+        """Answer one request line.
+
+        :param line: JSON encoded request.
+        :return: response, including the request id and the time taken to answer it.
+        """
+        start = time.perf_counter()
+        request_id = None
+
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                text = line.decode(errors="replace").strip()
+                raise ValueError(f"Requests must be JSON objects. Input {text} is invalid.")
+
+            request_id = request.pop("id", None)
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, self.handler, request)
+            response = {"id": request_id, "ok": True, **result}
+        except ValueError as err:
+            response = {"id": request_id, "ok": False, "error": str(err)}
+        except Exception:
+            logger.exception("Request %s failed", request_id)
+            response = {"id": request_id, "ok": False, "error": "Internal error, see the server log for details."}
+
+        latency = (time.perf_counter() - start) * 1000
+        response["latency_ms"] = round(latency, 3)
+        logger.info("Request %s answered in %.1fms", request_id, latency)
+
+        return response
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer every request from one client connection until it disconnects.
+
+        :param reader: stream of request lines from the client.
+        :param writer: stream of response lines to the client.
+        """
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def answer(line: bytes) -> None:
+            response = await self.respond(line)
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+        error = None
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    task = asyncio.create_task(answer(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        except ValueError:
+            logger.warning("Request line over %s bytes, disconnecting client", LINE_LIMIT)
+            error = {"id": None, "ok": False, "error": f"Request lines must be at most {LINE_LIMIT} bytes."}
+
+        await asyncio.gather(*tasks)
+        if error is not None:
+            writer.write(json.dumps(error).encode() + b"\n")
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    async def start(self, socket_path: str | None = None, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """Start listening for clients.
+
+        :param socket_path: path of a unix socket to listen on, a TCP port is used instead when not given.
+        :param host: host to listen on for TCP clients.
+        :param port: port to listen on for TCP clients, ``0`` picks a free port.
+        :return: the listening server.
+        """
+        if socket_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=socket_path, limit=LINE_LIMIT)
+        else:
+            server = await asyncio.start_server(self.handle_client, host=host, port=port, limit=LINE_LIMIT)
+
+        for sock in server.sockets:
+            logger.info("Listening on %s", sock.getsockname())
+
+        return server
+
+    async def serve(self, socket_path: str | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Listen for clients and answer their requests until cancelled.
+
+        :param socket_path: path of a unix socket to listen on, a TCP port is used instead when not given.
+        :param host: host to listen on for TCP clients.
+        :param port: port to listen on for TCP clients, ``0`` picks a free port.
+        """
+        server = await self.start(socket_path, host, port)
+        async with server:
+            await server.serve_forever()
@@ -0,0 +1,122 @@
+"""Module to compile and load word lists in a compact, fixed-width binary format.
+
+The csv word lists in the resources folder remain the source of truth. Compiling them produces a
+binary artifact that can be memory-mapped and split into words without any csv parsing or per-word
+case conversion.
+
+Layout of a compiled word list::
+
+    magic (4 bytes) | version (uint16) | word length (uint16) | word count (uint32) | source digest (8 bytes) |
+    packed words
+
+The source digest hashes the bytes of the csv the word list was compiled from, so a compiled word list left stale by
+an edit to its csv is detected when read rather than silently serving the old words.
+
+Packed words are upper case ASCII records of ``word length + 1`` bytes, each terminated by a newline. Records are
+fixed-width so any word can be addressed directly by offset, and the terminator allows the whole body to be split
+into words with a single call rather than a slice per word.
+"""
+
+import hashlib
+import mmap
+import struct
+from collections.abc import Sequence
+from pathlib import Path
+
+from .resources import map_data_resource, read_data_resource, resources_path
+
+WORD_LIST_MAGIC = b"GSWL"
+WORD_LIST_VERSION = 2
+WORD_LIST_HEADER = struct.Struct("<4sHHI8s")
+NO_SOURCE_DIGEST = bytes(8)
+
+
+def words_digest(words: Sequence[str]) -> str:
+    """Hash the given words, to key caches generated from a word list.
+
+    :param words: list of words, order is significant.
+    :return: short hex digest of the word list.
+    """
+    return hashlib.sha256("\n".join(words).encode("ascii")).hexdigest()[:16]
+
+
+def source_digest(source: bytes) -> bytes:
+    """Hash the bytes of the csv source of a compiled word list, to detect a stale compiled word list.
+
+    :param source: bytes of the csv source.
+    :return: 8 byte digest of the source.
+    """
+    return hashlib.sha256(source).digest()[:8]
+
+
+def pack_word_list(words: list[str], source: bytes = NO_SOURCE_DIGEST) -> bytes:
+    """Pack the given words into the compiled binary word list format.
+
+    :param words: list of words, all of equal length.
+    :param source: digest of the csv source the words were read from.
+    :return: bytes of the compiled word list, header included.
+    """
+    word_length = len(words[0]) if words else 0
+
+    if any(len(word) != word_length for word in words):
+        raise ValueError("All words in a compiled word list must be the same length.")
+
+    header = WORD_LIST_HEADER.pack(WORD_LIST_MAGIC, WORD_LIST_VERSION, word_length, len(words), source)
+    return header + "".join(f"{word}\n" for word in words).upper().encode("ascii")
+
+
+def unpack_word_list(data: bytes | mmap.mmap, source: bytes | None = None) -> list[str]:
+    """Unpack words from bytes in the compiled binary word list format.
+
+    :param data: bytes of the compiled word list, header included.
+    :param source: digest of the csv source the words must have been compiled from, or None to not check.
+    :return: list of upper case words.
+    """
+    magic, version, word_length, count, compiled_source = WORD_LIST_HEADER.unpack_from(data)
+
+    if magic != WORD_LIST_MAGIC or version != WORD_LIST_VERSION:
+        raise ValueError(f"Unsupported word list format (magic={magic!r}, version={version}).")
+
+    if source is not None and compiled_source != source:
+        raise ValueError("Compiled word list is stale, its csv source has changed since it was compiled.")
+
+    body_end = WORD_LIST_HEADER.size + (word_length + 1) * count
+    if len(data) < body_end:
+        raise ValueError("Compiled word list is truncated.")
+
+    return data[WORD_LIST_HEADER.size : body_end].decode("ascii").splitlines()
+
+
+def compile_word_list(source_name: str, target_name: str) -> Path:
+    """Compile a csv word list resource into a binary word list resource.
+
+    :param source_name: name of the csv resource in the data folder, all words on a single line.
+    :param target_name: name of the binary resource to write in the data folder.
+    :return: path of the compiled binary resource.
+    """
+    words = read_data_resource(source_name)[0]
+    source = source_digest(resources_path().joinpath("data", source_name).read_bytes())
+    target_path = resources_path().joinpath("data", target_name)
+    target_path.write_bytes(pack_word_list(words, source))
+
+    return target_path
+
+
+def read_word_list_resource(resource_name: str, source_name: str | None = None) -> list[str]:
+    """Read a compiled binary word list resource from the resources folder.
+
+    Raises ValueError when the csv source has changed since the word list was compiled, see `compile_word_list`.
+
+    :param resource_name: name of the compiled resource in the data folder.
+    :param source_name: name of the csv resource in the data folder it was compiled from. Defaults to the compiled
+        resource's name with a ``.txt`` extension.
+    :return: list of upper case words.
+    """
+    source_path = resources_path().joinpath("data", source_name or Path(resource_name).with_suffix(".txt").name)
+
+    with map_data_resource(resource_name) as mapped:
+        return unpack_word_list(mapped, source_digest(source_path.read_bytes()))
+
+
+if __name__ == "__main__":
+    compile_word_list("words_alpha_five_letters.txt", "words_alpha_five_letters.bin")
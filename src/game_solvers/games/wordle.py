@@ -1,94 +1,579 @@
 """Module for WordleSolver game solver functionality."""
 
+import heapq
 import logging
-
-from ..common.report import report_wordle_solutions
-from ..common.resources import read_data_resource
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import compress
+from operator import itemgetter
+
+from ..common.formats import RICH, write_ranked_lists
+from ..common.profiling import StageProfiler, profile_stage
+from .wordle_constraints import ConstraintPlan, WordLanes, WordleConstraints, word_mask
+from .wordle_dictionary import WordleDictionary, calculate_distribution, load_dictionary, read_words
+from .wordle_index import WordIndex
+from .wordle_openings import OpeningBook
+from .wordle_patterns import GREEN, YELLOW, PatternRows, parse_pattern, pattern_states
+from .wordle_ranking import ENTROPY, RANKING_STRATEGIES, GuessRanker
+from .wordle_scores import letter_score
+from .wordle_tree import DecisionTree
 
 logger = logging.getLogger("WordleSolver")
 
+SCORE = "score"
+TREE = "tree"
+STRATEGIES = (SCORE, *RANKING_STRATEGIES, TREE)
+
+# greens, yellows, greys and feedback history of a solver, as compared with what a cached value was derived from
+LettersState = tuple[list[tuple[str, int]], list[tuple[str, list[int]]], list[str], list[tuple[str, int]]]
+
 
 class WordleSolver:
     """WordleSolver class."""
 
+    # queries with known letters are answered from the inverted index when the smallest posting list they start from
+    # holds at most this share of a dictionary at least this large, as the index query cost follows that posting
+    # list while a pass over the word bitsets follows the dictionary size. measured on the bundled dictionary, the
+    # index is faster up to about a sixth of it, and neither takes more than a few hundredths of a millisecond on
+    # dictionaries below a few thousand words
+    index_min_words: int = 2_000
+    index_max_share: float = 0.125
+
+    # worker processes to split large entropy and minimax rankings over, set before the first ranking
+    ranking_workers: int = 1
+
     def __init__(
         self,
         greens: list[tuple[str, int]],
         yellows: list[tuple[str, list[int]]],
         greys: list[str],
+        dictionary: WordleDictionary | None = None,
+        profiler: StageProfiler | None = None,
     ):
-        """Initialize the WordleSolver game solver class."""
-        self.greens: list[tuple[str, int]] = greens
-        self.yellows: list[tuple[str, list[int]]] = yellows
-        self.greys: list[str] = greys
-        self.dictionary = self.prep_words()
-        self.distribution = self.calculate_distribution(self.dictionary)
+        """Initialize the WordleSolver game solver class.
+
+        :param greens: letters and their known one-indexed positions.
+        :param yellows: letters and the one-indexed positions they are known not to be in.
+        :param greys: letters known not to be in the word, or to have no more copies than are green or yellow.
+        :param dictionary: dictionary to solve with, defaults to the bundled dictionary shared by every solver in
+            the process.
+        :param profiler: profiler to record the time and memory of each stage of solving with, from loading the
+            dictionary to rendering the solutions. Nothing is recorded when not given.
+        """
+        self.greens: list[tuple[str, int]] = list(greens)
+        self.yellows: list[tuple[str, list[int]]] = list(yellows)
+        self.greys: list[str] = list(greys)
+        self.profiler = profiler
+
+        # plan the dictionary was last checked against while profiling, kept for the report
+        self.filter_plan: ConstraintPlan | None = None
+
+        with profile_stage(profiler, "load"):
+            self.word_list = dictionary or load_dictionary()
+        with profile_stage(profiler, "distribution"):
+            self.distribution = self.word_list.distribution
+
+    @property
+    def word_list(self) -> WordleDictionary:
+        """Shared dictionary the solver uses, along with the indexes built from it."""
+        return self._word_list
+
+    @word_list.setter
+    def word_list(self, dictionary: WordleDictionary) -> None:
+        self._word_list = dictionary
+        self._guess_ranker: GuessRanker | None = None
+        self._candidates: list[str] | None = None
+        self._candidates_state: LettersState | None = None
+        self._candidate_distribution: dict[str, int] | None = None
+        self._word_scores: Mapping[str, int] | None = None
+        self._decision_tree: DecisionTree | None = None
+        self._constraint_plan: tuple[LettersState, ConstraintPlan] | None = None
+        self.history: list[tuple[str, int]] = []
+
+    @property
+    def dictionary(self) -> Sequence[str]:
+        """Words available to the solver."""
+        return self._word_list.words
+
+    @dictionary.setter
+    def dictionary(self, words: Sequence[str]) -> None:
+        self.word_list = WordleDictionary(words)
+
+    @property
+    def distribution(self) -> dict[str, int]:
+        """Distribution of letters that words are scored by."""
+        return self._distribution
+
+    @distribution.setter
+    def distribution(self, distribution: dict[str, int]) -> None:
+        self._distribution = distribution
+        self._word_scores = None
+
+    @property
+    def candidates(self) -> list[str]:
+        """Words still possible answers, narrowed turn by turn as feedback is applied.
+
+        Starts as the words valid for the letter information the solver was created with, and is filtered from
+        the dictionary again if the greens, yellows, greys or history are changed other than by the solver.
+        """
+        candidates = self._fresh_candidates()
+        if candidates is None:
+            candidates = self._candidates = self.valid_words()
+            self._candidates_state = self._copy_letters_state()
+            self._candidate_distribution = None
+
+        return candidates
+
+    @property
+    def candidate_distribution(self) -> dict[str, int]:
+        """Distribution of letters over the current candidates, recalculated only when they change."""
+        if self._candidate_distribution is None:
+            self._candidate_distribution = self.calculate_distribution(self.candidates)
+
+        return self._candidate_distribution
+
+    @property
+    def word_scores(self) -> Mapping[str, int]:
+        """Score of every word in the dictionary by the distribution, calculated together once when first needed.
+
+        Scores by the dictionary's own distribution are shared with every solver using the dictionary.
+        """
+        if self._word_scores is None:
+            if self.distribution == self._word_list.distribution_view:
+                self._word_scores = self._word_list.word_scores
+            else:
+                scores = self._word_list.letter_counts.scores(self.distribution)
+                self._word_scores = dict(zip(self.dictionary, scores, strict=True))
+
+        return self._word_scores
+
+    @property
+    def decision_tree(self) -> DecisionTree:
+        """Precomputed decision tree over the dictionary, the dictionary's own unless set."""
+        if self._decision_tree is None:
+            self._decision_tree = self._word_list.decision_tree
+
+        return self._decision_tree
+
+    @decision_tree.setter
+    def decision_tree(self, decision_tree: DecisionTree) -> None:
+        self._decision_tree = decision_tree
+
+    def opening_book(self, strategy: str) -> OpeningBook | None:
+        """Provide the opening book of a ranking strategy over the dictionary, loaded once when first needed.
+
+        Books are compiled offline for the bundled dictionary only, other dictionaries rank their opening turns live.
+
+        :param strategy: ranking strategy, ``entropy`` or ``minimax``.
+        :return: the opening book, or None if no book was compiled for the dictionary.
+        """
+        return self._word_list.opening_book(strategy)
+
+    @property
+    def word_lanes(self) -> WordLanes:
+        """Letter and position bitsets of the words in the dictionary, built once when first needed."""
+        return self._word_list.word_lanes
+
+    @property
+    def word_index(self) -> WordIndex:
+        """Inverted letter and position index of the words in the dictionary, built once when first needed."""
+        return self._word_list.word_index
+
+    @property
+    def pattern_rows(self) -> PatternRows:
+        """Feedback pattern calculator over every word in the dictionary, built once when first needed."""
+        return self._word_list.pattern_rows
+
+    @property
+    def guess_ranker(self) -> GuessRanker:
+        """Guess ranker over the dictionary, built once when first needed.
+
+        The dictionary's pattern matrix is mapped from the cache, and built there first if not yet cached. Large
+        rankings are split over ``ranking_workers`` processes, otherwise the dictionary's own ranker is shared.
+        """
+        if self._guess_ranker is None:
+            if self.ranking_workers == 1:
+                self._guess_ranker = self._word_list.guess_ranker
+            else:
+                self._guess_ranker = GuessRanker(
+                    self.dictionary, self._word_list.pattern_matrix, workers=self.ranking_workers
+                )
+
+        return self._guess_ranker
 
     @staticmethod
     def prep_words() -> list[str]:
         """Load wordle game words from resources. Set all to capitals.
 
+        The compiled binary word list is preferred, falling back to parsing the csv source of truth if the
+        compiled word list has not been built.
+
         :return: list of five-letter words, all in upper case.
         """
-        return [word.upper() for word in read_data_resource("words_alpha_five_letters.txt")[0]]
+        return read_words()
 
     @staticmethod
-    def calculate_distribution(words: list[str]) -> dict[str, int]:
+    def calculate_distribution(words: Sequence[str]) -> dict[str, int]:
         """Calculate distribution of letters for the given words.
 
         :return: dictionary containing all letters and their occurrence count in given words
         """
-        distribution = {letter: 0 for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
-        for word in words:
-            for letter in word:
-                distribution[letter] += 1
+        return calculate_distribution(words)
+
+    def solutions(self, strategy: str = SCORE, top: int = 10, output_format: str = RICH) -> None:
+        """Attempt to solve wordle game.
+
+        :param strategy: ``score`` to report the letter distribution scores only, ``entropy`` to also rank every
+            word in the dictionary by the expected information its feedback gives, ``minimax`` to also rank
+            every word by the most possible answers its feedback could leave, or ``tree`` to also report the next
+            guess of the decision tree.
+        :param top: number of words to report in each list.
+        :param output_format: ``rich`` to report to a terminal, or ``json``, ``ndjson`` or ``tsv`` to write the
+            lists for another program to read.
+        """
+        # each stage is recorded by the profiler, if there is one, scoring every word by the distribution first
+        # so that its cost is not counted as scoring the candidates
+        with profile_stage(self.profiler, "filter"):
+            candidates = self.candidates
+        if self.profiler is not None:
+            # counted apart from the filter, as solving never checks words one check at a time
+            with profile_stage(self.profiler, "constraint-plan"):
+                self.filter_plan = self.constraint_plan
+                self.filter_plan.select(self.word_lanes)
+        with profile_stage(self.profiler, "word-scores"):
+            self.word_scores  # noqa: B018
+
+        # candidates are scored once, both top lists are selected from the same scores
+        with profile_stage(self.profiler, "score"):
+            scored_words = list(self._iter_scored_words(candidates))
+        with profile_stage(self.profiler, "sort"):
+            top_scored_words = self.top_scored(scored_words, top)
+        with profile_stage(self.profiler, "non-repeating"):
+            non_repeating_words = self.top_scored(self._generate_non_repeating_words(scored_words), top)
+        with profile_stage(self.profiler, "new-char"):
+            new_char_words = self._generate_new_char_words(self.dictionary, top)
+        with profile_stage(self.profiler, "rank"):
+            ranked_words = None if strategy == SCORE else self.suggestions(strategy, top)
+
+        with profile_stage(self.profiler, "render"):
+            self._write_solutions(
+                strategy, top, output_format, top_scored_words, non_repeating_words, new_char_words, ranked_words
+            )
+
+    def _write_solutions(
+        self,
+        strategy: str,
+        top: int,
+        output_format: str,
+        top_scored_words: list[tuple[str, int]],
+        non_repeating_words: list[tuple[str, int]],
+        new_char_words: list[tuple[str, int]],
+        ranked_words: list[tuple[str, float]] | None,
+    ) -> None:
+        """Write the solutions to a game, as a report or for another program to read.
+
+        :param strategy: strategy the guesses were ranked by.
+        :param top: number of words in each list.
+        :param output_format: ``rich`` to report to a terminal, or ``json``, ``ndjson`` or ``tsv`` to write the
+            lists for another program to read.
+        :param top_scored_words: highest scoring possible answers.
+        :param non_repeating_words: highest scoring possible answers without repeated letters.
+        :param new_char_words: highest scoring words of letters not yet tried.
+        :param ranked_words: best guesses by the strategy, None for the ``score`` strategy.
+        """
+        if output_format != RICH:
+            ranked_lists: dict[str, list[tuple[str, int]] | list[tuple[str, float]]] = {
+                "answers": top_scored_words,
+                "non_repeating_answers": non_repeating_words,
+                "new_letter_answers": new_char_words,
+            }
+            if ranked_words is not None:
+                ranked_lists[f"{strategy}_guesses"] = ranked_words
+
+            context = {"greens": self.greens, "yellows": self.yellows, "greys": self.greys, "strategy": strategy}
+            write_ranked_lists(output_format, ranked_lists, context)
+            return
+
+        # rich is only loaded once there is something to render
+        from ..common.report import report_wordle_solutions
+
+        if ranked_words is None:
+            report_wordle_solutions(
+                self.greens, self.yellows, self.greys, top_scored_words, non_repeating_words, new_char_words, top=top
+            )
+            return
 
-        return distribution
+        report_wordle_solutions(
+            self.greens,
+            self.yellows,
+            self.greys,
+            top_scored_words,
+            non_repeating_words,
+            new_char_words,
+            ranked_words=ranked_words,
+            strategy=strategy,
+            top=top,
+        )
 
-    def solutions(self) -> None:
-        """Attempt to solve wordle game."""
-        valid_words = [word for word in self.dictionary if self.valid_word(word)]
+    def suggestions(self, strategy: str = SCORE, top: int | None = None) -> list[tuple[str, float]]:
+        """Rank guesses for the current candidates, best first.
 
-        scored_words = self._generate_scored_words(valid_words)
-        non_repeating_words = self._generate_non_repeating_words(scored_words)
-        new_char_words = self._generate_new_char_words(self.dictionary)
+        :param strategy: ``score`` ranks the candidates by letter distribution score, ``entropy`` and ``minimax``
+            rank every word in the dictionary by how its feedback would split the candidates, ``tree`` looks up
+            the next guess of the decision tree.
+        :param top: number of best guesses to return, every guess is ranked when not given.
+        :return: ordered list of tuples containing guesses and their scores.
+        """
+        if strategy == SCORE:
+            return [(word, score) for word, score in self._generate_scored_words(self.candidates, top)]
 
-        report_wordle_solutions(
-            self.greens, self.yellows, self.greys, scored_words[:10], non_repeating_words[:10], new_char_words[:10]
-        )
+        if strategy == TREE:
+            return self._tree_suggestions(top)
 
-    def valid_word(self, word: str) -> bool:
-        """Check given word against the known letter information.
+        # the first two turns rank against the most candidates, so are answered from the opening book when it
+        # holds the state
+        book = self.opening_book(strategy) if len(self.history) < 2 else None
+        if book is not None:
+            ranked = book.lookup(self.history, len(self.candidates), len(self.dictionary), top)
+            if ranked is not None:
+                return ranked
 
-        :param word: the word to check
-        :return: True if word is valid, False otherwise
+        return self.guess_ranker.rank(strategy, self.dictionary, self.candidates, top)
+
+    def _tree_suggestions(self, top: int | None = None) -> list[tuple[str, float]]:
+        """Look up the next guess of the decision tree, scored by the number of answers it still covers.
+
+        The tree only knows games that made its own guesses, so once a guess leaves the tree, or letters were
+        given that the feedback did not, guesses are ranked by entropy instead.
+
+        :param top: number of best guesses to return when ranking by entropy.
+        :return: the tree's next guess, or guesses ranked by entropy.
         """
-        # rule out any words that do not have the green letters in the known position
-        # note index access is zero-index and user input is one-index, hence the `-1`
-        if not all(word[pos - 1] == green for green, pos in self.greens):
-            return False
+        tree = self.decision_tree
+        node = tree.follow(self.history)
 
-        # rule out any words that don't have the required yellow letters in possible correct positions
-        # note index access is zero-index and user input is one-index, hence the `-1`
-        for yellow, incorrect_positions in self.yellows:
-            # rule out any word with a yellow letter in a known incorrect position
-            if any(word[pos - 1] == yellow for pos in incorrect_positions):
-                return False
+        # the tree covers exactly the candidates left by its own feedback, fewer means more letters were given
+        if node is not None and tree.answers[node] == len(self.candidates):
+            return [(tree.guess(node), tree.answers[node])] if top != 0 else []
 
-            # rule out any word without the yellow letter in one of the possible positions
-            # must also account for already green instances of the same letter
-            green_already = [green_pos for green_letter, green_pos in self.greens if green_letter == yellow]
-            not_allowed_positions = green_already + incorrect_positions
+        logger.info("Game has left the decision tree, ranking guesses by entropy.")
+        return self.guess_ranker.rank(ENTROPY, self.dictionary, self.candidates, top)
 
-            possible_positions = [pos for pos in [0, 1, 2, 3, 4] if pos + 1 not in not_allowed_positions]
-            if not any(word[pos] == yellow for pos in possible_positions):
-                return False
+    def apply_feedback(self, guess: str, pattern: str | int) -> list[str]:
+        """Narrow the candidates down to those giving the same feedback as the answer did for a guess.
 
-        # rule out any words containing a known letter to not be in the word
-        if any(grey in word for grey in self.greys):
-            return False
+        Only the candidates left from the previous turn are checked, so each turn costs the number of words still
+        possible rather than the size of the dictionary. The green, yellow and grey letter information is updated
+        from the feedback too.
 
-        return True
+        :param guess: five-letter guess made.
+        :param pattern: feedback received, as text e.g. ``gy..g`` or as an encoded pattern.
+        :return: the remaining candidates, in dictionary order.
+        """
+        guess = guess.upper()
+        if len(guess) != 5 or any(letter not in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" for letter in guess):
+            raise ValueError(f"Guesses must be five letters. Input {guess} is invalid.")
+
+        if isinstance(pattern, str):
+            pattern = parse_pattern(pattern)
+
+        with profile_stage(self.profiler, "filter"):
+            candidates = self.candidates
+            if candidates:
+                # the first turn usually starts from the whole dictionary, whose pattern calculator is kept warm.
+                # candidates are always in dictionary order, so the same length means the same words
+                same_words = len(candidates) == len(self.dictionary)
+                pattern_rows = self.pattern_rows if same_words else PatternRows(candidates)
+
+                # bytes.translate keeps a 1 for every candidate that received the same pattern
+                keep = bytes(1 if byte == pattern else 0 for byte in range(256))
+                candidates = list(compress(candidates, pattern_rows.row(guess).translate(keep)))
+
+        self._candidates = candidates
+        self._candidate_distribution = None
+        self.history.append((guess, pattern))
+        self._record_letters(guess, pattern_states(pattern))
+        self._candidates_state = self._copy_letters_state()
+
+        return candidates
+
+    def add_letters(
+        self,
+        greens: list[tuple[str, int]],
+        yellows: list[tuple[str, list[int]]],
+        greys: list[str],
+    ) -> list[str]:
+        """Add letter information to what is already known and narrow the current candidates to match.
+
+        :param greens: letters and their known one-indexed positions.
+        :param yellows: letters and the one-indexed positions they are known not to be in.
+        :param greys: letters known not to be in the word, or to have no more copies than are green or yellow.
+        :return: the remaining candidates, in dictionary order.
+        """
+        candidates = self._fresh_candidates()
+
+        self.greens.extend(green for green in greens if green not in self.greens)
+        for yellow, incorrect_positions in yellows:
+            self._add_yellow(yellow, incorrect_positions)
+        self.greys.extend(grey for grey in greys if grey not in self.greys)
+
+        # before any candidates are known they are filtered from the dictionary's own bitsets as usual
+        if candidates is not None:
+            constraints = WordleConstraints(self.greens, self.yellows, self.greys, self.history)
+            self._candidates = constraints.filter(WordLanes(candidates))
+            self._candidates_state = self._copy_letters_state()
+            self._candidate_distribution = None
+
+        return self.candidates
+
+    def reset(self) -> None:
+        """Forget all letter information and feedback to start a new game, keeping the dictionary and its caches."""
+        self.greens = []
+        self.yellows = []
+        self.greys = []
+        self.history = []
+        self._candidates = None
+        self._candidate_distribution = None
+
+    def _letters_state(self) -> LettersState:
+        """Gather the current letter information and feedback, to check cached values against."""
+        return self.greens, self.yellows, self.greys, self.history
+
+    def _copy_letters_state(self) -> LettersState:
+        """Copy the current letter information and feedback, for a cached value to be checked against later.
+
+        :return: copies of the greens, yellows, greys and history, so later changes to the lists are seen.
+        """
+        yellows = [(yellow, list(positions)) for yellow, positions in self.yellows]
+        return list(self.greens), yellows, list(self.greys), list(self.history)
+
+    def _fresh_candidates(self) -> list[str] | None:
+        """Candidates kept from the last filter, if the letter information has not changed since.
+
+        :return: the kept candidates, or None if there are none or they were filtered for other letter information.
+        """
+        if self._candidates is None or self._candidates_state != self._letters_state():
+            return None
+
+        return self._candidates
+
+    def close(self) -> None:
+        """Shut down the ranking worker processes, if the solver started any.
+
+        Only a ranker the solver built for ``ranking_workers`` has processes of its own, the dictionary's shared
+        ranker ranks in this process and is left for other solvers.
+        """
+        if self._guess_ranker is not None and self._guess_ranker.workers > 1:
+            self._guess_ranker.close()
+
+    def _record_letters(self, guess: str, states: list[int]) -> None:
+        """Add the letter information from the feedback on a guess to the known greens, yellows and greys.
+
+        Feedback must already be in the history, as yellows are checked against every guess made.
+
+        :param guess: five-letter upper case guess.
+        :param states: GREY, YELLOW or GREEN for each position of the guess.
+        """
+        found = {letter for letter, state in zip(guess, states, strict=True) if state in (GREEN, YELLOW)}
+
+        for pos, (letter, state) in enumerate(zip(guess, states, strict=True), start=1):
+            if state == GREEN:
+                if (letter, pos) not in self.greens:
+                    self.greens.append((letter, pos))
+            elif state == YELLOW:
+                self._add_yellow(letter, [pos])
+            # a grey repeat of a green or yellow letter only limits how many there are, the letter is still present
+            elif letter not in found and letter not in self.greys:
+                known = {green for green, _ in self.greens} | {yellow for yellow, _ in self.yellows}
+                if letter not in known:
+                    self.greys.append(letter)
+
+        self._drop_yellows_matched_by_greens()
+
+    def _add_yellow(self, yellow: str, incorrect_positions: list[int]) -> None:
+        """Add known incorrect positions of a yellow letter, merging them with any already known.
+
+        :param yellow: the yellow letter.
+        :param incorrect_positions: one-indexed positions the letter is known not to be in.
+        """
+        for index, (known, known_positions) in enumerate(self.yellows):
+            if known == yellow:
+                new_positions = [pos for pos in incorrect_positions if pos not in known_positions]
+                self.yellows[index] = (yellow, [*known_positions, *new_positions])
+                return
+
+        self.yellows.append((yellow, list(incorrect_positions)))
+
+    def _drop_yellows_matched_by_greens(self) -> None:
+        """Drop the yellows whose letter could be accounted for entirely by its greens.
+
+        A yellow letter that is also green is read as a further copy of the letter, so only yellows that some guess
+        has shown more copies of than there are known greens are kept. Yellows the solver was created with are
+        kept as given.
+        """
+        least_counts: dict[str, int] = {}
+        for previous_guess, previous_pattern in self.history:
+            previous_states = pattern_states(previous_pattern)
+            for letter in set(previous_guess):
+                count = sum(
+                    1
+                    for guess_letter, state in zip(previous_guess, previous_states, strict=True)
+                    if guess_letter == letter and state in (GREEN, YELLOW)
+                )
+                least_counts[letter] = max(least_counts.get(letter, 0), count)
+
+        self.yellows = [
+            (yellow, positions)
+            for yellow, positions in self.yellows
+            if yellow not in least_counts
+            or least_counts[yellow] > sum(1 for green, _ in self.greens if green == yellow)
+        ]
+
+    def valid_words(self) -> list[str]:
+        """Filter the dictionary down to the words valid for the known letter information.
+
+        Letter information is compiled into bitmasks once and checked against every word in a single pass over
+        the precomputed dictionary bitsets, giving the same result as checking every word with `valid_word`.
+        When known green or yellow letters narrow the dictionary enough, they are answered from the inverted index
+        instead.
+
+        :return: valid words, in dictionary order.
+        """
+        constraints = WordleConstraints(self.greens, self.yellows, self.greys, self.history)
+
+        size = len(self.dictionary)
+        if (
+            (self.greens or self.yellows)
+            and size >= self.index_min_words
+            and self.word_index.driver_size(constraints) <= size * self.index_max_share
+        ):
+            return self.word_index.filter(constraints)
+
+        return constraints.filter(self.word_lanes)
+
+    @property
+    def constraint_plan(self) -> ConstraintPlan:
+        """Checks of the known letter information, ordered by how few words of the dictionary each lets through.
+
+        The plan is kept until the greens, yellows, greys or history change, however they are changed, so its
+        counts of the words each check eliminated add up over every word checked with `valid_word`.
+        """
+        cached = self._constraint_plan
+        if cached is None or cached[0] != self._letters_state():
+            constraints = WordleConstraints(self.greens, self.yellows, self.greys, self.history)
+            cached = self._copy_letters_state(), ConstraintPlan(constraints, self._word_list.letter_frequencies)
+            self._constraint_plan = cached
+
+        return cached[1]
+
+    def valid_word(self, word: str) -> bool:
+        """Check given word against the known letter information.
+
+        Checks are made most selective first, see `constraint_plan`, and stop at the first the word fails.
+
+        :param word: the word to check
+        :return: True if word is valid, False otherwise
+        """
+        return self.constraint_plan.matches(word_mask(word))
 
     @staticmethod
     def score_word(word: str, distribution: dict[str, int]) -> int:
@@ -104,54 +589,71 @@ class WordleSolver:
         score: int = 0
 
         for letter in word:
-            base_score = distribution.get(letter, 0)
             seen_count = seen.get(letter, 0)
-
-            score += {
-                0: base_score,
-                1: int(round(base_score * 0.5, 0)),
-                2: int(round(base_score * 0.25, 0)),
-                3: int(round(base_score * 0.125, 0)),
-                4: int(round(base_score * 0.0675, 0)),
-            }[seen_count]
-
+            score += letter_score(distribution.get(letter, 0), seen_count)
             seen[letter] = seen_count + 1
 
         return score
 
-    def _generate_scored_words(self, words: list[str]) -> list[tuple[str, int]]:
+    def _iter_scored_words(self, words: Iterable[str]) -> Iterator[tuple[str, int]]:
+        """Score words lazily based on the base scoring distribution.
+
+        Words in the dictionary take their cached score, any other word is scored as it is reached.
+
+        :param words: words to score.
+        :return: iterator of tuples containing words and their scores, in the order given.
+        """
+        word_scores = self.word_scores
+        for word in words:
+            score = word_scores.get(word)
+            yield word, self.score_word(word, self.distribution) if score is None else score
+
+    @staticmethod
+    def top_scored(scored_words: Iterable[tuple[str, int]], top: int | None = None) -> list[tuple[str, int]]:
+        """Select the highest scoring words, keeping words with the same score in the order given.
+
+        Only the best ``top`` words are ever held and ordered, rather than sorting every scored word.
+
+        :param scored_words: tuples containing words and their scores.
+        :param top: number of words to select, every word is ordered when not given.
+        :return: ordered list of tuples containing the highest scoring words and their scores.
+        """
+        if top is None:
+            return sorted(scored_words, key=itemgetter(1), reverse=True)
+
+        return heapq.nlargest(top, scored_words, key=itemgetter(1))
+
+    def _generate_scored_words(self, words: Iterable[str], top: int | None = None) -> list[tuple[str, int]]:
         """Generate an ordered list of valid words and their scores based on the base scoring distribution.
 
         :param words: List of valid words for the solution that require scoring.
+        :param top: number of words to keep, every word is kept when not given.
         :return: ordered list of tuples containing valid words and their scores.
         """
-        scored_words = [(word, self.score_word(word, self.distribution)) for word in words]
-
-        return sorted(scored_words, key=lambda word_tuple: word_tuple[1], reverse=True)
+        return self.top_scored(self._iter_scored_words(words), top)
 
     @staticmethod
-    def _generate_non_repeating_words(scored_words: list[tuple[str, int]]) -> list[tuple[str, int]]:
-        """Generate a list of scored valid words that do not contain repeated letters.
+    def _generate_non_repeating_words(scored_words: Iterable[tuple[str, int]]) -> Iterator[tuple[str, int]]:
+        """Filter scored valid words down to those that do not contain repeated letters, as a streaming stage.
 
-        :param scored_words: ordered list of tuples containing valid words and their scores.
-        :return: ordered list of tuples containing valid words, without any repeating characters,
-            and their scores
+        :param scored_words: tuples containing valid words and their scores.
+        :return: iterator of tuples containing valid words, without any repeating characters,
+            and their scores, in the order given
         """
-        return [(word, score) for word, score in scored_words if len(word) == len(set(word))]
+        return ((word, score) for word, score in scored_words if len(word) == len(set(word)))
 
-    def _generate_new_char_words(self, all_words: list[str]) -> list[tuple[str, int]]:
+    def _generate_new_char_words(self, all_words: Iterable[str], top: int | None = None) -> list[tuple[str, int]]:
         """Generate a list of scored valid words only contain letters never used before in this game.
 
-        :param all_words: ordered list of tuples containing valid words and their scores.
+        Words are filtered before they are scored, so only words made of new letters are ever scored.
+
+        :param all_words: words to select from.
+        :param top: number of words to keep, every word is kept when not given.
         :return: ordered list of tuples containing valid words, with only letters never used before in this game,
             and their scores
         """
         used_letters = {*[green[0] for green in self.greens], *[yellow[0] for yellow in self.yellows], *self.greys}
 
-        new_char_words = [
-            (word, self.score_word(word, self.distribution))
-            for word in all_words
-            if all(letter not in used_letters for letter in word)
-        ]
+        new_char_words = (word for word in all_words if used_letters.isdisjoint(word))
 
-        return sorted(new_char_words, key=lambda word_tuple: word_tuple[1], reverse=True)
+        return self._generate_scored_words(new_char_words, top)
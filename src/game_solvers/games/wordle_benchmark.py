@@ -0,0 +1,126 @@
+"""Module for benchmarking each stage of solving a wordle game.
+
+Stages are benchmarked on the bundled dictionary and on synthetic dictionaries some multiple of its size, named by
+stage and scale, e.g. ``valid_words@10x``. Stages whose cost does not depend on the dictionary size, such as loading
+the bundled word list or rendering the report, are only benchmarked on the bundled dictionary.
+
+Synthetic words are drawn letter by letter from the letters found in each position of the bundled words, so they
+share its letter statistics, and are seeded so every run benchmarks the same words.
+"""
+
+import io
+import random
+from collections.abc import Callable, Iterator
+from contextlib import redirect_stdout
+from functools import partial
+
+from .wordle import WordleSolver
+from .wordle_constraints import WORD_LENGTH
+from .wordle_dictionary import WordleDictionary
+from .wordle_ranking import RANKING_STRATEGIES
+
+BENCHMARK_SCALES = (1, 10, 100)
+
+# a mid-game state, narrowing the bundled dictionary to a few dozen candidates
+BENCHMARK_GREENS = [("A", 2)]
+BENCHMARK_YELLOWS = [("E", [5])]
+BENCHMARK_GREYS = ["S", "T", "R", "O"]
+
+BENCHMARK_TOP = 10
+
+
+def synthetic_words(words: list[str], scale: int, seed: int = 0) -> list[str]:
+    """Grow a word list to a multiple of its size with random words sharing its letter statistics.
+
+    :param words: five-letter upper case words.
+    :param scale: multiple of the size of the words to grow to, the words themselves come first.
+    :param seed: seed for the random words.
+    :return: the grown word list.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    count = len(words) * (scale - 1)
+    columns = [rng.choices([word[position] for word in words], k=count) for position in range(WORD_LENGTH)]
+
+    return words + ["".join(letters) for letters in zip(*columns, strict=True)]
+
+
+def benchmark_solver(words: list[str]) -> WordleSolver:
+    """Set up a solver over the given words in the benchmark game state, with its indexes built.
+
+    :param words: the dictionary.
+    :return: the solver.
+    """
+    dictionary = WordleDictionary(words)
+    solver = WordleSolver(BENCHMARK_GREENS, BENCHMARK_YELLOWS, BENCHMARK_GREYS, dictionary)
+
+    # indexes are built once per dictionary, so are set up rather than benchmarked
+    solver.candidates  # noqa: B018
+    solver.word_scores  # noqa: B018
+
+    return solver
+
+
+def wordle_benchmarks(scales: tuple[int, ...] = BENCHMARK_SCALES) -> Iterator[tuple[str, Callable[[], object]]]:
+    """Provide the benchmark of every stage, on the bundled dictionary and on synthetic dictionaries.
+
+    Dictionaries are set up lazily, one scale at a time, so only one is held at once.
+
+    :param scales: multiples of the size of the bundled dictionary to benchmark on.
+    :return: iterator of the name of each benchmark and the function it times.
+    """
+    words = WordleSolver.prep_words()
+    distribution = WordleSolver.calculate_distribution(words)
+
+    yield "prep_words@1x", WordleSolver.prep_words
+    yield "score_word@1x", lambda: WordleSolver.score_word("CRANE", distribution)
+
+    for scale in scales:
+        yield from _stage_benchmarks(benchmark_solver(synthetic_words(words, scale)), scale)
+
+
+def _stage_benchmarks(solver: WordleSolver, scale: int) -> Iterator[tuple[str, Callable[[], object]]]:
+    """Provide the benchmark of every stage depending on the dictionary size, for one dictionary.
+
+    :param solver: solver set up by `benchmark_solver`.
+    :param scale: multiple of the size of the bundled dictionary the solver's dictionary is.
+    :return: iterator of the name of each benchmark and the function it times.
+    """
+    scored = list(solver._iter_scored_words(solver.candidates))
+
+    def report() -> None:
+        from ..common.report import report_wordle_solutions
+
+        top_scored = solver.top_scored(scored, BENCHMARK_TOP)
+        with redirect_stdout(io.StringIO()):
+            report_wordle_solutions(solver.greens, solver.yellows, solver.greys, top_scored, top_scored, top_scored)
+
+    yield f"dictionary@{scale}x", lambda: WordleDictionary(solver.dictionary)
+    yield f"calculate_distribution@{scale}x", lambda: solver.calculate_distribution(solver.dictionary)
+    yield f"valid_word@{scale}x", lambda: list(filter(solver.valid_word, solver.dictionary))
+    yield f"valid_words@{scale}x", solver.valid_words
+    yield f"generate_scored_words@{scale}x", lambda: solver._generate_scored_words(solver.candidates, BENCHMARK_TOP)
+    yield (
+        f"generate_non_repeating_words@{scale}x",
+        lambda: solver.top_scored(solver._generate_non_repeating_words(scored), BENCHMARK_TOP),
+    )
+    yield (
+        f"generate_new_char_words@{scale}x",
+        lambda: solver._generate_new_char_words(solver.dictionary, BENCHMARK_TOP),
+    )
+
+    # rendering only depends on the number of words reported, not the size of the dictionary, and ranking every word
+    # of the larger dictionaries would need a pattern matrix too large to build for a benchmark
+    if scale == 1:
+        yield "report_wordle_solutions@1x", report
+
+        guess_ranker = solver.guess_ranker
+        for strategy in RANKING_STRATEGIES:
+            yield (
+                f"rank_{strategy}@1x",
+                partial(guess_ranker.rank, strategy, solver.dictionary, solver.candidates, BENCHMARK_TOP),
+            )
+            # the opening turn, with every word still a candidate, as ranked live when no opening book is bundled
+            yield (
+                f"rank_{strategy}_full@1x",
+                partial(guess_ranker.rank, strategy, solver.dictionary, solver.dictionary, BENCHMARK_TOP),
+            )
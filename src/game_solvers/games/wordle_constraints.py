@@ -0,0 +1,466 @@
+"""Module for compiling wordle letter information into bitmask constraints.
+
+Letter information is compiled once into positional bitmasks, where bit ``position * 26 + letter`` stands for
+``letter`` at ``position`` (both zero-indexed), and bounds on the number of copies of each letter. A letter anywhere
+in a word is all five of its position bits, and a word has one bit set per position, so the bits a word has set
+among a letter's five count its copies of the letter.
+
+Words can be checked against the compiled masks one at a time using their own positional bitmask, or all at once
+through `WordLanes`, the dictionary transposed into one bitset per position bit. Each bitset is a python int holding
+one byte-wide lane per word, lane ``i`` being ``1`` when word ``i`` has that letter in that position. Filtering the
+whole dictionary is then a few dozen integer AND/OR/ADD operations rather than a python loop over every word.
+
+Words checked one at a time go through a `ConstraintPlan`, which splits the letter information into single checks
+and orders them by how few words of the dictionary each lets through, so most words are rejected by the first check
+made. The share each check lets through is estimated from `LetterFrequencies`, counts of each letter in each position
+and of the words holding each number of copies of a letter, taken once per dictionary. The plan counts the words each
+check eliminates, to see which letter information is doing the work, and can also filter the bitsets one check at a
+time in its order to count the same for a whole dictionary at once.
+"""
+
+from collections.abc import Iterable, Sequence
+from itertools import compress
+from typing import Any
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+WORD_LENGTH = 5
+LETTER_COUNT = len(LETTERS)
+
+# bit for each (zero-indexed position, letter), e.g. POSITION_BITS[2]["A"] is the bit for an "A" in the third position
+POSITION_BITS: list[dict[str, int]] = [
+    {letter: 1 << (position * LETTER_COUNT + index) for index, letter in enumerate(LETTERS)}
+    for position in range(WORD_LENGTH)
+]
+
+# all five position bits of each letter, i.e. the letter being anywhere in the word
+LETTER_BITS: dict[str, int] = {
+    letter: sum(position_bits[letter] for position_bits in POSITION_BITS) for letter in LETTERS
+}
+
+# state of each position of a feedback pattern, its base-3 digit
+GREY = 0
+YELLOW = 1
+GREEN = 2
+
+# translation tables mapping the ascii byte of a single letter to 1 and every other byte to 0
+_LANE_TABLES: dict[str, bytes] = {
+    letter: bytes(1 if byte == ord(letter) else 0 for byte in range(256)) for letter in LETTERS
+}
+
+# translation tables mapping a letter count byte to 1 when it is between the table's bounds, otherwise 0
+_BETWEEN_TABLES: dict[tuple[int, int], bytes] = {
+    (least, most): bytes(1 if least <= byte <= most else 0 for byte in range(256))
+    for least in range(WORD_LENGTH + 1)
+    for most in range(WORD_LENGTH + 1)
+}
+
+
+def word_mask(word: str) -> int:
+    """Build the positional bitmask for the given word.
+
+    :param word: five-letter upper case word.
+    :return: positional bitmask of the word.
+    """
+    first, second, third, fourth, fifth = POSITION_BITS
+    return first[word[0]] | second[word[1]] | third[word[2]] | fourth[word[3]] | fifth[word[4]]
+
+
+def mask_bits(mask: int) -> list[int]:
+    """List the indexes of the bits set in the given mask.
+
+    :param mask: bitmask to inspect.
+    :return: indexes of the set bits, lowest first.
+    """
+    bits = []
+    while mask:
+        lowest = mask & -mask
+        bits.append(lowest.bit_length() - 1)
+        mask ^= lowest
+
+    return bits
+
+
+class WordLanes:
+    """Words transposed into byte-lane bitsets, one for each position and letter."""
+
+    def __init__(self, words: Sequence[str]):
+        """Build the bitsets for the given words.
+
+        :param words: five-letter upper case words, lane ``i`` of every bitset refers to ``words[i]``.
+        """
+        self.words = words
+        self.size = len(words)
+        self.all = int.from_bytes(b"\x01" * self.size, "little")
+
+        # column `position` of the packed words holds the letter every word has in that position
+        packed = "".join(words).encode("ascii")
+        self.lanes: list[int] = []
+        for position in range(WORD_LENGTH):
+            column = packed[position::WORD_LENGTH]
+            self.lanes.extend(int.from_bytes(column.translate(_LANE_TABLES[letter]), "little") for letter in LETTERS)
+
+        # a letter is present anywhere in a word when it is in any of the five positions
+        self.present: dict[str, int] = {}
+        for index, letter in enumerate(LETTERS):
+            present = 0
+            for position in range(WORD_LENGTH):
+                present |= self.lanes[position * LETTER_COUNT + index]
+            self.present[letter] = present
+
+    def any_of(self, mask: int) -> int:
+        """Select the words with at least one of the position bits in the given mask.
+
+        :param mask: positional bitmask.
+        :return: bitset of the selected words.
+        """
+        selected = 0
+        for bit in mask_bits(mask):
+            selected |= self.lanes[bit]
+
+        return selected
+
+    def all_of(self, mask: int) -> int:
+        """Select the words with every one of the position bits in the given mask.
+
+        :param mask: positional bitmask.
+        :return: bitset of the selected words.
+        """
+        selected = self.all
+        for bit in mask_bits(mask):
+            selected &= self.lanes[bit]
+
+        return selected
+
+    def count_between(self, mask: int, least: int, most: int) -> int:
+        """Select the words with between the given numbers of the position bits in the given mask set.
+
+        :param mask: positional bitmask.
+        :param least: fewest bits of the mask a selected word has set.
+        :param most: most bits of the mask a selected word has set.
+        :return: bitset of the selected words.
+        """
+        # any or none of the bits set are answered by OR-ing the lanes, without counting. a word has one bit per
+        # position, so never more of the mask's bits set than the mask has or than there are positions
+        if least <= 1 and most >= min(mask.bit_count(), WORD_LENGTH):
+            return self.any_of(mask) if least else self.all
+        if most == 0:
+            return self.all & ~self.any_of(mask)
+
+        # a word has one bit per position, so adding lanes never counts past five and never carries between lanes
+        counts = 0
+        for bit in mask_bits(mask):
+            counts += self.lanes[bit]
+
+        table = _BETWEEN_TABLES[least, most]
+        return int.from_bytes(counts.to_bytes(self.size, "little").translate(table), "little")
+
+    def select(self, selected: int) -> list[str]:
+        """List the words selected by the given bitset.
+
+        :param selected: bitset of selected words.
+        :return: selected words, in their original order.
+        """
+        return list(compress(self.words, selected.to_bytes(self.size, "little")))
+
+
+class LetterFrequencies:
+    """Counts of each letter in each position, and of the words holding each number of copies of each letter."""
+
+    def __init__(self, word_lanes: WordLanes):
+        """Count the letters of the given words.
+
+        :param word_lanes: words to count, transposed into bitsets.
+        """
+        self.size = word_lanes.size
+        # words with each position bit set, lanes are 0 or 1 per word so counting a lane's bits counts its words
+        self.position_counts = [lane.bit_count() for lane in word_lanes.lanes]
+
+        # words holding each letter zero to five times, from the letter's copies in each word as one byte per word
+        self.copy_counts: dict[str, tuple[int, ...]] = {}
+        for index, letter in enumerate(LETTERS):
+            copies = sum(word_lanes.lanes[position * LETTER_COUNT + index] for position in range(WORD_LENGTH))
+            column = copies.to_bytes(self.size, "little")
+            self.copy_counts[letter] = tuple(column.count(count) for count in range(WORD_LENGTH + 1))
+
+    def share(self, mask: int, least: int, most: int) -> float:
+        """Estimate the share of the words with between the given numbers of the position bits of a letter set.
+
+        Bounds on all five bits of a letter are answered exactly from the copies of the letter. For some positions
+        of a letter, words are taken to have the letter in at most one of them, which few words do otherwise.
+
+        :param mask: positional bitmask, of the positions of a single letter.
+        :param least: fewest bits of the mask a word has set.
+        :param most: most bits of the mask a word has set.
+        :return: share of the words estimated to have between ``least`` and ``most`` of the bits set.
+        """
+        if not self.size:
+            return 0.0
+
+        bits = mask_bits(mask)
+        letter = LETTERS[bits[0] % LETTER_COUNT]
+        if mask == LETTER_BITS[letter]:
+            return sum(self.copy_counts[letter][least : most + 1]) / self.size
+
+        present = min(sum(self.position_counts[bit] for bit in bits), self.size)
+        passing = (self.size - present if least == 0 else 0) + (present if most >= 1 else 0)
+        return passing / self.size
+
+
+class WordleConstraints:
+    """Green, yellow and grey letter information, and guess feedback, compiled into bitmasks and letter counts."""
+
+    def __init__(
+        self,
+        greens: list[tuple[str, int]],
+        yellows: list[tuple[str, list[int]]],
+        greys: list[str],
+        history: Iterable[tuple[str, int]] = (),
+    ):
+        """Compile the given letter information into position bitmasks and bounds on the count of each letter.
+
+        A grey letter that is also green or yellow is read as wordle reports it, the word has no more copies of the
+        letter than are known, rather than none at all. Feedback on a guess bounds the count of each of its letters
+        exactly: at least as many as were green or yellow, and no more when one was grey.
+
+        Each rule is also kept as a single check in ``checks``, for a `ConstraintPlan` to order.
+
+        :param greens: letters and their known one-indexed positions.
+        :param yellows: letters and the one-indexed positions they are known not to be in.
+        :param greys: letters known not to be in the word, or to have no more copies than are green or yellow.
+        :param history: guesses and the feedback received for each, as base-3 patterns, see `wordle_patterns`.
+        """
+        # letter required in each zero-indexed position, and the positions each letter is known not to be in
+        self.required = [""] * WORD_LENGTH
+        self.excluded: dict[str, set[int]] = {}
+
+        # fewest and most copies of each letter the word can have, where known
+        self.min_counts: dict[str, int] = {}
+        self.max_counts: dict[str, int] = {}
+
+        self._add_letters(greens, yellows, greys)
+        for guess, pattern in history:
+            self._add_feedback(guess, pattern)
+
+        # single checks of the letter information, as a name, a positional bitmask and the least and most bits of
+        # the mask a valid word may have set
+        self.checks: list[tuple[str, int, int, int]] = []
+        self._compile_masks()
+        self._compile_bounds()
+
+    def _add_letters(
+        self, greens: list[tuple[str, int]], yellows: list[tuple[str, list[int]]], greys: list[str]
+    ) -> None:
+        """Add green, yellow and grey letter information.
+
+        :param greens: letters and their known one-indexed positions.
+        :param yellows: letters and the one-indexed positions they are known not to be in.
+        :param greys: letters known not to be in the word, or to have no more copies than are green or yellow.
+        """
+        for green, pos in greens:
+            self.required[pos - 1] = green
+        for yellow, incorrect_positions in yellows:
+            self.excluded.setdefault(yellow, set()).update(pos - 1 for pos in incorrect_positions)
+
+        # a yellow is one more copy than the letter's greens, as it must be found outside them
+        for letter in {green for green, _ in greens}:
+            self.min_counts[letter] = self.required.count(letter)
+        for yellow, _ in yellows:
+            self.min_counts[yellow] = max(self.min_counts.get(yellow, 0), self.required.count(yellow) + 1)
+        for grey in greys:
+            self.max_counts[grey] = min(self.max_counts.get(grey, WORD_LENGTH), self.min_counts.get(grey, 0))
+
+    def _add_feedback(self, guess: str, pattern: int) -> None:
+        """Add the letter information from the feedback on a guess.
+
+        :param guess: five-letter upper case guess.
+        :param pattern: feedback received, as a base-3 pattern.
+        """
+        marked: dict[str, int] = {}
+        greyed = set()
+        for position, letter in enumerate(guess):
+            pattern, state = divmod(pattern, 3)
+            if state == GREEN:
+                self.required[position] = letter
+            else:
+                self.excluded.setdefault(letter, set()).add(position)
+
+            if state == GREY:
+                greyed.add(letter)
+            else:
+                marked[letter] = marked.get(letter, 0) + 1
+
+        for letter, count in marked.items():
+            self.min_counts[letter] = max(self.min_counts.get(letter, 0), count)
+        for letter in greyed:
+            self.max_counts[letter] = min(self.max_counts.get(letter, WORD_LENGTH), marked.get(letter, 0))
+
+    def _compile_masks(self) -> None:
+        """Compile the required and excluded positions of each letter into bitmasks."""
+        # every green bit must be set in the word
+        self.green_mask = 0
+        for position, letter in enumerate(self.required):
+            if letter:
+                self.green_mask |= POSITION_BITS[position][letter]
+                self.checks.append((f"green {letter}{position + 1}", POSITION_BITS[position][letter], 1, 1))
+
+        # no rejected bit may be set in the word: every position of a letter known to be absent, and the known
+        # incorrect positions of the others
+        self.rejected_mask = 0
+        for letter in sorted(set(self.excluded) | set(self.max_counts)):
+            if self.max_counts.get(letter, WORD_LENGTH) == 0:
+                self.rejected_mask |= LETTER_BITS[letter]
+                self.checks.append((f"grey {letter}", LETTER_BITS[letter], 0, 0))
+                continue
+
+            positions = sorted(self.excluded.get(letter, ()))
+            if positions:
+                mask = sum(POSITION_BITS[position][letter] for position in positions)
+                self.rejected_mask |= mask
+                self.checks.append((f"{letter} not {''.join(str(pos + 1) for pos in positions)}", mask, 0, 0))
+
+    def _compile_bounds(self) -> None:
+        """Keep the bounds on the count of each letter not already settled by the bitmasks."""
+        self.letter_bounds: list[tuple[str, int, int]] = []
+        for letter in sorted(set(self.min_counts) | set(self.max_counts)):
+            least = self.min_counts.get(letter, 0)
+            most = self.max_counts.get(letter, WORD_LENGTH)
+            if most == 0 or (least <= self.required.count(letter) and most == WORD_LENGTH):
+                continue
+
+            self.letter_bounds.append((letter, least, most))
+            if least == most:
+                name = f"{letter} exactly {least}"
+            elif most == WORD_LENGTH:
+                name = f"{letter} at least {least}"
+            else:
+                name = f"{letter} {least} to {most}"
+            self.checks.append((name, LETTER_BITS[letter], least, most))
+
+    def matches(self, positional_mask: int) -> bool:
+        """Check a word, given as its positional bitmask, against the compiled letter information.
+
+        :param positional_mask: positional bitmask of the word to check.
+        :return: True if word is valid, False otherwise
+        """
+        if positional_mask & self.green_mask != self.green_mask:
+            return False
+
+        if positional_mask & self.rejected_mask:
+            return False
+
+        for letter, least, most in self.letter_bounds:
+            # a word has one bit per position, so the bits set among a letter's bits count its copies
+            if not least <= (positional_mask & LETTER_BITS[letter]).bit_count() <= most:
+                return False
+
+        return True
+
+    def select(self, word_lanes: WordLanes) -> int:
+        """Check every word at once against the compiled letter information.
+
+        :param word_lanes: words to check, transposed into bitsets.
+        :return: bitset of the valid words.
+        """
+        selected = word_lanes.all_of(self.green_mask) & ~word_lanes.any_of(self.rejected_mask)
+
+        for letter, least, most in self.letter_bounds:
+            selected &= word_lanes.count_between(LETTER_BITS[letter], least, most)
+
+        return selected
+
+    def filter(self, word_lanes: WordLanes) -> list[str]:
+        """Filter words down to those matching the compiled letter information.
+
+        :param word_lanes: words to filter, transposed into bitsets.
+        :return: the valid words, in their original order.
+        """
+        return word_lanes.select(self.select(word_lanes))
+
+
+class ConstraintPlan:
+    """Single checks of compiled letter information, ordered to reject words as early as possible."""
+
+    def __init__(self, constraints: WordleConstraints, frequencies: LetterFrequencies):
+        """Order the checks of the letter information by the share of the words each lets through, fewest first.
+
+        :param constraints: compiled letter information.
+        :param frequencies: letter counts of the words the share each check lets through is estimated from, usually
+            the dictionary's.
+        """
+        estimated = [
+            (frequencies.share(mask, least, most), name, mask, least, most)
+            for name, mask, least, most in constraints.checks
+        ]
+        # stable, so equally selective checks keep the order they were given in
+        estimated.sort(key=lambda estimate: estimate[0])
+
+        self.names = [name for _, name, _, _, _ in estimated]
+        self.selectivity = [share for share, _, _, _, _ in estimated]
+        # each check as its mask and the least and most of the mask's bits a word passing it has set
+        self.bounds = [(mask, least, most) for _, _, mask, least, most in estimated]
+        # each check as its mask and whether a word passes with each number of the mask's bits set, from 0 to 5
+        self.checks = [
+            (mask, tuple(least <= count <= most for count in range(WORD_LENGTH + 1)))
+            for mask, least, most in self.bounds
+        ]
+        self.words_checked = 0
+        self.checks_made = 0
+        self.eliminated = [0] * len(self.checks)
+
+    def matches(self, positional_mask: int) -> bool:
+        """Check a word, given as its positional bitmask, stopping at the first check it fails.
+
+        :param positional_mask: positional bitmask of the word to check.
+        :return: True if word is valid, False otherwise
+        """
+        self.words_checked += 1
+
+        for index, (mask, passes) in enumerate(self.checks):
+            if not passes[(positional_mask & mask).bit_count()]:
+                self.checks_made += index + 1
+                self.eliminated[index] += 1
+                return False
+
+        self.checks_made += len(self.checks)
+        return True
+
+    def select(self, word_lanes: WordLanes) -> int:
+        """Check every word at once, one check at a time in plan order over the bitsets.
+
+        Words are counted as `matches` counts them, each check being made of every word not yet eliminated, and
+        checking stops once no word is left.
+
+        :param word_lanes: words to check, transposed into bitsets.
+        :return: bitset of the words passing every check.
+        """
+        selected = word_lanes.all
+        remaining = word_lanes.size
+        self.words_checked += remaining
+
+        for index, (mask, least, most) in enumerate(self.bounds):
+            if not remaining:
+                break
+
+            self.checks_made += remaining
+            selected &= word_lanes.count_between(mask, least, most)
+            # lanes are 0 or 1 per word, so counting the bits of the selection counts the words passing
+            passed = selected.bit_count()
+            self.eliminated[index] += remaining - passed
+            remaining = passed
+
+        return selected
+
+    def stats(self) -> dict[str, Any]:
+        """Count the words checked so far and the words each check eliminated.
+
+        :return: number of words checked, number of checks made, and each check in the order they are made with
+            the share of the dictionary it was estimated to let through and the number of words it eliminated.
+        """
+        return {
+            "words": self.words_checked,
+            "checks": self.checks_made,
+            "constraints": [
+                {"constraint": name, "selectivity": share, "eliminated": eliminated}
+                for name, share, eliminated in zip(self.names, self.selectivity, self.eliminated, strict=True)
+            ],
+        }
@@ -0,0 +1,192 @@
+"""Module for wordle dictionaries shared by every solver in a process.
+
+A `WordleDictionary` holds a word list and everything derived from the words alone: the letter distribution, the
+bitsets, the inverted index, the pattern matrix, the decision tree and the opening books. Each is built once, when
+first needed, and kept for the life of the dictionary. The words are never changed once loaded, so a dictionary can
+be shared by any number of solvers, and builds are guarded by a lock so solvers in different threads share them too.
+
+`load_dictionary` loads a word list resource once per process, the bundled dictionary by default, and hands the
+same dictionary to every caller.
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, TypeVar, cast
+
+from ..common.resources import read_data_resource
+from ..common.wordlist import read_word_list_resource, words_digest
+from .wordle_constraints import LETTERS, LetterFrequencies, WordLanes
+from .wordle_index import WordIndex
+from .wordle_openings import OpeningBook, load_opening_book
+from .wordle_patterns import PatternMatrix, PatternRows, load_pattern_matrix
+from .wordle_ranking import GuessRanker
+from .wordle_scores import LetterCounts
+from .wordle_tree import DecisionTree, read_decision_tree_resource
+
+logger = logging.getLogger("WordleSolver")
+
+WORD_LIST_RESOURCE = "words_alpha_five_letters"
+
+T = TypeVar("T")
+
+# dictionaries loaded from resources, by resource name
+_loaded_dictionaries: dict[str, "WordleDictionary"] = {}
+_load_lock = threading.Lock()
+
+
+def read_words(resource_name: str = WORD_LIST_RESOURCE) -> list[str]:
+    """Read a word list from resources. Set all to capitals.
+
+    The compiled binary word list is preferred, falling back to parsing the csv source of truth if the compiled
+    word list has not been built, or is stale as the csv has changed since it was built.
+
+    :param resource_name: name of the word list in the data folder, without its extension.
+    :return: list of five-letter words, all in upper case.
+    """
+    try:
+        return read_word_list_resource(f"{resource_name}.bin")
+    except FileNotFoundError:
+        logger.debug("Compiled word list not found, reading csv word list.")
+    except ValueError as error:
+        logger.warning("Compiled word list %s.bin is unusable (%s), reading csv word list.", resource_name, error)
+
+    return [word.upper() for word in read_data_resource(f"{resource_name}.txt")[0]]
+
+
+def load_dictionary(resource_name: str = WORD_LIST_RESOURCE) -> "WordleDictionary":
+    """Load a word list resource as a dictionary, once per process.
+
+    :param resource_name: name of the word list in the data folder, without its extension. Defaults to the
+        bundled dictionary.
+    :return: the dictionary, the same one for every call with the same resource name.
+    """
+    with _load_lock:
+        if resource_name not in _loaded_dictionaries:
+            _loaded_dictionaries[resource_name] = WordleDictionary(read_words(resource_name))
+
+        return _loaded_dictionaries[resource_name]
+
+
+def calculate_distribution(words: Sequence[str]) -> dict[str, int]:
+    """Calculate distribution of letters for the given words.
+
+    :param words: five-letter upper case words.
+    :return: dictionary containing all letters and their occurrence count in given words
+    """
+    # counting each letter across the joined words is one pass in C per letter, rather than a loop per letter
+    joined_words = "".join(words)
+
+    return {letter: joined_words.count(letter) for letter in LETTERS}
+
+
+class WordleDictionary:
+    """Immutable word list and the indexes built from it, shared by every solver using it."""
+
+    def __init__(self, words: Iterable[str]):
+        """Initialize the dictionary.
+
+        :param words: five-letter upper case words, copied so later changes to them are not seen.
+        """
+        self._words = tuple(words)
+        self._built: dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def words(self) -> tuple[str, ...]:
+        """Words of the dictionary, in order."""
+        return self._words
+
+    @property
+    def digest(self) -> str:
+        """Digest of the words, keying the caches generated from them."""
+        return self._build_once("digest", lambda: words_digest(self._words))
+
+    @property
+    def distribution(self) -> dict[str, int]:
+        """Distribution of letters over the words. A copy, so it can be changed freely."""
+        return dict(self.distribution_view)
+
+    @property
+    def distribution_view(self) -> Mapping[str, int]:
+        """Distribution of letters over the words, as a read-only view."""
+        return self._build_once("distribution", lambda: MappingProxyType(calculate_distribution(self._words)))
+
+    @property
+    def word_lanes(self) -> WordLanes:
+        """Letter and position bitsets of the words."""
+        return self._build_once("word_lanes", lambda: WordLanes(self._words))
+
+    @property
+    def letter_frequencies(self) -> LetterFrequencies:
+        """Counts of each letter in each position and of the words holding each number of copies of a letter."""
+        return self._build_once("letter_frequencies", lambda: LetterFrequencies(self.word_lanes))
+
+    @property
+    def word_index(self) -> WordIndex:
+        """Inverted letter and position index of the words."""
+        return self._build_once("word_index", lambda: WordIndex(self._words))
+
+    @property
+    def pattern_rows(self) -> PatternRows:
+        """Feedback pattern calculator over every word."""
+        return self._build_once("pattern_rows", lambda: PatternRows(self._words))
+
+    @property
+    def letter_counts(self) -> LetterCounts:
+        """Letter count columns of the words."""
+        return self._build_once("letter_counts", lambda: LetterCounts(self.word_lanes))
+
+    @property
+    def word_scores(self) -> Mapping[str, int]:
+        """Score of every word by the distribution of letters over the words, as a read-only view."""
+        return self._build_once(
+            "word_scores",
+            lambda: MappingProxyType(
+                dict(zip(self._words, self.letter_counts.scores(self.distribution_view), strict=True))
+            ),
+        )
+
+    @property
+    def pattern_matrix(self) -> PatternMatrix:
+        """Pattern matrix of the words, mapped from the cache and built there first if not yet cached."""
+        return self._build_once("pattern_matrix", lambda: load_pattern_matrix(self._words))
+
+    @property
+    def guess_ranker(self) -> GuessRanker:
+        """Guess ranker over the words, ranking in this process."""
+        return self._build_once("guess_ranker", lambda: GuessRanker(self._words, self.pattern_matrix))
+
+    @property
+    def decision_tree(self) -> DecisionTree:
+        """Precomputed decision tree over the words, read from the resources folder."""
+        return self._build_once("decision_tree", lambda: read_decision_tree_resource(self._words))
+
+    def opening_book(self, strategy: str) -> OpeningBook | None:
+        """Provide the opening book of a ranking strategy over the words, read from the resources folder.
+
+        :param strategy: ranking strategy, ``entropy`` or ``minimax``.
+        :return: the opening book, or None if no book was compiled for the words.
+        """
+        return self._build_once(f"opening_book_{strategy}", lambda: load_opening_book(self._words, strategy))
+
+    def preload(self) -> None:
+        """Build the indexes every solver query needs now, rather than on the first query that needs each."""
+        for name in ("distribution", "word_lanes", "word_scores", "pattern_rows", "guess_ranker"):
+            getattr(self, name)
+
+    def _build_once(self, name: str, build: Callable[[], T]) -> T:
+        """Build a value derived from the words the first time it is needed, and return the same value after.
+
+        :param name: name the value is kept under.
+        :param build: builds the value.
+        :return: the value.
+        """
+        if name not in self._built:
+            # re-entrant, as building one value can need another
+            with self._lock:
+                if name not in self._built:
+                    self._built[name] = build()
+
+        return cast(T, self._built[name])
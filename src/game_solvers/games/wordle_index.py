@@ -0,0 +1,98 @@
+"""Module for the inverted letter and position index over the wordle dictionary.
+
+Every position bit of `wordle_constraints` maps to a posting list of the ids of the words with that letter in that
+position, and every letter maps to the ids of the words containing it anywhere. Compiled letter information is
+answered by intersecting and subtracting posting lists, starting from the smallest required list, so the cost of a
+query follows the size of the result rather than the size of the dictionary.
+"""
+
+from collections.abc import Sequence
+
+from .wordle_constraints import LETTER_BITS, LETTER_COUNT, LETTERS, WORD_LENGTH, WordleConstraints, mask_bits
+
+
+class WordIndex:
+    """Inverted index from letters and positions to word ids."""
+
+    def __init__(self, words: Sequence[str]):
+        """Build the posting lists for the given words.
+
+        :param words: five-letter upper case words, word ids are indexes into this list.
+        """
+        self.words = words
+
+        postings: list[set[int]] = [set() for _ in range(WORD_LENGTH * LETTER_COUNT)]
+        letter_offsets = {letter: index for index, letter in enumerate(LETTERS)}
+        for word_id, word in enumerate(words):
+            for position, letter in enumerate(word):
+                postings[position * LETTER_COUNT + letter_offsets[letter]].add(word_id)
+
+        self.positions: list[frozenset[int]] = [frozenset(posting) for posting in postings]
+        self.present: dict[str, frozenset[int]] = {
+            letter: frozenset().union(*(self.positions[bit] for bit in mask_bits(LETTER_BITS[letter])))
+            for letter in LETTERS
+        }
+
+    def _required(self, constraints: WordleConstraints) -> list[frozenset[int]]:
+        """Gather the posting lists every matching word is in, one per green position and per letter known present.
+
+        :param constraints: compiled letter information.
+        :return: the required posting lists.
+        """
+        required = [self.positions[bit] for bit in mask_bits(constraints.green_mask)]
+        required.extend(self.present[letter] for letter, least, _ in constraints.letter_bounds if least)
+
+        return required
+
+    def driver_size(self, constraints: WordleConstraints) -> int:
+        """Count the words a query starts from, the smallest required posting list, bounding the work it does.
+
+        :param constraints: compiled letter information.
+        :return: size of the smallest required posting list, or of the whole dictionary when nothing is required.
+        """
+        return min(map(len, self._required(constraints)), default=len(self.words))
+
+    def query(self, constraints: WordleConstraints) -> list[int]:
+        """Find the ids of the words matching the compiled letter information.
+
+        :param constraints: compiled letter information.
+        :return: sorted ids of the matching words.
+        """
+        # use the smallest required posting list as the driver
+        required = self._required(constraints)
+
+        if required:
+            required.sort(key=len)
+            matched = set(required[0])
+            matched.intersection_update(*required[1:])
+        else:
+            matched = set(range(len(self.words)))
+
+        # letters rejected in every position are removed using their presence list, the rest position by position.
+        # one difference at a time, so each costs at most the size of the smaller of the two sets
+        rejected_mask = constraints.rejected_mask
+        rejected = []
+        for letter, letter_bits in LETTER_BITS.items():
+            if rejected_mask & letter_bits == letter_bits:
+                rejected.append(self.present[letter])
+                rejected_mask ^= letter_bits
+        rejected.extend(self.positions[bit] for bit in mask_bits(rejected_mask))
+
+        for posting in rejected:
+            matched = matched.difference(posting)
+
+        # what is left is small, so counts of the letters are checked word by word
+        words = self.words
+        for letter, least, most in constraints.letter_bounds:
+            matched = {word_id for word_id in matched if least <= words[word_id].count(letter) <= most}
+
+        return sorted(matched)
+
+    def filter(self, constraints: WordleConstraints) -> list[str]:
+        """Filter words down to those matching the compiled letter information.
+
+        :param constraints: compiled letter information.
+        :return: the valid words, in their original order.
+        """
+        words = self.words
+        return [words[word_id] for word_id in self.query(constraints)]
@@ -0,0 +1,223 @@
+"""Module for wordle opening books.
+
+The first two turns rank guesses against the most candidates, the whole dictionary and then everything giving the
+same feedback as the answer did for the opener, so they are the slowest to answer. Yet for a given word list and
+strategy their rankings never change. An opening book holds, for one strategy, the best first guesses and the best
+second guesses after each feedback pattern the best first guess could receive.
+
+Building a book ranks every word against the whole dictionary many times over, so books are built offline for the
+bundled dictionary and compiled into the resources folder as JSON, holding a digest of the word list they were built
+for. At runtime books are only read, and a dictionary without a book for a strategy ranks its opening turns live.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from ..common.resources import resources_path
+from ..common.wordlist import read_word_list_resource, words_digest
+from .wordle_patterns import ALL_GREEN, PatternRows, load_pattern_matrix
+from .wordle_ranking import RANKING_STRATEGIES, GuessRanker
+
+logger = logging.getLogger("WordleSolver")
+
+OPENING_BOOK_VERSION = 2
+
+# most guesses kept for each turn, deeper rankings are calculated live
+OPENING_BOOK_DEPTH = 10
+
+
+class OpeningBook:
+    """Precomputed rankings of the first and second guesses for one strategy."""
+
+    def __init__(
+        self,
+        strategy: str,
+        first: list[tuple[str, float]],
+        second: dict[int, tuple[int, list[tuple[str, float]]]],
+    ):
+        """Initialize the opening book.
+
+        :param strategy: strategy the guesses were ranked by.
+        :param first: best first guesses and their scores, best first.
+        :param second: for each feedback pattern the best first guess could receive, the number of candidates
+            left and the best second guesses and their scores.
+        """
+        self.strategy = strategy
+        self.first = first
+        self.second = second
+
+    @property
+    def opener(self) -> str:
+        """Best first guess, the guess the second guesses follow."""
+        return self.first[0][0]
+
+    def lookup(
+        self, history: list[tuple[str, int]], candidate_count: int, word_count: int, top: int | None
+    ) -> list[tuple[str, float]] | None:
+        """Look up the best guesses for a game state, if the book holds it.
+
+        Candidates always narrow from the state of the book, so a state with the same history and as many
+        candidates as the book's state has exactly the same candidates.
+
+        :param history: guesses made and their feedback, in the order guessed.
+        :param candidate_count: number of candidates left.
+        :param word_count: number of words in the dictionary.
+        :param top: number of best guesses wanted, every guess when not given.
+        :return: the best guesses and their scores, or None if the book does not hold the state or that many
+            guesses.
+        """
+        if top is None or top > OPENING_BOOK_DEPTH:
+            return None
+
+        if not history and candidate_count == word_count:
+            return self.first[:top]
+
+        if len(history) == 1 and history[0][0] == self.opener and history[0][1] in self.second:
+            count, ranked = self.second[history[0][1]]
+            if candidate_count == count:
+                return ranked[:top]
+
+        return None
+
+
+def build_opening_book(words: Sequence[str], strategy: str, guess_ranker: GuessRanker) -> OpeningBook:
+    """Rank the first guesses, then the second guesses after every feedback pattern of the best first guess.
+
+    :param words: the dictionary, used as both the possible guesses and the possible answers.
+    :param strategy: ranking strategy, ``entropy`` or ``minimax``.
+    :param guess_ranker: guess ranker over the dictionary.
+    :return: the opening book.
+    """
+    if strategy not in RANKING_STRATEGIES:
+        raise ValueError(
+            f"Opening books are only built for {', '.join(RANKING_STRATEGIES)}. Input {strategy} is invalid."
+        )
+
+    logger.info("Building %s wordle opening book for %s words", strategy, len(words))
+
+    first = guess_ranker.rank(strategy, words, words, top=OPENING_BOOK_DEPTH)
+
+    row = PatternRows(words).row(first[0][0])
+    buckets: dict[int, list[str]] = {}
+    for word, pattern in zip(words, row, strict=True):
+        buckets.setdefault(pattern, []).append(word)
+
+    second = {
+        pattern: (len(bucket), guess_ranker.rank(strategy, words, bucket, top=OPENING_BOOK_DEPTH))
+        for pattern, bucket in sorted(buckets.items())
+        if pattern != ALL_GREEN
+    }
+
+    return OpeningBook(strategy, first, second)
+
+
+def opening_book_resource(strategy: str) -> str:
+    """Provide name of the compiled opening book resource of the given strategy.
+
+    :param strategy: ranking strategy.
+    :return: name of the resource in the data folder.
+    """
+    return f"wordle_openings_{strategy}.json"
+
+
+def write_opening_book(book: OpeningBook, words: Sequence[str], path: Path) -> Path:
+    """Write an opening book to disk.
+
+    The book is written to a temporary file which is moved into place once complete, so a partially written book
+    is never read.
+
+    :param book: opening book to write.
+    :param words: the dictionary the book was built over.
+    :param path: path to write the opening book to.
+    :return: path of the written opening book.
+    """
+    document = {
+        "version": OPENING_BOOK_VERSION,
+        "words": words_digest(words),
+        "strategy": book.strategy,
+        "first": book.first,
+        "second": {str(pattern): [count, ranked] for pattern, (count, ranked) in book.second.items()},
+    }
+
+    partial_path = path.with_suffix(f".{os.getpid()}.partial")
+    partial_path.write_text(json.dumps(document))
+    partial_path.replace(path)
+
+    return path
+
+
+def read_opening_book(words: Sequence[str], path: Path) -> OpeningBook:
+    """Read an opening book from disk.
+
+    :param words: the dictionary the book must have been built over.
+    :param path: path of the opening book.
+    :return: the opening book.
+    """
+    document: dict[str, Any] = json.loads(path.read_text())
+
+    if document.get("version") != OPENING_BOOK_VERSION:
+        raise ValueError(f"Unsupported opening book version {document.get('version')}.")
+
+    if document.get("words") != words_digest(words):
+        raise ValueError("Opening book was built for a different word list.")
+
+    return OpeningBook(
+        document["strategy"],
+        [(guess, score) for guess, score in document["first"]],
+        {
+            int(pattern): (count, [(guess, score) for guess, score in ranked])
+            for pattern, (count, ranked) in document["second"].items()
+        },
+    )
+
+
+def compile_opening_books(workers: int | None = None) -> list[Path]:
+    """Build the opening book of every ranking strategy over the bundled dictionary and write them as resources.
+
+    :param workers: number of worker processes to rank in, defaults to the number of CPUs.
+    :return: paths of the compiled opening book resources.
+    """
+    words = read_word_list_resource("words_alpha_five_letters.bin")
+    guess_ranker = GuessRanker(words, load_pattern_matrix(words), workers=workers or os.cpu_count() or 1)
+
+    try:
+        return [
+            write_opening_book(
+                build_opening_book(words, strategy, guess_ranker),
+                words,
+                resources_path().joinpath("data", opening_book_resource(strategy)),
+            )
+            for strategy in RANKING_STRATEGIES
+        ]
+    finally:
+        guess_ranker.close()
+
+
+def load_opening_book(words: Sequence[str], strategy: str) -> OpeningBook | None:
+    """Read the compiled opening book of the given strategy, if there is one for the given words.
+
+    Books are never built at runtime, see `compile_opening_books`. Without a usable book a warning is logged and
+    None returned, for the opening turns to be ranked live.
+
+    :param words: the dictionary.
+    :param strategy: ranking strategy, ``entropy`` or ``minimax``.
+    :return: the opening book, or None if there is no book for the words and strategy.
+    """
+    path = resources_path().joinpath("data", opening_book_resource(strategy))
+
+    try:
+        return read_opening_book(words, path)
+    except FileNotFoundError:
+        logger.warning("Opening book %s not found, ranking the opening turns live.", path)
+    except (ValueError, KeyError, TypeError) as error:
+        logger.warning("Opening book %s is unusable (%s), ranking the opening turns live.", path, error)
+
+    return None
+
+
+if __name__ == "__main__":
+    compile_opening_books()
@@ -0,0 +1,277 @@
+"""Module for wordle feedback patterns.
+
+The feedback for a guess against a hidden answer is encoded as a base-3 integer from 0 to 242, where the digit for
+position ``i`` (zero-indexed, least significant first) is 0 for grey, 1 for yellow and 2 for green.
+
+Patterns for one guess against every answer are computed together as a `WordLanes` style byte-lane int, one lane per
+answer, so a full guess x answer matrix for the dictionary can be built without a python loop per answer. The matrix
+is cached on disk, keyed by a digest of the word list, and memory-mapped on later runs.
+"""
+
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+from ..common.resources import cache_path
+from ..common.wordlist import read_word_list_resource, words_digest
+from .wordle_constraints import GREEN, GREY, LETTER_COUNT, LETTERS, WORD_LENGTH, YELLOW, WordLanes
+from .wordle_scores import LetterCounts
+
+logger = logging.getLogger("WordleSolver")
+
+PATTERN_COUNT = 3**WORD_LENGTH
+ALL_GREEN = PATTERN_COUNT - 1
+POSITION_WEIGHTS = [3**position for position in range(WORD_LENGTH)]
+
+PATTERN_CHARACTERS = {GREY: ".", YELLOW: "y", GREEN: "g"}
+PATTERN_STATES = {
+    ".": GREY,
+    "-": GREY,
+    "b": GREY,
+    "x": GREY,
+    "0": GREY,
+    "y": YELLOW,
+    "1": YELLOW,
+    "g": GREEN,
+    "2": GREEN,
+}
+
+PATTERN_MATRIX_MAGIC = b"GSPM"
+PATTERN_MATRIX_VERSION = 1
+PATTERN_MATRIX_HEADER = struct.Struct("<4sHII")
+
+# translation tables mapping a letter count byte to 1 when it is at least the table's count, otherwise 0
+_AT_LEAST_TABLES: dict[int, bytes] = {
+    count: bytes(1 if byte >= count else 0 for byte in range(256)) for count in range(1, WORD_LENGTH + 1)
+}
+
+
+def feedback(guess: str, answer: str) -> int:
+    """Calculate the wordle feedback pattern for a guess against a hidden answer.
+
+    Repeated letters follow the wordle rules: greens are matched first, then each remaining occurrence of a letter in
+    the guess is yellow, left to right, only while the answer has unmatched occurrences of that letter left.
+
+    :param guess: five-letter upper case guess.
+    :param answer: five-letter upper case hidden answer.
+    :return: feedback pattern encoded as a base-3 integer.
+    """
+    pattern = 0
+    unmatched: dict[str, int] = {}
+
+    for guess_letter, answer_letter, weight in zip(guess, answer, POSITION_WEIGHTS, strict=True):
+        if guess_letter == answer_letter:
+            pattern += GREEN * weight
+        else:
+            unmatched[answer_letter] = unmatched.get(answer_letter, 0) + 1
+
+    for guess_letter, answer_letter, weight in zip(guess, answer, POSITION_WEIGHTS, strict=True):
+        if guess_letter != answer_letter and unmatched.get(guess_letter, 0):
+            pattern += YELLOW * weight
+            unmatched[guess_letter] -= 1
+
+    return pattern
+
+
+def pattern_states(pattern: int) -> list[int]:
+    """Decode a feedback pattern into the state of each position.
+
+    :param pattern: feedback pattern encoded as a base-3 integer.
+    :return: GREY, YELLOW or GREEN for each position.
+    """
+    return [pattern // weight % 3 for weight in POSITION_WEIGHTS]
+
+
+def pattern_string(pattern: int) -> str:
+    """Format a feedback pattern as text, e.g. ``gy..g``.
+
+    :param pattern: feedback pattern encoded as a base-3 integer.
+    :return: ``g`` for green, ``y`` for yellow and ``.`` for grey in each position.
+    """
+    return "".join(PATTERN_CHARACTERS[state] for state in pattern_states(pattern))
+
+
+def parse_pattern(value: str) -> int:
+    """Parse a feedback pattern from text, e.g. ``gy..g``.
+
+    :param value: ``g`` or ``2`` for green, ``y`` or ``1`` for yellow and ``.``, ``-``, ``b``, ``x`` or ``0`` for
+        grey, in each of the five positions.
+    :return: feedback pattern encoded as a base-3 integer.
+    """
+    if len(value) != WORD_LENGTH or any(character not in PATTERN_STATES for character in value.lower()):
+        raise ValueError(
+            f"Feedback patterns must be five characters of g (green), y (yellow) or . (grey). Input {value} is invalid."
+        )
+
+    return sum(
+        PATTERN_STATES[character] * weight for character, weight in zip(value.lower(), POSITION_WEIGHTS, strict=True)
+    )
+
+
+class PatternRows:
+    """Calculates the feedback patterns of any guess against a fixed set of answers, all answers at once."""
+
+    def __init__(self, answers: Sequence[str]):
+        """Build the answer bitsets.
+
+        :param answers: five-letter upper case hidden answers, lane ``i`` of each row refers to ``answers[i]``.
+        """
+        self.answers = answers
+        self.word_lanes = WordLanes(answers)
+        self.size = self.word_lanes.size
+
+        # lanes for answers holding at least `count` of each letter, for count 1 to 5
+        self.at_least: dict[str, list[int]] = {}
+        for letter, column in LetterCounts(self.word_lanes).columns.items():
+            self.at_least[letter] = [0] + [
+                int.from_bytes(column.translate(_AT_LEAST_TABLES[count]), "little")
+                for count in range(1, WORD_LENGTH + 1)
+            ]
+
+    def row(self, guess: str) -> bytes:
+        """Calculate the feedback patterns for a guess against every answer.
+
+        :param guess: five-letter upper case guess.
+        :return: one byte per answer, holding the encoded feedback pattern for that answer.
+        """
+        lanes = self.word_lanes.lanes
+        ones = self.word_lanes.all
+        row = 0
+
+        for letter in set(guess):
+            index = LETTERS.index(letter)
+            positions = [position for position, guess_letter in enumerate(guess) if guess_letter == letter]
+            greens = [lanes[position * LETTER_COUNT + index] for position in positions]
+            at_least = self.at_least[letter]
+
+            for position, green in zip(positions, greens, strict=True):
+                row += green * (GREEN * POSITION_WEIGHTS[position])
+
+            # each combination of green positions for this letter decides how many occurrences remain for yellows,
+            # the nth non-green occurrence being yellow if the answer has at least `greens + n` of the letter
+            for combination in range(1 << len(positions)):
+                selected = ones
+                occurrences = 0
+                for offset, green in enumerate(greens):
+                    if combination >> offset & 1:
+                        selected &= green
+                        occurrences += 1
+                    else:
+                        selected &= ones ^ green
+
+                if not selected:
+                    continue
+
+                for offset, position in enumerate(positions):
+                    if not combination >> offset & 1:
+                        occurrences += 1
+                        row += (selected & at_least[occurrences]) * POSITION_WEIGHTS[position]
+
+        return row.to_bytes(self.size, "little")
+
+
+class PatternMatrix:
+    """Memory-mapped matrix of the feedback pattern of every guess against every answer."""
+
+    def __init__(self, words: Sequence[str], mapped: mmap.mmap):
+        """Wrap a memory-mapped pattern matrix file.
+
+        :param words: words used as both the guesses (rows) and the answers (columns) of the matrix.
+        :param mapped: memory map of the pattern matrix file, header included.
+        """
+        magic, version, rows, columns = PATTERN_MATRIX_HEADER.unpack_from(mapped)
+
+        if magic != PATTERN_MATRIX_MAGIC or version != PATTERN_MATRIX_VERSION:
+            raise ValueError(f"Unsupported pattern matrix format (magic={magic!r}, version={version}).")
+
+        if rows != len(words) or columns != len(words):
+            raise ValueError(f"Pattern matrix is {rows}x{columns}, expected {len(words)}x{len(words)}.")
+
+        self.words = words
+        self.size = len(words)
+        self.mapped = mapped
+
+    def row(self, guess_index: int) -> bytes:
+        """Feedback patterns of one guess against every answer.
+
+        :param guess_index: index of the guess in the words.
+        :return: one byte per answer, holding the encoded feedback pattern for that answer.
+        """
+        start = PATTERN_MATRIX_HEADER.size + guess_index * self.size
+        return self.mapped[start : start + self.size]
+
+    def pattern(self, guess_index: int, answer_index: int) -> int:
+        """Feedback pattern of one guess against one answer.
+
+        :param guess_index: index of the guess in the words.
+        :param answer_index: index of the answer in the words.
+        :return: feedback pattern encoded as a base-3 integer.
+        """
+        return self.mapped[PATTERN_MATRIX_HEADER.size + guess_index * self.size + answer_index]
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self.mapped.close()
+
+
+def iter_pattern_rows(words: Sequence[str]) -> Iterator[bytes]:
+    """Calculate the pattern matrix rows of every word as a guess against every word as an answer.
+
+    :param words: words used as both the guesses and the answers.
+    :return: iterator of rows, one per guess in word order.
+    """
+    pattern_rows = PatternRows(words)
+    return (pattern_rows.row(guess) for guess in words)
+
+
+def pattern_matrix_path(words: Sequence[str]) -> Path:
+    """Provide path of the cached pattern matrix for the given words.
+
+    :param words: words used as both the guesses and the answers.
+    :return: path within the cache folder, keyed by a digest of the words.
+    """
+    return cache_path().joinpath(f"wordle-patterns-v{PATTERN_MATRIX_VERSION}-{words_digest(words)}.bin")
+
+
+def build_pattern_matrix(words: Sequence[str], path: Path) -> Path:
+    """Build the pattern matrix for the given words and write it to disk.
+
+    The matrix is written to a temporary file which is moved into place once complete, so a partially
+    written matrix is never mapped.
+
+    :param words: words used as both the guesses and the answers.
+    :param path: path to write the pattern matrix to.
+    :return: path of the written pattern matrix.
+    """
+    logger.info("Building %sx%s wordle pattern matrix at %s", len(words), len(words), path)
+
+    partial_path = path.with_suffix(f".{os.getpid()}.partial")
+    with partial_path.open("wb") as f_open:
+        f_open.write(PATTERN_MATRIX_HEADER.pack(PATTERN_MATRIX_MAGIC, PATTERN_MATRIX_VERSION, len(words), len(words)))
+        for row in iter_pattern_rows(words):
+            f_open.write(row)
+
+    partial_path.replace(path)
+    return path
+
+
+def load_pattern_matrix(words: Sequence[str]) -> PatternMatrix:
+    """Memory-map the cached pattern matrix for the given words, building it first if not yet cached.
+
+    :param words: words used as both the guesses and the answers.
+    :return: the memory-mapped pattern matrix.
+    """
+    path = pattern_matrix_path(words)
+
+    if not path.exists():
+        build_pattern_matrix(words, path)
+
+    with path.open("rb") as f_open:
+        return PatternMatrix(words, mmap.mmap(f_open.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+if __name__ == "__main__":
+    load_pattern_matrix(read_word_list_resource("words_alpha_five_letters.bin")).close()
@@ -0,0 +1,472 @@
+"""Module for ranking wordle guesses by how they split the remaining candidate answers.
+
+Every guess partitions the candidates into buckets, one per feedback pattern the guess could receive. Bucket sizes
+are counted in one pass over the guess's row of feedback patterns, taken from the memory-mapped pattern matrix when
+one is available or calculated for all candidates at once otherwise, and each strategy scores a guess from its
+bucket sizes alone.
+
+Strategies:
+
+* ``entropy`` - highest expected information, in bits, from the feedback.
+* ``minimax`` - smallest worst-case bucket, then the smallest expected bucket.
+
+When only the top few guesses are wanted, entropy ranking evaluates guesses in order of a cheap upper bound on their
+entropy and stops once no remaining guess could make the top, rather than bucketing every guess. Minimax ranking does
+the same in order of a cheap lower bound on the worst case, the size of one bucket counted from letter bitsets.
+
+Large rankings can be split over worker processes, each ranking a contiguous chunk of the guesses and the chunks'
+rankings merged by their sort keys, so the result is the same as ranking in one process. Workers map the same cached
+pattern matrix file, so its pages are shared through the page cache rather than copied into every worker.
+"""
+
+import heapq
+import math
+from bisect import insort
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice, product
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from .wordle_constraints import LETTER_COUNT, LETTERS, WORD_LENGTH, WordLanes
+from .wordle_patterns import PatternMatrix, PatternRows, load_pattern_matrix
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+ENTROPY = "entropy"
+MINIMAX = "minimax"
+RANKING_STRATEGIES = (ENTROPY, MINIMAX)
+
+# sort key of a ranked guess, holding its score first and the guess last
+RankKey = tuple[float, float, bool, int, str]
+
+# translation tables mapping a count byte to the binary digit 1 when it is more than the table's index, otherwise 0
+_MORE_THAN_DIGITS = [
+    bytes(ord("1") if byte > count else ord("0") for byte in range(256)) for count in range(WORD_LENGTH)
+]
+
+# ranker of each pool worker, set up once per worker process by `_init_worker`
+_worker_ranker: "GuessRanker | None" = None
+
+
+def entropy(bucket_sizes: list[int], total: int) -> float:
+    """Calculate the expected information, in bits, from the feedback of a guess.
+
+    :param bucket_sizes: number of candidates receiving each possible feedback pattern.
+    :param total: total number of candidates.
+    :return: expected information gain of the guess.
+    """
+    return math.log2(total) - sum(size * math.log2(size) for size in bucket_sizes) / total
+
+
+def expected_bucket_size(bucket_sizes: list[int], total: int) -> float:
+    """Calculate the expected number of candidates left after the feedback of a guess.
+
+    :param bucket_sizes: number of candidates receiving each possible feedback pattern.
+    :param total: total number of candidates.
+    :return: expected size of the bucket the answer falls into.
+    """
+    return sum(size * size for size in bucket_sizes) / total
+
+
+def letter_bitsets(candidates: Sequence[str]) -> tuple[int, list[dict[str, int]], dict[str, list[int]]]:
+    """Build bitsets of the candidates holding each letter in each position, and holding copies of each letter.
+
+    Bit ``i`` of each bitset is set when candidate ``i`` is in it, so candidates in several bitsets at once are found
+    by AND-ing the bitsets and counted by counting the bits set. Bitsets are packed from the byte lanes of
+    `WordLanes`, one byte per candidate, by translating each lane to a binary digit.
+
+    :param candidates: remaining candidate answers, at least one.
+    :return: bitset of every candidate, bitsets of the candidates holding each letter in each position, and of the
+        candidates holding more than ``n`` copies of each letter at index ``n``, for the letters any candidate holds.
+    """
+    word_lanes = WordLanes(candidates)
+    size = word_lanes.size
+
+    def pack(lanes: int, count: int = 0) -> int:
+        # big-endian, the last candidate's lane is the first and most significant digit
+        return int(lanes.to_bytes(size, "big").translate(_MORE_THAN_DIGITS[count]), 2)
+
+    positions = [
+        {letter: pack(word_lanes.lanes[position * LETTER_COUNT + index]) for index, letter in enumerate(LETTERS)}
+        for position in range(WORD_LENGTH)
+    ]
+
+    copies = {}
+    for index, letter in enumerate(LETTERS):
+        if word_lanes.present[letter]:
+            # a word has one letter per position, so adding the lanes never carries between lanes
+            counts = sum(word_lanes.lanes[position * LETTER_COUNT + index] for position in range(WORD_LENGTH))
+            copies[letter] = [pack(counts, count) for count in range(WORD_LENGTH)]
+
+    return (1 << size) - 1, positions, copies
+
+
+def entropy_bounds(guesses: Sequence[str], candidates: Sequence[str]) -> list[float]:
+    """Calculate an upper bound on the entropy of each guess, without bucketing the candidates.
+
+    The entropy of the whole feedback is at most the sum of the entropies of its parts, one part per letter of the
+    guess. For a letter appearing once in the guess, its part is the state of its position, whose distribution
+    follows directly from how many candidates have the letter in that position and anywhere. A repeated letter's
+    positions are taken together, their states following from which of them a candidate holds the letter in and how
+    many more copies it holds, as only that many of the other positions are yellow, left to right.
+
+    :param guesses: guesses to bound.
+    :param candidates: remaining candidate answers, at least one.
+    :return: upper bound on the expected information of each guess, in bits.
+    """
+    total = len(candidates)
+    max_entropy = math.log2(total)
+    every, positions, copies = letter_bitsets(candidates)
+
+    def part_entropy(sizes: Iterable[int]) -> float:
+        return max_entropy - sum(size * math.log2(size) for size in sizes if size) / total
+
+    position_entropies = [
+        {
+            letter: part_entropy((green, held[0].bit_count() - green, total - held[0].bit_count()))
+            for letter, held in copies.items()
+            for green in [position_letters.get(letter, 0).bit_count()]
+        }
+        for position_letters in positions
+    ]
+
+    repeat_entropies: dict[tuple[str, tuple[int, ...]], float] = {}
+
+    bounds = []
+    for guess in guesses:
+        bound = 0.0
+        for letter in set(guess):
+            # letters in no candidate are grey in every bucket and tell nothing
+            if letter not in copies:
+                continue
+
+            group = tuple(position for position, guess_letter in enumerate(guess) if guess_letter == letter)
+            if len(group) == 1:
+                bound += position_entropies[group[0]][letter]
+            else:
+                if (letter, group) not in repeat_entropies:
+                    holding = [positions[position].get(letter, 0) for position in group]
+                    repeat_entropies[letter, group] = part_entropy(_repeat_sizes(every, holding, copies[letter]))
+                bound += repeat_entropies[letter, group]
+        bounds.append(min(bound, max_entropy))
+
+    return bounds
+
+
+def _repeat_sizes(every: int, holding: list[int], held: list[int]) -> list[int]:
+    """Count the candidates in each state of the positions of a repeated letter, for `entropy_bounds`.
+
+    :param every: bitset of every candidate.
+    :param holding: bitsets of the candidates holding the letter in each of the positions.
+    :param held: bitsets of the candidates holding more than ``n`` copies of the letter at index ``n``.
+    :return: number of candidates in each state.
+    """
+    sizes = []
+    for greens in product((False, True), repeat=len(holding)):
+        selected = every
+        for letter_holding, green in zip(holding, greens, strict=True):
+            selected &= letter_holding if green else ~letter_holding
+        # each copy held beyond the greens makes one more of the other positions yellow
+        found = sum(greens)
+        for yellows in range(len(holding) - found):
+            more = held[found + yellows]
+            sizes.append((selected & ~more).bit_count())
+            selected &= more
+        sizes.append(selected.bit_count())
+
+    return sizes
+
+
+def worst_case_bounds(guesses: Sequence[str], candidates: Sequence[str]) -> list[int]:
+    """Calculate a lower bound on the largest bucket of each guess, without bucketing the candidates.
+
+    The largest bucket is at least as large as any one bucket, and a single bucket is cheap to count from bitsets of
+    the candidates holding each letter in each position and anywhere. The state of a letter appearing once in the
+    guess follows from those alone, so a bucket is built position by position, keeping the state most of the
+    candidates left share. A repeated letter's states depend on each other, so only its all grey state is kept.
+
+    :param guesses: guesses to bound.
+    :param candidates: remaining candidate answers.
+    :return: lower bound on the number of candidates in the largest bucket of each guess.
+    """
+    every, positions, copies = letter_bitsets(candidates)
+
+    bounds = []
+    for guess in guesses:
+        repeated = len(set(guess)) < WORD_LENGTH
+        bucket = every
+        for position, letter in enumerate(guess):
+            holding = copies[letter][0] if letter in copies else 0
+            grey = bucket & ~holding
+            if not holding or (repeated and guess.count(letter) > 1):
+                bucket = grey
+                continue
+
+            # grey, green or yellow, whichever the most candidates left share
+            green = bucket & positions[position].get(letter, 0)
+            yellow = bucket & holding & ~green
+            bucket, size = grey, grey.bit_count()
+            for state in (green, yellow):
+                if state.bit_count() > size:
+                    bucket, size = state, state.bit_count()
+        bounds.append(bucket.bit_count())
+
+    return bounds
+
+
+class GuessRanker:
+    """Ranks guesses against the current candidates using feedback pattern buckets."""
+
+    # rankings bucketing fewer patterns than this are not worth splitting over worker processes
+    parallel_min_patterns: int = 2_000_000
+
+    def __init__(self, words: Sequence[str], pattern_matrix: PatternMatrix | None = None, workers: int = 1):
+        """Initialize the ranker.
+
+        :param words: the dictionary, any guess or candidate must be one of these words.
+        :param pattern_matrix: pattern matrix for the dictionary, patterns are calculated as required without one.
+        :param workers: number of worker processes to split large rankings over, started when first needed.
+        """
+        self.words = words
+        self.word_ids = {word: word_id for word_id, word in enumerate(words)}
+        self.pattern_matrix = pattern_matrix
+        self.workers = workers
+        self._executor: Executor | None = None
+
+    def bucket_sizes(self, guesses: Iterable[str], candidates: Sequence[str]) -> Iterator[tuple[str, list[int]]]:
+        """Count how many candidates receive each feedback pattern, for each guess.
+
+        Guesses are bucketed lazily, one at a time as the iterator is consumed.
+
+        :param guesses: guesses to bucket the candidates for.
+        :param candidates: remaining candidate answers.
+        :return: iterator of each guess and its non-empty bucket sizes.
+        """
+        if self.pattern_matrix is not None and len(candidates) > 1:
+            # gather the candidate columns from each matrix row
+            columns = itemgetter(*[self.word_ids[candidate] for candidate in candidates])
+            row = self.pattern_matrix.row
+            for guess in guesses:
+                yield guess, list(Counter(columns(row(self.word_ids[guess]))).values())
+        else:
+            pattern_rows = PatternRows(candidates)
+            for guess in guesses:
+                yield guess, list(Counter(pattern_rows.row(guess)).values())
+
+    def rank(
+        self, strategy: str, guesses: Sequence[str], candidates: Sequence[str], top: int | None = None
+    ) -> list[tuple[str, float]]:
+        """Rank guesses by the given strategy, best first.
+
+        Guesses scoring the same are ordered with possible answers first, then in the order given.
+
+        :param strategy: ranking strategy, ``entropy`` for expected information gain or ``minimax`` for the
+            smallest worst-case bucket.
+        :param guesses: guesses to rank.
+        :param candidates: remaining candidate answers.
+        :param top: number of best guesses to return, every guess is ranked when not given.
+        :return: ordered list of tuples containing guesses and their scores, the expected information for
+            ``entropy`` and the worst-case bucket size for ``minimax``.
+        """
+        if strategy not in RANKING_STRATEGIES:
+            raise ValueError(f"Unknown ranking strategy {strategy}.")
+
+        if not candidates or top == 0:
+            return []
+
+        if self.workers > 1 and len(guesses) * len(candidates) >= self.parallel_min_patterns:
+            ranked = self._parallel_rank_keys(strategy, guesses, candidates, top)
+        else:
+            ranked = self.rank_keys(strategy, guesses, candidates, top)
+
+        if strategy == ENTROPY:
+            return [(guess, round(-score, 4)) for score, _, _, _, guess in ranked]
+
+        return [(guess, score) for score, _, _, _, guess in ranked]
+
+    def rank_keys(
+        self,
+        strategy: str,
+        guesses: Sequence[str],
+        candidates: Sequence[str],
+        top: int | None = None,
+        first_order: int = 0,
+    ) -> list[RankKey]:
+        """Rank guesses by the given strategy into their sort keys, best first.
+
+        :param strategy: ranking strategy, ``entropy`` or ``minimax``.
+        :param guesses: guesses to rank.
+        :param candidates: remaining candidate answers, at least one.
+        :param top: number of best guesses to return, every guess is ranked when not given.
+        :param first_order: position of the first guess in the order given, for guesses ranked in chunks.
+        :return: sort keys of the ranked guesses, holding the negated entropy or the worst-case bucket size first
+            and the guess last.
+        """
+        if strategy == ENTROPY:
+            if top is None:
+                return sorted(self._entropy_keys(enumerate(guesses, start=first_order), candidates))
+            return self._top_entropy_keys(guesses, candidates, top, first_order)
+
+        if top is not None:
+            return self._top_minimax_keys(guesses, candidates, top, first_order)
+
+        return sorted(self._minimax_keys(enumerate(guesses, start=first_order), candidates))
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _parallel_rank_keys(
+        self, strategy: str, guesses: Sequence[str], candidates: Sequence[str], top: int | None
+    ) -> list[RankKey]:
+        """Rank chunks of the guesses in the worker processes and merge their sort keys.
+
+        Each chunk keeps its top guesses, which hold the overall top as every guess belongs to one chunk.
+
+        :param strategy: ranking strategy, ``entropy`` or ``minimax``.
+        :param guesses: guesses to rank.
+        :param candidates: remaining candidate answers, at least one.
+        :param top: number of best guesses to return, every guess is ranked when not given.
+        :return: sort keys of the ranked guesses, best first.
+        """
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.words,))
+
+        # a few chunks per worker evens out chunks that prune sooner than others
+        chunk_size = -(-len(guesses) // (self.workers * 4))
+        futures = [
+            self._executor.submit(_rank_chunk, strategy, guesses[start : start + chunk_size], candidates, top, start)
+            for start in range(0, len(guesses), chunk_size)
+        ]
+
+        merged = heapq.merge(*(future.result() for future in futures))
+        return list(merged) if top is None else list(islice(merged, top))
+
+    def _entropy_keys(self, ordered_guesses: Iterable[tuple[int, str]], candidates: Sequence[str]) -> Iterator[RankKey]:
+        """Bucket guesses lazily into their entropy sort keys, best sorting first.
+
+        :param ordered_guesses: guesses and their position in the given order, to break ties.
+        :param candidates: remaining candidate answers.
+        :return: iterator of sort keys, holding the negated entropy and the guess last.
+        """
+        total = len(candidates)
+        candidate_set = set(candidates)
+        guess_orders: dict[str, int] = {}
+
+        def guesses() -> Iterator[str]:
+            for guess_order, guess in ordered_guesses:
+                guess_orders[guess] = guess_order
+                yield guess
+
+        for guess, sizes in self.bucket_sizes(guesses(), candidates):
+            yield -entropy(sizes, total), 0.0, guess not in candidate_set, guess_orders[guess], guess
+
+    def _top_entropy_keys(
+        self, guesses: Sequence[str], candidates: Sequence[str], top: int, first_order: int = 0
+    ) -> list[RankKey]:
+        """Find the sort keys of the top guesses by entropy, bucketing as few guesses as possible.
+
+        Guesses are bucketed in order of their entropy upper bound, stopping once the bound falls below the entropy
+        of every one of the top guesses found so far.
+
+        :param guesses: guesses to rank.
+        :param candidates: remaining candidate answers.
+        :param top: number of best guesses to find.
+        :param first_order: position of the first guess in the order given.
+        :return: sort keys of the top guesses, best first.
+        """
+        bounds = entropy_bounds(guesses, candidates)
+        by_bound = sorted(range(len(guesses)), key=lambda guess_order: -bounds[guess_order])
+        ordered_guesses = ((first_order + guess_order, guesses[guess_order]) for guess_order in by_bound)
+
+        best: list[RankKey] = []
+        for index, key in enumerate(self._entropy_keys(ordered_guesses, candidates), start=1):
+            insort(best, key)
+            del best[top:]
+
+            # the tolerance keeps a guess whose bound is exactly its entropy, give or take rounding, in the running
+            if len(best) == top and index < len(by_bound) and bounds[by_bound[index]] < -best[-1][0] - 1e-9:
+                break
+
+        return best
+
+    def _minimax_keys(self, ordered_guesses: Iterable[tuple[int, str]], candidates: Sequence[str]) -> Iterator[RankKey]:
+        """Bucket guesses lazily into their minimax sort keys, best sorting first.
+
+        :param ordered_guesses: guesses and their position in the given order, to break ties.
+        :param candidates: remaining candidate answers.
+        :return: iterator of sort keys, holding the worst-case bucket size, the expected bucket size and the guess last.
+        """
+        total = len(candidates)
+        candidate_set = set(candidates)
+        guess_orders: dict[str, int] = {}
+
+        def guesses() -> Iterator[str]:
+            for guess_order, guess in ordered_guesses:
+                guess_orders[guess] = guess_order
+                yield guess
+
+        for guess, sizes in self.bucket_sizes(guesses(), candidates):
+            yield max(sizes), expected_bucket_size(sizes, total), guess not in candidate_set, guess_orders[guess], guess
+
+    def _top_minimax_keys(
+        self, guesses: Sequence[str], candidates: Sequence[str], top: int, first_order: int = 0
+    ) -> list[RankKey]:
+        """Find the sort keys of the top guesses by minimax, bucketing as few guesses as possible.
+
+        Guesses are bucketed in order of a lower bound on their worst case, stopping once the bound is larger than the
+        worst case of every one of the top guesses found so far.
+
+        :param guesses: guesses to rank.
+        :param candidates: remaining candidate answers.
+        :param top: number of best guesses to find.
+        :param first_order: position of the first guess in the order given.
+        :return: sort keys of the top guesses, best first.
+        """
+        bounds = worst_case_bounds(guesses, candidates)
+        by_bound = sorted(range(len(guesses)), key=bounds.__getitem__)
+        ordered_guesses = ((first_order + guess_order, guesses[guess_order]) for guess_order in by_bound)
+
+        best: list[RankKey] = []
+        for index, key in enumerate(self._minimax_keys(ordered_guesses, candidates), start=1):
+            insort(best, key)
+            del best[top:]
+
+            # a guess whose bound equals the worst case may still have a smaller expected bucket
+            if len(best) == top and index < len(by_bound) and bounds[by_bound[index]] > best[-1][0]:
+                break
+
+        return best
+
+
+def _init_worker(words: Sequence[str]) -> None:
+    """Set up the ranker of a pool worker process, mapping the cached pattern matrix of the words.
+
+    :param words: the dictionary.
+    """
+    global _worker_ranker
+    _worker_ranker = GuessRanker(words, load_pattern_matrix(words))
+
+
+def _rank_chunk(
+    strategy: str, guesses: Sequence[str], candidates: Sequence[str], top: int | None, first_order: int
+) -> list[RankKey]:
+    """Rank a chunk of guesses into their sort keys in a pool worker process.
+
+    :param strategy: ranking strategy, ``entropy`` or ``minimax``.
+    :param guesses: chunk of the guesses to rank.
+    :param candidates: remaining candidate answers, at least one.
+    :param top: number of best guesses to return, every guess is ranked when not given.
+    :param first_order: position of the first guess of the chunk in the order given.
+    :return: sort keys of the ranked guesses, best first.
+    """
+    if _worker_ranker is None:
+        raise RuntimeError("Ranking worker has not been initialised.")
+
+    return _worker_ranker.rank_keys(strategy, guesses, candidates, top, first_order)
@@ -0,0 +1,81 @@
+"""Module for scoring wordle words by the distribution of letters over a dictionary.
+
+A word scores the number of times each of its letters appears across the dictionary, with each repeat of a letter
+within the word scoring a decayed share of that letter's count.
+
+Words are held as a words x letters matrix of letter counts, one byte column per letter with one byte per word, built
+from the `WordLanes` bitsets without a python loop per word. The distribution is then the sum of each column, and the
+scores of every word are built column by column from a table of the score of each letter count, rather than scoring
+one word at a time.
+"""
+
+from collections.abc import Mapping
+from operator import add
+
+from .wordle_constraints import LETTER_COUNT, LETTERS, WORD_LENGTH, WordLanes
+
+# share of a letter's distribution count scored by its first, second, third, fourth and fifth occurrence in a word
+SCORE_DECAY = (1.0, 0.5, 0.25, 0.125, 0.0675)
+
+
+def letter_score(count: int, occurrence: int) -> int:
+    """Score one occurrence of a letter in a word.
+
+    :param count: occurrence count of the letter in the distribution.
+    :param occurrence: zero-indexed occurrence of the letter within the word.
+    :return: score of the occurrence.
+    """
+    return int(round(count * SCORE_DECAY[occurrence], 0))
+
+
+def letter_score_table(count: int) -> list[int]:
+    """Total the scores of a letter appearing from zero to five times in a word.
+
+    :param count: occurrence count of the letter in the distribution.
+    :return: total score of a word holding the letter ``n`` times, at index ``n``.
+    """
+    table = [0]
+    for occurrence in range(WORD_LENGTH):
+        table.append(table[-1] + letter_score(count, occurrence))
+
+    return table
+
+
+class LetterCounts:
+    """Words transposed into a matrix of letter counts, one column per letter."""
+
+    def __init__(self, word_lanes: WordLanes):
+        """Build the letter count columns.
+
+        :param word_lanes: bitsets of the words, byte ``i`` of every column refers to ``word_lanes.words[i]``.
+        """
+        self.words = word_lanes.words
+        self.size = word_lanes.size
+
+        # lanes never overflow a byte as a word has at most five of any letter
+        self.columns: dict[str, bytes] = {
+            letter: sum(word_lanes.lanes[position * LETTER_COUNT + index] for position in range(WORD_LENGTH)).to_bytes(
+                self.size, "little"
+            )
+            for index, letter in enumerate(LETTERS)
+        }
+
+    def distribution(self) -> dict[str, int]:
+        """Count the occurrences of every letter across the words.
+
+        :return: dictionary containing all letters and their occurrence count.
+        """
+        return {letter: sum(column) for letter, column in self.columns.items()}
+
+    def scores(self, distribution: Mapping[str, int]) -> list[int]:
+        """Score every word based on the distribution of letters provided.
+
+        :param distribution: dictionary containing letters and their occurrence count.
+        :return: score of each word, in word order.
+        """
+        scores = [0] * self.size
+        for letter, column in self.columns.items():
+            table = letter_score_table(distribution.get(letter, 0))
+            scores = list(map(add, scores, map(table.__getitem__, column)))
+
+        return scores
@@ -0,0 +1,262 @@
+"""Module answering wordle solver requests for the solver server.
+
+A request is a JSON object describing a game state, as letter information, a history of guesses and their feedback,
+or both::
+
+    {"greens": [["A", 3]], "yellows": [["N", [2]]], "greys": ["S", "R"],
+     "history": [["CRANE", "..gy."]], "strategy": "entropy", "limit": 10}
+
+Every field is optional. The response holds the number of candidates left, the candidates themselves up to
+``limit``, and the suggested guesses ranked by the strategy, also up to ``limit``.
+
+Each worker process holds one solver, loaded when the worker starts, and resets it for every request so the
+dictionary, bitsets, index and pattern matrix stay warm between requests.
+
+Responses are cached by game state in each worker, and optionally in a file shared by every worker that survives
+restarts. States are put in a canonical form first, so requests giving the same letters in a different order, in a
+different case or with a yellow letter split over several entries share a cached response.
+
+A ``{"stats": true}`` request is answered with the process id and cache counters of the worker answering it,
+rather than solved. Each worker process also logs its cache counters as it exits, when its pool shuts down.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import Any
+
+from ..common.cache import StateCache, StateStore
+from .wordle import SCORE, STRATEGIES, WordleSolver
+from .wordle_patterns import parse_pattern
+
+logger = logging.getLogger("WordleService")
+
+DEFAULT_LIMIT = 10
+DEFAULT_CACHE_SIZE = 4096
+
+# solver and response cache of each worker process, set up once per process by `init_worker`
+_worker_solver: WordleSolver | None = None
+_worker_cache: StateCache | None = None
+
+GameState = tuple[list[tuple[str, int]], list[tuple[str, list[int]]], list[str], list[tuple[str, int]]]
+
+
+def init_worker(
+    words: list[str] | None = None, cache_size: int = DEFAULT_CACHE_SIZE, cache_file: str | None = None
+) -> WordleSolver:
+    """Load the solver and response cache of a worker process.
+
+    :param words: dictionary to solve with, defaults to the bundled dictionary.
+    :param cache_size: most responses cached in memory by the worker.
+    :param cache_file: path of a SQLite file to also cache responses in, shared by every worker.
+    :return: the loaded solver.
+    """
+    global _worker_solver, _worker_cache
+    _worker_solver = WordleSolver([], [], [])
+
+    if words is not None:
+        _worker_solver.dictionary = words
+
+    # responses in a shared file are only valid for the word list they were solved with
+    store = None if cache_file is None else StateStore(Path(cache_file), _worker_solver.word_list.digest)
+    _worker_cache = StateCache(cache_size, store)
+
+    # worker processes exit without returning to the caller, so log the counters as the process exits
+    if multiprocessing.parent_process() is not None:
+        Finalize(None, log_cache_stats, exitpriority=0)
+
+    return _worker_solver
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Answer a request using the solver and response cache of this worker process, loading them first if needed.
+
+    :param request: decoded JSON request, or ``{"stats": true}`` for the cache counters of this worker.
+    :return: response to encode as JSON.
+    """
+    if request.get("stats") is True:
+        return {"worker": os.getpid(), "cache": cache_stats()}
+
+    solver = _worker_solver or init_worker()
+    return solve(solver, request, _worker_cache)
+
+
+def cache_stats() -> dict[str, int]:
+    """Count the lookups and evictions of the response cache of this worker process.
+
+    :return: cache counters, all zero before the worker is loaded.
+    """
+    return (_worker_cache or StateCache()).stats()
+
+
+def log_cache_stats() -> None:
+    """Log the counters of the response cache of this worker process."""
+    logger.info("Worker %s response cache: %s", os.getpid(), json.dumps(cache_stats()))
+
+
+def canonical_state(
+    greens: list[tuple[str, int]],
+    yellows: list[tuple[str, list[int]]],
+    greys: list[str],
+    history: list[tuple[str, int]],
+) -> GameState:
+    """Put a game state into canonical form, so equivalent states are equal.
+
+    Letters are sorted and duplicates dropped, and the positions of a yellow letter given more than once are merged,
+    as the solver reads them all the same. History is kept in the order guessed.
+
+    :param greens: upper case letters and their known one-indexed positions.
+    :param yellows: upper case letters and the one-indexed positions they are known not to be in.
+    :param greys: upper case letters known not to be in the word.
+    :param history: upper case guesses and their encoded feedback patterns.
+    :return: the canonical greens, yellows, greys and history.
+    """
+    yellow_positions: dict[str, set[int]] = {}
+    for yellow, positions in yellows:
+        yellow_positions.setdefault(yellow, set()).update(positions)
+
+    return (
+        sorted(set(greens)),
+        [(yellow, sorted(positions)) for yellow, positions in sorted(yellow_positions.items())],
+        sorted(set(greys)),
+        list(history),
+    )
+
+
+def solve(solver: WordleSolver, request: dict[str, Any], cache: StateCache | None = None) -> dict[str, Any]:
+    """Answer a request with the given solver, replacing any game state it held.
+
+    :param solver: solver to answer with.
+    :param request: decoded JSON request.
+    :param cache: cache of responses by canonical game state, to answer repeated states from.
+    :return: response to encode as JSON.
+    """
+    strategy = request.get("strategy", SCORE)
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Strategy must be one of {', '.join(STRATEGIES)}. Input {strategy} is invalid.")
+
+    limit = request.get("limit", DEFAULT_LIMIT)
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+        raise ValueError(f"Limit must be a positive integer. Input {limit} is invalid.")
+
+    greens, yellows, greys, history = canonical_state(
+        [_parse_green(green) for green in _list_field(request, "greens")],
+        [_parse_yellow(yellow) for yellow in _list_field(request, "yellows")],
+        [_parse_grey(grey) for grey in _list_field(request, "greys")],
+        [_parse_turn(turn) for turn in _list_field(request, "history")],
+    )
+
+    key = json.dumps([greens, yellows, greys, history, strategy, limit], separators=(",", ":"))
+    if cache is not None and (cached := cache.get(key)) is not None:
+        logger.debug("Response for %s answered from the cache", key)
+        return dict(cached)
+
+    solver.reset()
+    solver.add_letters(greens, yellows, greys)
+    for guess, pattern in history:
+        solver.apply_feedback(guess, pattern)
+
+    candidates = solver.candidates
+    response = {
+        "strategy": strategy,
+        "candidate_count": len(candidates),
+        "candidates": candidates[:limit],
+        "suggestions": [[word, score] for word, score in solver.suggestions(strategy, top=limit)],
+    }
+
+    if cache is not None:
+        cache.put(key, response)
+
+    return dict(response)
+
+
+def _list_field(request: dict[str, Any], field: str) -> list[Any]:
+    """Get a field of the request that must be a list, defaulting to empty.
+
+    :param request: decoded JSON request.
+    :param field: name of the field.
+    :return: value of the field.
+    """
+    value = request.get(field, [])
+    if not isinstance(value, list):
+        raise ValueError(f"Field {field} must be a list. Input {value} is invalid.")
+
+    return value
+
+
+def _is_letter(value: Any) -> bool:
+    """Check a value is a single letter.
+
+    :param value: value to check.
+    :return: True if value is a single letter, False otherwise.
+    """
+    return isinstance(value, str) and len(value) == 1 and value.upper() in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _is_position(value: Any) -> bool:
+    """Check a value is a one-indexed wordle position.
+
+    :param value: value to check.
+    :return: True if value is a number from 1-5, False otherwise.
+    """
+    return isinstance(value, int) and not isinstance(value, bool) and 1 <= value <= 5
+
+
+def _parse_green(value: Any) -> tuple[str, int]:
+    """Validate and parse a green letter from a request.
+
+    :param value: a letter and its position, e.g. ``["A", 3]``.
+    :return: Validated green letter and position
+    """
+    if not isinstance(value, list) or len(value) != 2 or not _is_letter(value[0]) or not _is_position(value[1]):
+        raise ValueError(f"Each green letter must be a letter and a number from 1-5. Input {value} is invalid.")
+
+    return value[0].upper(), value[1]
+
+
+def _parse_yellow(value: Any) -> tuple[str, list[int]]:
+    """Validate and parse a yellow letter from a request.
+
+    :param value: a letter and the positions it is not in, e.g. ``["N", [2, 4]]``.
+    :return: Validated yellow letter and non-positions
+    """
+    if (
+        not isinstance(value, list)
+        or len(value) != 2
+        or not _is_letter(value[0])
+        or not isinstance(value[1], list)
+        or not 1 <= len(value[1]) <= 4
+        or not all(_is_position(position) for position in value[1])
+    ):
+        raise ValueError(
+            f"Each yellow letter must be a letter and a list of one to four numbers from 1-5. Input {value} is invalid."
+        )
+
+    return value[0].upper(), list(value[1])
+
+
+def _parse_grey(value: Any) -> str:
+    """Validate and parse a grey letter from a request.
+
+    :param value: a single letter.
+    :return: Validated grey letter
+    """
+    if not _is_letter(value):
+        raise ValueError(f"Each grey letter must be a single letter. Input {value} is invalid.")
+
+    return str(value).upper()
+
+
+def _parse_turn(value: Any) -> tuple[str, int]:
+    """Validate and parse a guess and its feedback from the history of a request.
+
+    :param value: a guess and its feedback, e.g. ``["CRANE", "..gy."]``.
+    :return: upper case guess and encoded feedback pattern, the guess is validated by the solver
+    """
+    if not isinstance(value, list) or len(value) != 2 or not all(isinstance(part, str) for part in value):
+        raise ValueError(f"Each history entry must be a guess and its feedback. Input {value} is invalid.")
+
+    return value[0].upper(), parse_pattern(value[1])
@@ -0,0 +1,222 @@
+"""Module for simulating whole games of wordle to measure how well a guessing strategy plays.
+
+A simulation plays one game against every answer given, choosing each guess with the strategy and narrowing the
+candidates by the feedback received, until the answer is guessed. Games are independent, so they are spread across a
+process pool. Each worker loads the dictionary once and memory-maps the cached pattern matrix, so the matrix pages
+are shared between workers through the page cache rather than calculated or copied per worker.
+"""
+
+import logging
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from .wordle import SCORE, STRATEGIES, TREE
+from .wordle_constraints import WordLanes
+from .wordle_patterns import PatternMatrix, load_pattern_matrix
+from .wordle_ranking import GuessRanker
+from .wordle_scores import LetterCounts
+from .wordle_tree import read_decision_tree_resource
+
+logger = logging.getLogger("WordleSolver")
+
+MAX_GUESSES = 6
+
+# simulator of each pool worker, set up once per worker process by `_init_worker`
+_worker_simulator: "WordleSimulator | None" = None
+
+
+class WordleSimulator:
+    """Plays games of wordle with a fixed strategy and opening guess."""
+
+    def __init__(self, words: list[str], strategy: str, opener: str | None, pattern_matrix: PatternMatrix):
+        """Initialize the simulator.
+
+        :param words: the dictionary, used as both the possible guesses and the possible answers.
+        :param strategy: strategy choosing each guess, one of ``score``, ``entropy``, ``minimax`` or ``tree``.
+        :param opener: first guess of every game, defaults to the highest scoring word in the dictionary, or the
+            tree's opener for ``tree``.
+        :param pattern_matrix: pattern matrix for the dictionary.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown ranking strategy {strategy}.")
+
+        self.words = words
+        self.word_ids = {word: word_id for word_id, word in enumerate(words)}
+        self.strategy = strategy
+        self.pattern_matrix = pattern_matrix
+        self.guess_ranker = GuessRanker(words, pattern_matrix)
+
+        # letter distribution scores never change between games, score every word once
+        letter_counts = LetterCounts(WordLanes(words))
+        self.scores = letter_counts.scores(letter_counts.distribution())
+
+        # the decision tree holds every guess of its games already, opening with its own opener
+        self.decision_tree = read_decision_tree_resource(words) if strategy == TREE else None
+        if self.decision_tree is not None:
+            if opener is not None and opener.upper() != self.decision_tree.opener:
+                raise ValueError(
+                    f"The decision tree opens with {self.decision_tree.opener}. Input {opener} is invalid."
+                )
+            opener = self.decision_tree.opener
+
+        if opener is None:
+            opener = words[max(range(len(words)), key=self.scores.__getitem__)]
+
+        if opener.upper() not in self.word_ids:
+            raise ValueError(f"Opener {opener} is not in the dictionary.")
+
+        self.opener = opener.upper()
+
+        # the candidates, and so the next guess, depend only on the feedback received so far, so games sharing
+        # the same feedback history share their guesses rather than ranking the same candidates again
+        self._next_guesses: dict[tuple[int, ...], int] = {}
+
+    def next_guess(self, candidates: list[int], history: tuple[int, ...] = ()) -> int:
+        """Choose the next guess from the remaining candidates.
+
+        :param candidates: ids of the remaining candidate answers, in dictionary order.
+        :param history: feedback received so far, only used by ``tree``.
+        :return: id of the word to guess.
+        """
+        if self.decision_tree is not None:
+            node = self.decision_tree.walk(history)
+            if node is None:
+                raise ValueError("Feedback left the decision tree, it was built for a different opener or strategy.")
+            return self.decision_tree.guesses[node]
+
+        if self.strategy == SCORE:
+            return max(candidates, key=self.scores.__getitem__)
+
+        words = self.words
+        candidate_words = [words[candidate] for candidate in candidates]
+        guess, _ = self.guess_ranker.rank(self.strategy, candidate_words, candidate_words, top=1)[0]
+        return self.word_ids[guess]
+
+    def play(self, answer: str) -> list[str]:
+        """Play one game against the given answer.
+
+        Every guess is one of the remaining candidates, so each guess either wins or rules itself out and the
+        game always ends.
+
+        :param answer: hidden answer, must be in the dictionary.
+        :return: guesses made, the last being the answer.
+        """
+        answer_id = self.word_ids[answer]
+        candidates = list(range(len(self.words)))
+        guess = self.word_ids[self.opener]
+        guesses = [guess]
+        history: tuple[int, ...] = ()
+
+        while guess != answer_id:
+            row = self.pattern_matrix.row(guess)
+            pattern = row[answer_id]
+            candidates = [candidate for candidate in candidates if row[candidate] == pattern]
+            history += (pattern,)
+
+            guess = self._next_guesses.get(history, -1)
+            if guess < 0:
+                guess = self._next_guesses[history] = self.next_guess(candidates, history)
+            guesses.append(guess)
+
+        return [self.words[guess] for guess in guesses]
+
+
+class SimulationResult:
+    """Outcome of a simulation."""
+
+    def __init__(self, strategy: str, opener: str, guess_counts: list[int], seconds: float):
+        """Summarise the games played.
+
+        :param strategy: strategy used to choose each guess.
+        :param opener: first guess of every game.
+        :param guess_counts: number of guesses taken to win each game.
+        :param seconds: wall clock time taken to play every game.
+        """
+        self.strategy = strategy
+        self.opener = opener
+        self.games = len(guess_counts)
+        self.distribution = dict(sorted(Counter(guess_counts).items()))
+        self.failures = sum(1 for count in guess_counts if count > MAX_GUESSES)
+        self.mean_guesses = sum(guess_counts) / self.games if self.games else 0.0
+        self.seconds = seconds
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of games taking more than six guesses."""
+        return self.failures / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Games played per second of wall clock time."""
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+def _init_worker(words: list[str], strategy: str, opener: str) -> None:
+    """Set up the simulator of a pool worker process.
+
+    :param words: the dictionary.
+    :param strategy: strategy choosing each guess.
+    :param opener: first guess of every game.
+    """
+    global _worker_simulator
+    _worker_simulator = WordleSimulator(words, strategy, opener, load_pattern_matrix(words))
+
+
+def _play_game(answer: str) -> int:
+    """Play one game in a pool worker process.
+
+    :param answer: hidden answer.
+    :return: number of guesses taken.
+    """
+    if _worker_simulator is None:
+        raise RuntimeError("Simulation worker has not been initialised.")
+
+    return len(_worker_simulator.play(answer))
+
+
+def simulate(
+    words: list[str],
+    strategy: str = SCORE,
+    opener: str | None = None,
+    answers: list[str] | None = None,
+    workers: int | None = None,
+) -> SimulationResult:
+    """Play a game against every answer and summarise how the strategy performed.
+
+    :param words: the dictionary, used as both the possible guesses and the possible answers.
+    :param strategy: strategy choosing each guess, one of ``score``, ``entropy``, ``minimax`` or ``tree``.
+    :param opener: first guess of every game, defaults to the highest scoring word in the dictionary, or the tree's
+        opener for ``tree``.
+    :param answers: answers to play against, defaults to every word in the dictionary.
+    :param workers: number of worker processes, defaults to the number of CPUs. ``1`` plays every game in
+        this process.
+    :return: summary of the games played.
+    """
+    start = time.perf_counter()
+
+    # building the simulator here validates the arguments and builds the cached pattern matrix once,
+    # before any worker maps it
+    simulator = WordleSimulator(words, strategy, opener, load_pattern_matrix(words))
+    answers = words if answers is None else [answer.upper() for answer in answers]
+    workers = workers or os.cpu_count() or 1
+
+    missing = [answer for answer in answers if answer not in simulator.word_ids]
+    if missing:
+        raise ValueError(f"Answers {', '.join(missing[:5])} are not in the dictionary.")
+
+    logger.info("Simulating %s games with the %s strategy opening %s", len(answers), strategy, simulator.opener)
+
+    if workers == 1:
+        guess_counts = [len(simulator.play(answer)) for answer in answers]
+    else:
+        # several chunks per worker keeps workers busy when some games take longer than others
+        chunksize = max(1, len(answers) // (workers * 8))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(words, strategy, simulator.opener)
+        ) as executor:
+            guess_counts = list(executor.map(_play_game, answers, chunksize=chunksize))
+
+    simulator.pattern_matrix.close()
+    return SimulationResult(strategy, simulator.opener, guess_counts, time.perf_counter() - start)
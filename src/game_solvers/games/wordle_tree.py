@@ -0,0 +1,365 @@
+"""Module for precomputed wordle decision trees.
+
+A decision tree holds the whole strategy for a fixed opening guess: each node is a game state, holding the guess to
+make and how many answers are still possible, with one edge per feedback pattern that guess could receive leading
+to the next state. Playing from the tree needs no filtering or ranking, only following the edge for each feedback.
+
+Trees are built offline, by choosing each guess with a strategy from the answers still possible just as a simulated
+game does, and compiled into the resources folder. Every state below the opener is independent of its siblings, so
+the subtrees under the opener's feedback patterns are built in a process pool.
+
+Layout of a compiled decision tree, all integers little-endian::
+
+    magic (4 bytes) | version (uint16) | words digest (16 bytes) | node count (uint32) | edge count (uint32)
+    | node guesses (uint32 per node) | node answers (uint32 per node) | node edge starts (uint32 per node, plus one)
+    | edge patterns (uint8 per edge) | edge children (uint32 per edge)
+
+Node 0 is the opener. The edges of node ``n`` are ``edge starts[n]`` up to ``edge starts[n + 1]``, ordered by
+pattern, so the edge for a pattern is found by bisecting the few edges of one node.
+"""
+
+import logging
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..common.resources import map_data_resource, resources_path
+from ..common.wordlist import read_word_list_resource, words_digest
+from .wordle_patterns import ALL_GREEN, load_pattern_matrix
+from .wordle_ranking import ENTROPY
+
+if TYPE_CHECKING:
+    from .wordle_simulation import WordleSimulator
+
+logger = logging.getLogger("WordleSolver")
+
+DECISION_TREE_MAGIC = b"GSDT"
+DECISION_TREE_VERSION = 1
+DECISION_TREE_HEADER = struct.Struct("<4sH16sII")
+DECISION_TREE_RESOURCE = "wordle_decision_tree.bin"
+
+# a node under construction, as its guess id, number of answers and (pattern, child node index) edges
+Node = tuple[int, int, list[tuple[int, int]]]
+
+# simulator of each pool worker, set up once per worker process by `_init_worker`
+_worker_simulator: "WordleSimulator | None" = None
+
+
+class DecisionTree:
+    """Precomputed guesses for every game state reachable from a fixed opening guess."""
+
+    def __init__(
+        self,
+        words: Sequence[str],
+        guesses: "array[int]",
+        answers: "array[int]",
+        edge_starts: "array[int]",
+        edge_patterns: bytes,
+        edge_children: "array[int]",
+    ):
+        """Wrap the node and edge tables of a decision tree.
+
+        :param words: the dictionary, guesses are indexes into these words.
+        :param guesses: word id of the guess to make at each node.
+        :param answers: number of answers still possible at each node.
+        :param edge_starts: index of the first edge of each node, followed by the total number of edges.
+        :param edge_patterns: feedback pattern of each edge, ordered by pattern within each node.
+        :param edge_children: node each edge leads to.
+        """
+        self.words = words
+        self.guesses = guesses
+        self.answers = answers
+        self.edge_starts = edge_starts
+        self.edge_patterns = edge_patterns
+        self.edge_children = edge_children
+
+    @property
+    def opener(self) -> str:
+        """First guess of every game played from the tree."""
+        return self.words[self.guesses[0]]
+
+    def guess(self, node: int) -> str:
+        """Guess to make at a node.
+
+        :param node: index of the node.
+        :return: the guess.
+        """
+        return self.words[self.guesses[node]]
+
+    def child(self, node: int, pattern: int) -> int | None:
+        """Follow the edge for a feedback pattern from a node.
+
+        :param node: index of the node.
+        :param pattern: feedback received for the node's guess.
+        :return: index of the next node, or None if no answer still possible gives that feedback.
+        """
+        start, end = self.edge_starts[node], self.edge_starts[node + 1]
+        edge = bisect_left(self.edge_patterns, pattern, start, end)
+
+        if edge == end or self.edge_patterns[edge] != pattern:
+            return None
+
+        return self.edge_children[edge]
+
+    def walk(self, patterns: Iterable[int]) -> int | None:
+        """Follow the feedback received for each guess of the tree from the opener.
+
+        :param patterns: feedback received for each guess, in the order guessed.
+        :return: index of the node reached, or None if the feedback leaves the tree.
+        """
+        node: int | None = 0
+        for pattern in patterns:
+            if node is None:
+                break
+            node = self.child(node, pattern)
+
+        return node
+
+    def follow(self, history: Iterable[tuple[str, int]]) -> int | None:
+        """Follow the guesses made and the feedback received from the opener.
+
+        :param history: guesses made and their feedback, in the order guessed.
+        :return: index of the node reached, or None if a guess is not the tree's guess or the feedback leaves
+            the tree.
+        """
+        node: int | None = 0
+        for guess, pattern in history:
+            if node is None or self.guess(node) != guess:
+                return None
+            node = self.child(node, pattern)
+
+        return node
+
+
+def _buckets(row: bytes, candidates: Iterable[int]) -> dict[int, list[int]]:
+    """Group candidates by the feedback they give, leaving out the candidate guessed.
+
+    :param row: pattern matrix row of the guess.
+    :param candidates: ids of the candidates.
+    :return: candidate ids for each feedback pattern, ordered by pattern.
+    """
+    buckets: dict[int, list[int]] = {}
+    for candidate in candidates:
+        pattern = row[candidate]
+        if pattern != ALL_GREEN:
+            buckets.setdefault(pattern, []).append(candidate)
+
+    return dict(sorted(buckets.items()))
+
+
+def _build_subtree(simulator: "WordleSimulator", candidates: list[int]) -> list[Node]:
+    """Build the tree for the given candidates, choosing each guess with the simulator's strategy.
+
+    :param simulator: simulator choosing each guess.
+    :param candidates: ids of the answers still possible, in dictionary order.
+    :return: nodes of the tree, the first being its root.
+    """
+    nodes: list[Node] = []
+
+    def add_node(candidates: list[int]) -> int:
+        index = len(nodes)
+        guess = simulator.next_guess(candidates)
+        nodes.append((guess, len(candidates), []))
+
+        for pattern, bucket in _buckets(simulator.pattern_matrix.row(guess), candidates).items():
+            nodes[index][2].append((pattern, add_node(bucket)))
+
+        return index
+
+    add_node(candidates)
+    return nodes
+
+
+def _init_worker(words: list[str], strategy: str, opener: str) -> None:
+    """Set up the simulator of a pool worker process.
+
+    :param words: the dictionary.
+    :param strategy: strategy choosing each guess.
+    :param opener: first guess of the tree.
+    """
+    # the simulator imports the solver, which reads decision trees from this module
+    from .wordle_simulation import WordleSimulator
+
+    global _worker_simulator
+    _worker_simulator = WordleSimulator(words, strategy, opener, load_pattern_matrix(words))
+
+
+def _build_worker_subtree(candidates: list[int]) -> list[Node]:
+    """Build a subtree in a pool worker process.
+
+    :param candidates: ids of the answers still possible, in dictionary order.
+    :return: nodes of the subtree, the first being its root.
+    """
+    if _worker_simulator is None:
+        raise RuntimeError("Decision tree worker has not been initialised.")
+
+    return _build_subtree(_worker_simulator, candidates)
+
+
+def build_decision_tree(
+    words: list[str], opener: str | None = None, strategy: str = ENTROPY, workers: int | None = None
+) -> DecisionTree:
+    """Build the decision tree for an opening guess, covering every word as an answer.
+
+    Each guess after the opener is chosen from the answers still possible, so every game played from the tree ends.
+
+    :param words: the dictionary, used as both the possible guesses and the possible answers.
+    :param opener: first guess of the tree, defaults to the highest scoring word in the dictionary.
+    :param strategy: strategy choosing each guess, one of ``score``, ``entropy`` or ``minimax``.
+    :param workers: number of worker processes, defaults to the number of CPUs. ``1`` builds the tree in this
+        process.
+    :return: the decision tree.
+    """
+    # the solver reads decision trees from this module and the simulator imports the solver, both only needed to
+    # build a tree and not to read one
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .wordle_simulation import WordleSimulator
+
+    simulator = WordleSimulator(words, strategy, opener, load_pattern_matrix(words))
+    workers = workers or os.cpu_count() or 1
+    root = simulator.word_ids[simulator.opener]
+    buckets = _buckets(simulator.pattern_matrix.row(root), range(len(words)))
+
+    logger.info("Building wordle decision tree opening %s with the %s strategy", simulator.opener, strategy)
+
+    if workers == 1:
+        subtrees = [_build_subtree(simulator, bucket) for bucket in buckets.values()]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(words, strategy, simulator.opener)
+        ) as executor:
+            subtrees = list(executor.map(_build_worker_subtree, buckets.values()))
+
+    simulator.pattern_matrix.close()
+
+    # subtree nodes follow the opener in order, so each subtree's node indexes move up by its offset
+    nodes: list[Node] = [(root, len(words), [])]
+    for pattern, subtree in zip(buckets, subtrees, strict=True):
+        offset = len(nodes)
+        nodes[0][2].append((pattern, offset))
+        nodes.extend(
+            (guess, answers, [(edge, child + offset) for edge, child in edges]) for guess, answers, edges in subtree
+        )
+
+    edge_starts = array("I", [0])
+    for _, _, edges in nodes:
+        edge_starts.append(edge_starts[-1] + len(edges))
+
+    return DecisionTree(
+        words,
+        array("I", [guess for guess, _, _ in nodes]),
+        array("I", [answers for _, answers, _ in nodes]),
+        edge_starts,
+        bytes(pattern for _, _, edges in nodes for pattern, _ in edges),
+        array("I", [child for _, _, edges in nodes for _, child in edges]),
+    )
+
+
+def _little_endian(values: "array[int]") -> "array[int]":
+    """Swap an array of integers between native and little-endian byte order, in place.
+
+    :param values: array to swap.
+    :return: the same array.
+    """
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values
+
+
+def pack_decision_tree(tree: DecisionTree) -> bytes:
+    """Pack a decision tree into the compiled binary decision tree format.
+
+    :param tree: decision tree to pack.
+    :return: bytes of the compiled decision tree, header included.
+    """
+    header = DECISION_TREE_HEADER.pack(
+        DECISION_TREE_MAGIC,
+        DECISION_TREE_VERSION,
+        words_digest(tree.words).encode("ascii"),
+        len(tree.guesses),
+        len(tree.edge_patterns),
+    )
+
+    return b"".join(
+        [
+            header,
+            _little_endian(array("I", tree.guesses)).tobytes(),
+            _little_endian(array("I", tree.answers)).tobytes(),
+            _little_endian(array("I", tree.edge_starts)).tobytes(),
+            tree.edge_patterns,
+            _little_endian(array("I", tree.edge_children)).tobytes(),
+        ]
+    )
+
+
+def unpack_decision_tree(words: Sequence[str], data: bytes) -> DecisionTree:
+    """Unpack a decision tree from bytes in the compiled binary decision tree format.
+
+    :param words: the dictionary the tree was built over.
+    :param data: bytes of the compiled decision tree, header included.
+    :return: the decision tree.
+    """
+    magic, version, digest, nodes, edges = DECISION_TREE_HEADER.unpack_from(data)
+
+    if magic != DECISION_TREE_MAGIC or version != DECISION_TREE_VERSION:
+        raise ValueError(f"Unsupported decision tree format (magic={magic!r}, version={version}).")
+
+    if digest.decode("ascii") != words_digest(words):
+        raise ValueError("Decision tree was built for a different word list.")
+
+    offsets = [DECISION_TREE_HEADER.size]
+    for size in (4 * nodes, 4 * nodes, 4 * (nodes + 1), edges, 4 * edges):
+        offsets.append(offsets[-1] + size)
+
+    if len(data) < offsets[-1]:
+        raise ValueError("Compiled decision tree is truncated.")
+
+    def section(index: int) -> "array[int]":
+        values = array("I")
+        values.frombytes(data[offsets[index] : offsets[index + 1]])
+        return _little_endian(values)
+
+    return DecisionTree(words, section(0), section(1), section(2), bytes(data[offsets[3] : offsets[4]]), section(4))
+
+
+def compile_decision_tree(
+    target_name: str = DECISION_TREE_RESOURCE,
+    opener: str | None = None,
+    strategy: str = ENTROPY,
+    workers: int | None = None,
+) -> Path:
+    """Build the decision tree over the bundled dictionary and write it as a binary resource.
+
+    :param target_name: name of the binary resource to write in the data folder.
+    :param opener: first guess of the tree, defaults to the highest scoring word in the dictionary.
+    :param strategy: strategy choosing each guess, one of ``score``, ``entropy`` or ``minimax``.
+    :param workers: number of worker processes, defaults to the number of CPUs.
+    :return: path of the compiled binary resource.
+    """
+    words = read_word_list_resource("words_alpha_five_letters.bin")
+    target_path = resources_path().joinpath("data", target_name)
+    target_path.write_bytes(pack_decision_tree(build_decision_tree(words, opener, strategy, workers)))
+
+    return target_path
+
+
+def read_decision_tree_resource(words: Sequence[str], resource_name: str = DECISION_TREE_RESOURCE) -> DecisionTree:
+    """Read a compiled binary decision tree resource from the resources folder.
+
+    :param words: the dictionary the tree was built over.
+    :param resource_name: name of the compiled resource in the data folder.
+    :return: the decision tree.
+    """
+    with map_data_resource(resource_name) as mapped:
+        return unpack_decision_tree(words, mapped[:])
+
+
+if __name__ == "__main__":
+    compile_decision_tree()
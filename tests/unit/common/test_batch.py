@@ -0,0 +1,66 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from game_solvers.common.batch import answer_chunk, iter_batch
+from pytest import mark
+
+
+def handler(request):
+    if request.get("fail"):
+        raise ValueError("Request failed.")
+    if request.get("crash"):
+        raise RuntimeError("Handler crashed.")
+    if request.get("sleep"):
+        time.sleep(request["sleep"])
+    return {"value": request.get("value"), "strategy": request.get("strategy")}
+
+
+def test_when_answer_chunk_then_responses_in_order():
+    chunk = [
+        (1, '{"value": 1}'),
+        (2, "   "),
+        (3, '{"id": "x", "value": 3, "strategy": "entropy"}'),
+        (4, '{"fail": true}'),
+        (5, "[1]"),
+        (6, '{"crash": true}'),
+    ]
+
+    actual = [json.loads(response) for response in answer_chunk(handler, {"strategy": "score"}, chunk)]
+
+    assert actual == [
+        {"id": 1, "ok": True, "value": 1, "strategy": "score"},
+        {"id": "x", "ok": True, "value": 3, "strategy": "entropy"},
+        {"id": 4, "ok": False, "error": "Request failed."},
+        {"id": 5, "ok": False, "error": "Requests must be JSON objects. Input [1] is invalid."},
+        {"id": 6, "ok": False, "error": "Internal error, see the log for details."},
+    ]
+
+
+@mark.parametrize("use_executor", [True, False])
+def test_when_iter_batch_then_input_order_preserved(use_executor):
+    # earlier requests are slower, so later chunks finish first
+    lines = [json.dumps({"value": index, "sleep": 0.002 * (20 - index)}) for index in range(20)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        actual = list(iter_batch(lines, handler, executor if use_executor else None, chunk_size=3, max_pending=4))
+
+    assert [json.loads(response)["value"] for response in actual] == list(range(20))
+
+
+def test_when_iter_batch_then_input_read_lazily():
+    read = []
+
+    def lines():
+        for index in range(1000):
+            read.append(index)
+            yield json.dumps({"value": index})
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        responses = iter_batch(lines(), handler, executor, chunk_size=10, max_pending=3)
+        first = json.loads(next(responses))
+
+        assert first["value"] == 0
+        assert len(read) <= 10 * 3 + 1
+
+        assert sum(1 for _ in responses) == 999
@@ -0,0 +1,62 @@
+import json
+import re
+
+from game_solvers.common.benchmark import (
+    compare_results,
+    read_results,
+    regressions,
+    run_benchmarks,
+    time_call,
+    write_results,
+)
+from pytest import raises
+
+
+def test_when_time_call_then_timings_per_call_returned():
+    calls = []
+
+    actual = time_call(lambda: calls.append(1), repeat=3, min_time=0.01)
+
+    assert len(calls) >= 3 * actual["number"]
+    assert 0 < actual["seconds"] <= actual["mean_seconds"]
+
+
+def test_when_run_benchmarks_then_every_benchmark_timed():
+    actual = run_benchmarks([("a", lambda: None), ("b", lambda: None)], repeat=1, min_time=0.01)
+
+    assert list(actual) == ["a", "b"]
+
+
+def test_when_write_results_then_read_back(tmp_path):
+    results = {"a@1x": {"seconds": 0.5, "mean_seconds": 0.6, "number": 1}}
+
+    actual = read_results(write_results(results, tmp_path / "results.json"))
+
+    assert actual == results
+
+
+def test_when_read_results_and_version_unsupported_then_raise_error(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps({"version": 0, "results": {}}))
+
+    with raises(ValueError, match=re.escape("Unsupported benchmark results version 0.")):
+        read_results(path)
+
+
+def test_when_compare_results_then_benchmarks_in_both_compared():
+    results = {"b": {"seconds": 3.0}, "a": {"seconds": 1.0}, "new": {"seconds": 1.0}}
+    baseline = {"a": {"seconds": 2.0}, "b": {"seconds": 2.0}, "old": {"seconds": 1.0}}
+
+    assert compare_results(results, baseline) == [("a", 2.0, 1.0, -0.5), ("b", 2.0, 3.0, 0.5)]
+
+
+def test_when_regressions_then_only_slowdowns_beyond_threshold_returned():
+    comparison = [("a", 2.0, 1.0, -0.5), ("b", 2.0, 2.4, 0.2), ("c", 2.0, 3.0, 0.5)]
+
+    assert regressions(comparison, 0.25) == [("c", 2.0, 3.0, 0.5)]
+    assert regressions(comparison, 0.1) == [("b", 2.0, 2.4, 0.2), ("c", 2.0, 3.0, 0.5)]
+
+
+def test_when_regressions_and_threshold_negative_then_raise_error():
+    with raises(ValueError, match=re.escape("Regression threshold must not be negative. Input -0.1 is invalid.")):
+        regressions([], -0.1)
@@ -0,0 +1,74 @@
+import re
+
+from game_solvers.common.cache import StateCache, StateStore
+from pytest import fixture, raises
+
+
+@fixture
+def store(tmp_path):
+    store = StateStore(tmp_path / "states.db", "ns-")
+    yield store
+    store.close()
+
+
+def test_when_get_and_not_cached_then_none_and_miss_counted():
+    cache = StateCache(2)
+
+    assert cache.get("a") is None
+    assert cache.stats() == {"size": 0, "hits": 0, "store_hits": 0, "misses": 1, "evictions": 0}
+
+
+def test_when_get_and_cached_then_value_and_hit_counted():
+    cache = StateCache(2)
+    cache.put("a", {"value": 1})
+
+    assert cache.get("a") == {"value": 1}
+    assert cache.stats() == {"size": 1, "hits": 1, "store_hits": 0, "misses": 0, "evictions": 0}
+
+
+def test_when_put_beyond_size_then_least_recently_used_evicted():
+    cache = StateCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+
+
+def test_when_cache_size_invalid_then_raise_error():
+    with raises(ValueError, match=re.escape("Cache size must be a positive integer. Input 0 is invalid.")):
+        StateCache(0)
+
+
+def test_when_store_then_values_read_back_after_restart(tmp_path):
+    path = tmp_path / "states.db"
+    first = StateStore(path)
+    StateCache(2, first).put("a", {"suggestions": [["CRANE", 5.8]]})
+    first.close()
+
+    store = StateStore(path)
+    cache = StateCache(2, store)
+    actual = [cache.get("a"), cache.get("a")]
+    store.close()
+
+    assert actual == [{"suggestions": [["CRANE", 5.8]]}] * 2
+    assert cache.stats() == {"size": 1, "hits": 2, "store_hits": 1, "misses": 0, "evictions": 0}
+
+
+def test_when_store_and_other_namespace_then_not_found(store, tmp_path):
+    store.put("a", 1)
+    other = StateStore(tmp_path / "states.db", "other-")
+
+    assert store.get("a") == 1
+    assert other.get("a") is None
+    other.close()
+
+
+def test_when_store_put_again_then_replaced(store):
+    store.put("a", 1)
+    store.put("a", 2)
+
+    assert store.get("a") == 2
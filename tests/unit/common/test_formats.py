@@ -0,0 +1,60 @@
+import io
+import json
+
+from game_solvers.common.formats import write_ranked_lists
+from pytest import fixture, raises
+
+
+@fixture
+def ranked_lists():
+    return {"answers": [("RAISE", 32943), ("ARISE", 32943)], "entropy_guesses": [("TIRES", 5.0339)]}
+
+
+def test_when_write_json_then_context_and_lists_in_one_document(ranked_lists):
+    file = io.StringIO()
+
+    write_ranked_lists("json", ranked_lists, {"greys": ["S"], "strategy": "entropy"}, file)
+
+    assert file.getvalue().count("\n") == 1
+    assert json.loads(file.getvalue()) == {
+        "greys": ["S"],
+        "strategy": "entropy",
+        "answers": [["RAISE", 32943], ["ARISE", 32943]],
+        "entropy_guesses": [["TIRES", 5.0339]],
+    }
+
+
+def test_when_write_ndjson_then_one_object_per_word(ranked_lists):
+    file = io.StringIO()
+
+    write_ranked_lists("ndjson", ranked_lists, {"strategy": "entropy"}, file)
+
+    assert [json.loads(line) for line in file.getvalue().splitlines()] == [
+        {"list": "answers", "rank": 1, "word": "RAISE", "score": 32943},
+        {"list": "answers", "rank": 2, "word": "ARISE", "score": 32943},
+        {"list": "entropy_guesses", "rank": 1, "word": "TIRES", "score": 5.0339},
+    ]
+
+
+def test_when_write_tsv_then_header_and_one_row_per_word(ranked_lists):
+    file = io.StringIO()
+
+    write_ranked_lists("tsv", ranked_lists, file=file)
+
+    assert file.getvalue() == (
+        "list\trank\tword\tscore\n"
+        "answers\t1\tRAISE\t32943\n"
+        "answers\t2\tARISE\t32943\n"
+        "entropy_guesses\t1\tTIRES\t5.0339\n"
+    )
+
+
+def test_when_write_and_no_file_then_stdout_used(ranked_lists, capsys):
+    write_ranked_lists("tsv", {"answers": []})
+
+    assert capsys.readouterr().out == "list\trank\tword\tscore\n"
+
+
+def test_when_write_and_unknown_format_then_raise_error(ranked_lists):
+    with raises(ValueError, match="Output format must be one of json, ndjson, tsv. Input rich is invalid."):
+        write_ranked_lists("rich", ranked_lists)
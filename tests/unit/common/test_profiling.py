@@ -0,0 +1,76 @@
+import pstats
+import tracemalloc
+
+from game_solvers.common.profiling import StageProfiler, profile_stage
+from pytest import raises
+
+
+def test_when_stage_run_then_calls_time_and_memory_recorded():
+    profiler = StageProfiler()
+
+    with profiler.stage("build"):
+        data = [0] * 100_000
+    with profiler.stage("build"):
+        pass
+    with profiler.stage("sum"):
+        sum(data)
+    profiler.close()
+
+    report = profiler.report()
+    assert [(stage["stage"], stage["calls"]) for stage in report] == [("build", 2), ("sum", 1)]
+    assert report[0]["seconds"] > 0
+    assert report[0]["peak_bytes"] > 700_000
+    assert report[1]["peak_bytes"] < 100_000
+
+
+def test_when_stage_raises_then_run_still_recorded():
+    profiler = StageProfiler(trace_memory=False)
+
+    with raises(KeyError), profiler.stage("lookup"):
+        raise KeyError("missing")
+
+    assert profiler.report() == [
+        {"stage": "lookup", "calls": 1, "seconds": profiler.report()[0]["seconds"], "peak_bytes": 0}
+    ]
+
+
+def test_when_close_then_memory_tracing_stopped_only_if_started_by_profiler():
+    profiler = StageProfiler()
+    assert tracemalloc.is_tracing()
+    profiler.close()
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    try:
+        StageProfiler().close()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_when_dump_profiles_then_profile_of_each_stage_written(tmp_path):
+    profiler = StageProfiler(trace_memory=False, cprofile_dir=tmp_path / "profiles")
+
+    with profiler.stage("sort"):
+        sorted(range(1000), reverse=True)
+
+    paths = profiler.dump_profiles()
+
+    assert paths == [tmp_path / "profiles" / "sort.prof"]
+    assert any(function[2] == "<built-in method builtins.sorted>" for function in pstats.Stats(str(paths[0])).stats)
+
+
+def test_when_dump_profiles_and_no_cprofile_dir_then_nothing_written():
+    profiler = StageProfiler(trace_memory=False)
+
+    with profiler.stage("sort"):
+        pass
+
+    assert profiler.dump_profiles() == []
+
+
+def test_when_profile_stage_and_no_profiler_then_shared_empty_context():
+    assert profile_stage(None, "sort") is profile_stage(None, "score")
+
+    with profile_stage(None, "sort"):
+        pass
@@ -1,6 +1,6 @@
 from unittest.mock import Mock, call, patch
 
-from game_solvers.common.report import report_wordle_solutions
+from game_solvers.common.report import report_wordle_simulation, report_wordle_solutions
 
 
 @patch("game_solvers.common.report.Group")
@@ -210,3 +210,96 @@ def test_when_report_wordle_solutions_and_all_info_then_correct_calls_made(conso
             call(panel_green, panel_yellow, panel_grey, "", panel_answers, "", panel_non_repeated, "", panel_new_char),
         ]
     )
+
+
+@patch("game_solvers.common.report.Group")
+@patch("game_solvers.common.report.Panel")
+@patch("game_solvers.common.report.Console")
+def test_when_report_wordle_solutions_and_ranked_words_then_ranked_panel_added(console_class, panel_class, group_class):
+    console = Mock()
+    console_class.return_value = console
+
+    panels = [Mock() for _ in range(8)]
+    panel_class.side_effect = panels
+    groups = [Mock() for _ in range(5)]
+    group_class.side_effect = groups
+
+    report_wordle_solutions(
+        [],
+        [],
+        [],
+        [],
+        [],
+        [],
+        ranked_words=[("SOARE", 5.8852), ("ROATE", 5.8826)],
+        strategy="entropy",
+    )
+
+    console.assert_has_calls([call.print(panels[7])])
+
+    panel_class.assert_has_calls(
+        [
+            call(
+                groups[3],
+                title="[white]Top 10 [bold]Entropy[/bold] Guesses[/white]",
+                title_align="left",
+                border_style="dodger_blue2",
+            ),
+            call(groups[4], title="[blue]Wordle: Possible Solutions[/blue]", border_style="white"),
+        ]
+    )
+
+    group_class.assert_has_calls(
+        [
+            call(
+                "Words that:",
+                " * Are any word in the dictionary, even if they do not fit the given criteria",
+                " * Scored the highest expected information, in bits, from their feedback against the possible answers",
+                "",
+                "These words narrow down the possible answers fastest, use them when there are still many left",
+                "",
+                "SOARE - 5.8852",
+                "ROATE - 5.8826",
+            ),
+            call(*panels[:3], "", panels[3], "", panels[4], "", panels[5], "", panels[6]),
+        ]
+    )
+
+
+@patch("game_solvers.common.report.Group")
+@patch("game_solvers.common.report.Panel")
+@patch("game_solvers.common.report.Console")
+def test_when_report_wordle_simulation_then_correct_calls_made(console_class, panel_class, group_class):
+    console = Mock()
+    console_class.return_value = console
+
+    panel_distribution = Mock()
+    panel_simulation = Mock()
+    panel_class.side_effect = [panel_distribution, panel_simulation]
+
+    group_distribution = Mock()
+    group_simulation = Mock()
+    group_class.side_effect = [group_distribution, group_simulation]
+
+    report_wordle_simulation("entropy", "CRANE", 4, {3: 1, 4: 2, 7: 1}, 0.25, 4.5, 123.45)
+
+    console.assert_has_calls([call.print(panel_simulation)])
+
+    group_class.assert_has_calls(
+        [
+            call(
+                " 3 - ████████████████████ 1",
+                " 4 - ████████████████████████████████████████ 2",
+                " 7 - ████████████████████ 1",
+            ),
+            call(
+                "Strategy: [bold]entropy[/bold], opening with [bold]CRANE[/bold]",
+                "Games played: 4",
+                "Mean guesses: 4.5000",
+                "Failure rate (more than six guesses): 25.00%",
+                "Games per second: 123.5",
+                "",
+                panel_distribution,
+            ),
+        ]
+    )
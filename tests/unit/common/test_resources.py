@@ -1,4 +1,4 @@
-from game_solvers.common.resources import read_data_resource
+from game_solvers.common.resources import map_data_resource, read_data_resource
 from pytest import raises
 
 
@@ -17,3 +17,15 @@ def test_when_read_data_resource_and_exist_then_read_data():
         ["Langer", "7696", "23"],
         ["Ponting", "13378", "41"],
     ]
+
+
+def test_when_map_data_resource_and_not_exist_then_raise_error():
+    err_pattern = r"Data resource '.*silly_resource_file.bin' not found\."
+
+    with raises(FileNotFoundError, match=err_pattern):
+        map_data_resource("silly_resource_file.bin")
+
+
+def test_when_map_data_resource_and_exist_then_map_bytes():
+    with map_data_resource("example_data.csv") as mapped:
+        assert mapped[:17] == b"name,runs,centuri"
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from game_solvers.common.server import LINE_LIMIT, SolverServer
+from pytest import fixture, mark
+
+
+def handler(request):
+    if request.get("fail"):
+        raise ValueError("Request failed.")
+    if request.get("crash"):
+        raise RuntimeError("Handler crashed.")
+    return {"echo": request.get("value")}
+
+
+@fixture
+def server():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield SolverServer(handler, executor)
+
+
+async def exchange(server, lines, socket_path=None):
+    listening = await server.start(socket_path=socket_path)
+    async with listening:
+        if socket_path:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+        else:
+            reader, writer = await asyncio.open_connection(*listening.sockets[0].getsockname()[:2])
+
+        writer.write(b"".join(line + b"\n" for line in lines))
+        await writer.drain()
+        writer.write_eof()
+
+        responses = [json.loads(line) async for line in reader]
+        writer.close()
+        return responses
+
+
+@mark.parametrize("use_socket", [True, False])
+def test_when_requests_then_each_answered_with_id_and_latency(server, tmp_path, use_socket):
+    socket_path = str(tmp_path / "solver.sock") if use_socket else None
+    lines = [json.dumps({"id": index, "value": index * 10}).encode() for index in range(5)]
+
+    actual = asyncio.run(exchange(server, lines, socket_path))
+
+    assert sorted(actual, key=lambda response: response["id"]) == [
+        {"id": index, "ok": True, "echo": index * 10, "latency_ms": response["latency_ms"]}
+        for index, response in enumerate(sorted(actual, key=lambda response: response["id"]))
+    ]
+    assert all(response["latency_ms"] >= 0 for response in actual)
+
+
+@mark.parametrize(
+    "line,expected",
+    [
+        (b'{"id": 7, "fail": true}', {"id": 7, "ok": False, "error": "Request failed."}),
+        (b"[1, 2]", {"id": None, "ok": False, "error": "Requests must be JSON objects. Input [1, 2] is invalid."}),
+        (b"nope", {"id": None, "ok": False, "error": "Expecting value: line 1 column 1 (char 0)"}),
+        (
+            b'{"id": 8, "crash": true}',
+            {"id": 8, "ok": False, "error": "Internal error, see the server log for details."},
+        ),
+    ],
+)
+def test_when_request_fails_then_error_response_returned(server, line, expected):
+    actual = asyncio.run(exchange(server, [line]))
+
+    assert len(actual) == 1
+    assert actual[0].pop("latency_ms") >= 0
+    assert actual[0] == expected
+
+
+def test_when_request_line_too_long_then_error_returned_and_client_disconnected(server):
+    lines = [b'{"id": 1, "value": 1}', b'{"id": 2, "value": "' + b"x" * LINE_LIMIT + b'"}', b'{"id": 3, "value": 3}']
+
+    actual = asyncio.run(exchange(server, lines))
+
+    assert actual[0].pop("latency_ms") >= 0
+    assert actual == [
+        {"id": 1, "ok": True, "echo": 1},
+        {"id": None, "ok": False, "error": f"Request lines must be at most {LINE_LIMIT} bytes."},
+    ]
+
+
+def test_when_many_clients_then_all_answered_concurrently(server):
+    async def clients():
+        listening = await server.start()
+        async with listening:
+            host, port = listening.sockets[0].getsockname()[:2]
+
+            async def client(index):
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(json.dumps({"id": index, "value": index}).encode() + b"\n")
+                await writer.drain()
+                response = json.loads(await reader.readline())
+                writer.close()
+                return response
+
+            return await asyncio.gather(*(client(index) for index in range(20)))
+
+    actual = asyncio.run(clients())
+
+    assert [response["echo"] for response in actual] == list(range(20))
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from game_solvers.common.resources import read_data_resource
+from game_solvers.common.wordlist import (
+    WORD_LIST_HEADER,
+    compile_word_list,
+    pack_word_list,
+    read_word_list_resource,
+    source_digest,
+    unpack_word_list,
+)
+from pytest import fixture, raises
+
+
+@fixture
+def resources(tmp_path):
+    (tmp_path / "data").mkdir()
+    with (
+        patch("game_solvers.common.resources.resources_path", return_value=tmp_path),
+        patch("game_solvers.common.wordlist.resources_path", return_value=tmp_path),
+    ):
+        yield tmp_path / "data"
+
+
+def test_when_pack_and_unpack_word_list_then_words_round_trip_upper_case():
+    actual = unpack_word_list(pack_word_list(["aahed", "AALII", "aArGh"]))
+    assert actual == ["AAHED", "AALII", "AARGH"]
+
+
+def test_when_pack_word_list_then_words_stored_fixed_width():
+    actual = pack_word_list(["ABACK", "ZUNIS"])
+    assert actual[WORD_LIST_HEADER.size :] == b"ABACK\nZUNIS\n"
+
+
+def test_when_pack_word_list_and_words_differ_in_length_then_raise_error():
+    with raises(ValueError, match="All words in a compiled word list must be the same length."):
+        pack_word_list(["ABACK", "ZUNI"])
+
+
+def test_when_unpack_word_list_and_bad_magic_then_raise_error():
+    with raises(ValueError, match="Unsupported word list format"):
+        unpack_word_list(b"NOPE" + pack_word_list(["ABACK"])[4:])
+
+
+def test_when_unpack_word_list_and_truncated_then_raise_error():
+    with raises(ValueError, match="Compiled word list is truncated."):
+        unpack_word_list(pack_word_list(["ABACK", "ZUNIS"])[:-1])
+
+
+def test_when_read_word_list_resource_then_matches_csv_source_of_truth():
+    expected = [word.upper() for word in read_data_resource("words_alpha_five_letters.txt")[0]]
+
+    assert read_word_list_resource("words_alpha_five_letters.bin") == expected
+
+
+def test_when_unpack_word_list_and_source_differs_then_raise_error():
+    packed = pack_word_list(["ABACK"], source_digest(b"aback"))
+
+    assert unpack_word_list(packed, source_digest(b"aback")) == ["ABACK"]
+    with raises(ValueError, match="Compiled word list is stale"):
+        unpack_word_list(packed, source_digest(b"aback,zunis"))
+
+
+def test_when_compile_word_list_then_read_back_from_csv(resources):
+    (resources / "words.txt").write_text("aback,zunis\n")
+
+    compile_word_list("words.txt", "words.bin")
+
+    assert read_word_list_resource("words.bin") == ["ABACK", "ZUNIS"]
+
+
+def test_when_csv_edited_after_compile_then_stale_word_list_detected(resources):
+    (resources / "words.txt").write_text("aback,zunis\n")
+    compile_word_list("words.txt", "words.bin")
+
+    (resources / "words.txt").write_text("aback,zunis,crane\n")
+
+    with raises(ValueError, match="Compiled word list is stale"):
+        read_word_list_resource("words.bin")
@@ -15,3 +15,11 @@ def fixture_path():
 @fixture
 def data_fixture_path(fixture_path):
     return fixture_path / "data"
+
+
+@fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep generated caches out of the user cache folder."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("GAME_SOLVERS_CACHE_DIR", str(path))
+    return path
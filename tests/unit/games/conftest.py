@@ -0,0 +1,84 @@
+"""Pytest Configuration File for game tests."""
+
+import csv
+from pathlib import Path
+
+from game_solvers.games.wordle import WordleSolver
+from game_solvers.games.wordle_patterns import feedback
+from pytest import fixture
+
+
+@fixture(scope="session")
+def dictionary():
+    """Full bundled wordle dictionary."""
+    return WordleSolver.prep_words()
+
+
+@fixture(scope="session")
+def cutdown_words():
+    """Cutdown wordle dictionary, upper case."""
+    cutdown_path = Path(__file__).parent.parent.parent / "fixtures" / "data" / "cutdown_dictionary.csv"
+
+    with cutdown_path.open() as f_open:
+        return list(csv.reader(f_open, delimiter=","))[0]
+
+
+@fixture
+def random_state():
+    """Build a plausible game state from letters of a random answer."""
+
+    def _random_state(rng, dictionary):
+        answer = rng.choice(dictionary)
+        greens = [(answer[pos - 1], pos) for pos in rng.sample(range(1, 6), rng.randint(0, 2))]
+        yellows = []
+        for pos in rng.sample(range(1, 6), rng.randint(0, 2)):
+            incorrect = sorted(
+                {p for p in rng.sample(range(1, 6), rng.randint(1, 3)) if answer[p - 1] != answer[pos - 1]}
+            )
+            if incorrect:
+                yellows.append((answer[pos - 1], incorrect))
+        letters = [letter for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if letter not in answer]
+        greys = rng.sample(letters, rng.randint(0, 6))
+        return greens, yellows, greys
+
+    return _random_state
+
+
+@fixture(scope="session")
+def reference_valid_word():
+    """Check a word against letter information rule by rule, the reference every compiled check must agree with."""
+
+    def _reference_valid_word(greens, yellows, greys, word):
+        if not all(word[pos - 1] == green for green, pos in greens):
+            return False
+
+        for yellow, incorrect_positions in yellows:
+            if any(word[pos - 1] == yellow for pos in incorrect_positions):
+                return False
+
+            # already green instances of the same letter do not count towards the yellow
+            green_already = [green_pos for green_letter, green_pos in greens if green_letter == yellow]
+            not_allowed_positions = green_already + incorrect_positions
+            if not any(word[pos - 1] == yellow for pos in range(1, 6) if pos not in not_allowed_positions):
+                return False
+
+        # a grey letter that is also green or yellow has no more copies than those known
+        for grey in greys:
+            known = len({pos for green, pos in greens if green == grey}) + any(yellow == grey for yellow, _ in yellows)
+            if word.count(grey) > known:
+                return False
+
+        return True
+
+    return _reference_valid_word
+
+
+@fixture
+def random_history():
+    """Build the feedback on a few random guesses against a random answer."""
+
+    def _random_history(rng, dictionary):
+        answer = rng.choice(dictionary)
+        return [(guess, feedback(guess, answer)) for guess in rng.sample(dictionary, rng.randint(1, 3))]
+
+    return _random_history
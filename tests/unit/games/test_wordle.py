@@ -1,8 +1,16 @@
 import csv
-from unittest.mock import patch
+import json
+from unittest.mock import PropertyMock, patch
 
+from game_solvers.common.profiling import StageProfiler
 from game_solvers.games.wordle import WordleSolver
-from pytest import fixture, mark
+from game_solvers.games.wordle_constraints import LETTERS, WordleConstraints
+from game_solvers.games.wordle_dictionary import WordleDictionary, load_dictionary
+from game_solvers.games.wordle_index import WordIndex
+from game_solvers.games.wordle_openings import build_opening_book
+from game_solvers.games.wordle_patterns import feedback, pattern_string
+from game_solvers.games.wordle_tree import build_decision_tree
+from pytest import fixture, mark, raises
 
 
 class TestWordleSolver:
@@ -39,42 +47,73 @@ class TestWordleSolver:
         with open(cutdown_path) as f_open:
             return list(csv.reader(f_open, delimiter=","))[0]
 
-    @patch("game_solvers.games.wordle.WordleSolver.calculate_distribution")
-    @patch("game_solvers.games.wordle.WordleSolver.prep_words")
-    def test_when_init_and_no_args_then_correct_values_set(self, prep_words, calculate_distribution):
-        prep_words.return_value = ["AAHED", "AALII", "AARGH", "AARON"]
-        calculate_distribution.return_value = {"A": 8, "D": 5, "H": 5}
-
+    def test_when_init_and_no_args_then_correct_values_set(self):
         actual = WordleSolver([], [], [])
 
         assert actual.greens == []
         assert actual.yellows == []
         assert actual.greys == []
-        assert actual.dictionary == ["AAHED", "AALII", "AARGH", "AARON"]
-        assert actual.distribution == {"A": 8, "D": 5, "H": 5}
-
-        prep_words.assert_called_once_with()
-        calculate_distribution.assert_called_once_with(["AAHED", "AALII", "AARGH", "AARON"])
+        assert actual.word_list is load_dictionary()
+        assert actual.dictionary == tuple(WordleSolver.prep_words())
+        assert actual.distribution == WordleSolver.calculate_distribution(actual.dictionary)
 
-    @patch("game_solvers.games.wordle.WordleSolver.calculate_distribution")
-    @patch("game_solvers.games.wordle.WordleSolver.prep_words")
-    def test_when_init_and_all_args_then_correct_values_set(self, prep_words, calculate_distribution):
-        prep_words.return_value = ["AAHED", "AALII", "AARGH", "AARON"]
-        calculate_distribution.return_value = {"A": 8, "D": 5, "H": 5}
+    def test_when_init_and_all_args_then_correct_values_set(self):
+        dictionary = WordleDictionary(["AAHED", "AALII", "AARGH", "AARON"])
 
-        actual = WordleSolver([("A", 3), ("D", 5)], [("M", [3, 4]), ("Y", [1])], ["Z", "W", "H", "C"])
+        actual = WordleSolver([("A", 3), ("D", 5)], [("M", [3, 4]), ("Y", [1])], ["Z", "W", "H", "C"], dictionary)
 
         assert actual.greens == [("A", 3), ("D", 5)]
         assert actual.yellows == [("M", [3, 4]), ("Y", [1])]
         assert actual.greys == ["Z", "W", "H", "C"]
-        assert actual.dictionary == ["AAHED", "AALII", "AARGH", "AARON"]
-        assert actual.distribution == {"A": 8, "D": 5, "H": 5}
+        assert actual.word_list is dictionary
+        assert actual.dictionary == ("AAHED", "AALII", "AARGH", "AARON")
+        assert actual.distribution == {
+            **dict.fromkeys(LETTERS, 0),
+            "A": 8,
+            "D": 1,
+            "E": 1,
+            "G": 1,
+            "H": 2,
+            "I": 2,
+            "L": 1,
+            "N": 1,
+            "O": 1,
+            "R": 2,
+        }
+
+    @patch("game_solvers.games.wordle_dictionary.read_words")
+    def test_when_init_many_solvers_then_dictionary_loaded_once(self, read_words):
+        solvers = [WordleSolver([], [], []) for _ in range(3)]
+
+        read_words.assert_not_called()
+        assert all(solver.word_list is solvers[0].word_list for solver in solvers)
+        assert all(solver.word_lanes is solvers[0].word_lanes for solver in solvers)
+        assert all(solver.word_scores is solvers[0].word_scores for solver in solvers)
+
+    def test_when_distribution_set_then_own_word_scores_calculated(self, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        other = WordleSolver([], [], [], solver_empty.word_list)
 
-        prep_words.assert_called_once_with()
-        calculate_distribution.assert_called_once_with(["AAHED", "AALII", "AARGH", "AARON"])
+        solver_empty.distribution = {"Z": 10}
+
+        assert solver_empty.word_scores["ZESTY"] == 10
+        assert other.word_scores == other.word_list.word_scores
+        assert other.word_scores["ZESTY"] != 10
+
+    @patch("game_solvers.games.wordle_dictionary.read_word_list_resource")
+    def test_when_prep_words_then_compiled_word_list_used(self, read_word_list_resource, solver_empty):
+        read_word_list_resource.return_value = ["AAHED", "AALII", "AARGH", "AARON"]
+
+        actual = solver_empty.prep_words()
+        assert actual == ["AAHED", "AALII", "AARGH", "AARON"]
+        read_word_list_resource.assert_called_once_with("words_alpha_five_letters.bin")
 
-    @patch("game_solvers.games.wordle.read_data_resource")
-    def test_when_prep_words_then_all_words_upper_case(self, read_data_resource, solver_empty):
+    @patch("game_solvers.games.wordle_dictionary.read_data_resource")
+    @patch("game_solvers.games.wordle_dictionary.read_word_list_resource")
+    def test_when_prep_words_and_not_compiled_then_all_words_upper_case(
+        self, read_word_list_resource, read_data_resource, solver_empty
+    ):
+        read_word_list_resource.side_effect = FileNotFoundError
         read_data_resource.return_value = [["aahed", "aalii", "aargh", "aaron"]]
 
         actual = solver_empty.prep_words()
@@ -206,6 +245,303 @@ class TestWordleSolver:
 
         assert solver.valid_word(word) is valid_state
 
+    def test_when_valid_words_then_matches_reference_valid_word(self, solver_full, reference_valid_word):
+        letters = solver_full.greens, solver_full.yellows, solver_full.greys
+        expected = [word for word in solver_full.dictionary if reference_valid_word(*letters, word)]
+        assert solver_full.valid_words() == expected
+        assert [word for word in solver_full.dictionary if solver_full.valid_word(word)] == expected
+
+    def test_when_valid_words_and_large_dictionary_then_index_used(self, solver_full, reference_valid_word):
+        solver_full.dictionary = list(solver_full.dictionary)
+        solver_full.index_min_words = 0
+        solver_full.index_max_share = 1.0
+        letters = solver_full.greens, solver_full.yellows, solver_full.greys
+        expected = [word for word in solver_full.dictionary if reference_valid_word(*letters, word)]
+
+        assert solver_full.valid_words() == expected
+        assert "word_index" in solver_full.word_list._built
+        assert "word_lanes" not in solver_full.word_list._built
+
+    @mark.parametrize(
+        "greens, yellows, greys, index_used",
+        [
+            ([("Z", 1)], [], [], True),
+            ([("C", 1)], [("R", [2])], ["A"], True),
+            ([], [("E", [1]), ("A", [2])], ["S", "T"], False),
+            ([], [], ["S", "T"], False),
+        ],
+    )
+    def test_when_valid_words_on_bundled_dictionary_then_index_used_when_narrow(
+        self, greens, yellows, greys, index_used, reference_valid_word
+    ):
+        solver = WordleSolver(greens, yellows, greys)
+        expected = [word for word in solver.dictionary if reference_valid_word(greens, yellows, greys, word)]
+
+        with patch.object(WordIndex, "filter", autospec=True, side_effect=WordIndex.filter) as index_filter:
+            actual = solver.valid_words()
+
+        assert actual == expected
+        assert index_filter.called is index_used
+
+    def test_when_valid_word_then_constraint_plan_counts_eliminations(self, solver_full, cutdown_dictionary):
+        solver_full.dictionary = cutdown_dictionary
+
+        valid = [word for word in cutdown_dictionary if solver_full.valid_word(word)]
+
+        stats = solver_full.constraint_plan.stats()
+        selectivity = [constraint["selectivity"] for constraint in stats["constraints"]]
+        assert stats["words"] == len(cutdown_dictionary)
+        assert sum(constraint["eliminated"] for constraint in stats["constraints"]) == stats["words"] - len(valid)
+        assert selectivity == sorted(selectivity)
+        assert stats["checks"] < stats["words"] * len(selectivity)
+
+    def test_when_letters_change_then_constraint_plan_rebuilt(self, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        plan = solver_empty.constraint_plan
+
+        assert solver_empty.constraint_plan is plan
+        assert solver_empty.valid_word("SNAKY")
+
+        solver_empty.add_letters([], [], ["S"])
+
+        assert solver_empty.constraint_plan is not plan
+        assert solver_empty.constraint_plan.names == ["grey S"]
+        assert not solver_empty.valid_word("SNAKY")
+
+    @mark.parametrize(
+        "change",
+        [
+            lambda solver: solver.apply_feedback("CRANE", "....."),
+            lambda solver: solver.add_letters([], [], ["S"]),
+            lambda solver: setattr(solver, "greys", ["S"]),
+            lambda solver: solver.yellows.append(("E", [1])),
+            lambda solver: solver.history.append(("CRANE", 0)),
+        ],
+    )
+    def test_when_letters_changed_then_constraint_plan_rebuilt(self, change, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        plan = solver_empty.constraint_plan
+
+        solver_empty.valid_words()
+        assert solver_empty.constraint_plan is plan
+
+        change(solver_empty)
+
+        assert solver_empty.constraint_plan is not plan
+
+    def test_when_letters_assigned_directly_then_valid_word_agrees_with_valid_words(
+        self, solver_empty, cutdown_dictionary
+    ):
+        solver_empty.dictionary = cutdown_dictionary
+        assert solver_empty.valid_word("SNAKY")
+        assert "SNAKY" in solver_empty.candidates
+
+        solver_empty.greys = ["S"]
+
+        assert not solver_empty.valid_word("SNAKY")
+        assert "SNAKY" not in solver_empty.valid_words()
+        assert solver_empty.candidates == solver_empty.valid_words()
+        assert [word for word in cutdown_dictionary if solver_empty.valid_word(word)] == solver_empty.valid_words()
+
+    def test_when_letters_assigned_directly_then_add_letters_filters_from_dictionary(
+        self, solver_empty, cutdown_dictionary
+    ):
+        solver_empty.dictionary = cutdown_dictionary
+        solver_empty.add_letters([], [], ["S"])
+
+        solver_empty.greys = []
+        solver_empty.add_letters([], [], ["E"])
+
+        assert solver_empty.candidates == WordleSolver([], [], ["E"], solver_empty.word_list).valid_words()
+        assert "SNAKY" in solver_empty.candidates
+
+    @patch("game_solvers.common.report.report_wordle_solutions")
+    def test_when_solutions_and_profiler_then_constraint_plan_counted_apart_from_filter(
+        self, report_wordle_solutions, cutdown_dictionary
+    ):
+        dictionary = WordleDictionary(cutdown_dictionary)
+        profiler = StageProfiler(trace_memory=False)
+        solver = WordleSolver([("A", 3)], [("N", [2])], ["S", "R"], dictionary, profiler=profiler)
+
+        with patch.object(WordleConstraints, "filter", autospec=True, side_effect=WordleConstraints.filter) as filtered:
+            solver.solutions(top=3)
+
+        filtered.assert_called_once()
+        assert solver.candidates == WordleSolver([("A", 3)], [("N", [2])], ["S", "R"], dictionary).valid_words()
+        assert solver.filter_plan is solver.constraint_plan
+        stats = solver.filter_plan.stats()
+        eliminated = sum(constraint["eliminated"] for constraint in stats["constraints"])
+        assert stats["words"] == len(cutdown_dictionary)
+        assert eliminated == len(cutdown_dictionary) - len(solver.candidates)
+        assert [stage["stage"] for stage in profiler.report()][2:4] == ["filter", "constraint-plan"]
+
+    def test_when_valid_word_and_grey_also_green_then_only_known_copies_allowed(self):
+        solver = WordleSolver([("E", 4)], [], ["E"])
+
+        assert solver.valid_word("ALIEN")
+        assert not solver.valid_word("STEEP")
+        assert not solver.valid_word("CRANK")
+
+    def test_when_valid_words_after_feedback_then_letter_counts_from_history_used(
+        self, solver_empty, cutdown_dictionary
+    ):
+        solver_empty.dictionary = cutdown_dictionary
+        answer = next(word for word in cutdown_dictionary if word.count("E") == 1)
+
+        candidates = solver_empty.apply_feedback("EERIE", feedback("EERIE", answer))
+
+        assert answer in candidates
+        assert solver_empty.valid_words() == candidates
+        assert all(solver_empty.valid_word(word) for word in candidates)
+
+    def test_when_word_scores_by_dictionary_distribution_then_shared_without_copying(self, cutdown_dictionary):
+        dictionary = WordleDictionary(cutdown_dictionary)
+        solver = WordleSolver([], [], [], dictionary)
+
+        with patch.object(WordleDictionary, "distribution", new_callable=PropertyMock) as distribution:
+            actual = solver.word_scores
+
+        distribution.assert_not_called()
+        assert actual is dictionary.word_scores
+
+    def test_when_word_scores_then_cached_until_distribution_or_dictionary_replaced(
+        self, solver_empty, cutdown_dictionary
+    ):
+        solver_empty.dictionary = cutdown_dictionary
+
+        word_scores = solver_empty.word_scores
+
+        assert solver_empty.word_scores is word_scores
+        assert word_scores == {
+            word: solver_empty.score_word(word, solver_empty.distribution) for word in cutdown_dictionary
+        }
+
+        solver_empty.distribution = {"Z": 100}
+        assert solver_empty.word_scores["AZURE"] == 100
+
+        solver_empty.dictionary = cutdown_dictionary[:5]
+        assert list(solver_empty.word_scores) == cutdown_dictionary[:5]
+
+    def test_when_dictionary_replaced_then_word_lanes_rebuilt(self, solver_full, cutdown_dictionary):
+        assert solver_full.word_lanes.words is solver_full.dictionary
+
+        solver_full.dictionary = cutdown_dictionary
+
+        assert solver_full.word_lanes.words == tuple(cutdown_dictionary)
+        assert solver_full.valid_words() == [word for word in cutdown_dictionary if solver_full.valid_word(word)]
+
+    @mark.parametrize("answer", ["SNAKY", "ABACK", "QUEUE", "MADAM"])
+    def test_when_apply_feedback_then_candidates_match_every_feedback(self, answer, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        guesses = ["CRANE", "ALLEE", "SLATY", "EMCEE"]
+
+        for guess in guesses:
+            actual = solver_empty.apply_feedback(guess, pattern_string(feedback(guess, answer)))
+
+        expected = [
+            word
+            for word in cutdown_dictionary
+            if all(feedback(guess, word) == feedback(guess, answer) for guess in guesses)
+        ]
+        assert actual == expected
+        assert solver_empty.candidates == expected
+        assert answer in expected
+        assert solver_empty.history == [(guess, feedback(guess, answer)) for guess in guesses]
+        assert all(solver_empty.valid_word(word) for word in expected)
+
+    def test_when_apply_feedback_then_letter_information_updated(self, solver_empty):
+        solver_empty.apply_feedback("level", "yg.y.")
+
+        assert solver_empty.greens == [("E", 2)]
+        assert solver_empty.yellows == [("L", [1]), ("E", [4])]
+        assert solver_empty.greys == ["V"]
+
+        solver_empty.apply_feedback("eland", "y.g.y")
+
+        assert solver_empty.greens == [("E", 2), ("A", 3)]
+        assert solver_empty.yellows == [("L", [1]), ("E", [4, 1]), ("D", [5])]
+        assert solver_empty.greys == ["V", "N"]
+
+    def test_when_apply_feedback_and_yellow_later_green_then_yellow_dropped(self, solver_empty):
+        solver_empty.apply_feedback("allee", "y....")
+        solver_empty.apply_feedback("slaty", "g.g.g")
+
+        assert solver_empty.greens == [("S", 1), ("A", 3), ("Y", 5)]
+        assert solver_empty.yellows == []
+        assert solver_empty.valid_word("SNAKY")
+
+    def test_when_apply_feedback_then_yellows_given_at_init_kept(self):
+        solver = WordleSolver([("E", 2)], [("E", [1])], [])
+
+        solver.apply_feedback("CRANK", ".....")
+
+        assert solver.yellows == [("E", [1])]
+
+    def test_when_apply_feedback_then_starts_from_valid_words(self, solver_full, cutdown_dictionary):
+        solver_full.dictionary = cutdown_dictionary
+        valid_words = solver_full.valid_words()
+
+        actual = solver_full.apply_feedback("BEADY", 2 * 3**2 + 2 * 3**4)
+
+        assert actual == [word for word in valid_words if feedback("BEADY", word) == 2 * 3**2 + 2 * 3**4]
+
+    def test_when_apply_feedback_then_candidate_distribution_updated(self, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        assert solver_empty.candidate_distribution == WordleSolver.calculate_distribution(cutdown_dictionary)
+
+        candidates = solver_empty.apply_feedback("CRANE", "..g..")
+
+        assert solver_empty.candidate_distribution == WordleSolver.calculate_distribution(candidates)
+        assert solver_empty.distribution == WordleSolver.calculate_distribution(WordleSolver.prep_words())
+
+    def test_when_dictionary_replaced_then_feedback_forgotten(self, solver_empty, cutdown_dictionary):
+        solver_empty.apply_feedback("CRANE", "..g..")
+
+        solver_empty.dictionary = cutdown_dictionary
+
+        assert solver_empty.history == []
+        assert solver_empty.candidates == solver_empty.valid_words()
+
+    def test_when_add_letters_then_merged_and_candidates_narrowed(self, cutdown_dictionary):
+        solver = WordleSolver([("A", 3)], [("N", [2])], ["S"])
+        solver.dictionary = cutdown_dictionary
+        solver.apply_feedback("TRAIN", "..g.y")
+
+        actual = solver.add_letters([("A", 3), ("Y", 5)], [("N", [1]), ("L", [4])], ["S", "U"])
+
+        assert solver.greens == [("A", 3), ("Y", 5)]
+        assert solver.yellows == [("N", [2, 5, 1]), ("L", [4])]
+        assert solver.greys == ["S", "T", "R", "I", "U"]
+        assert actual == [word for word in cutdown_dictionary if solver.valid_word(word)]
+        assert solver.candidate_distribution == WordleSolver.calculate_distribution(actual)
+
+    def test_when_reset_then_new_game_started(self, solver_full, cutdown_dictionary):
+        solver_full.dictionary = cutdown_dictionary
+        word_lanes = solver_full.word_lanes
+        solver_full.apply_feedback("CRANE", "..g..")
+
+        solver_full.reset()
+
+        assert (solver_full.greens, solver_full.yellows, solver_full.greys, solver_full.history) == ([], [], [], [])
+        assert solver_full.candidates == cutdown_dictionary
+        assert solver_full.word_lanes is word_lanes
+
+    def test_when_apply_feedback_from_whole_dictionary_then_pattern_rows_reused(self, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+
+        solver_empty.apply_feedback("CRANE", "..g..")
+        pattern_rows = solver_empty.pattern_rows
+        solver_empty.reset()
+        solver_empty.apply_feedback("SLOTH", ".....")
+
+        assert solver_empty.pattern_rows is pattern_rows
+        assert pattern_rows.answers == tuple(cutdown_dictionary)
+
+    @mark.parametrize("guess", ["CRAN", "CRANES", "CR4NE"])
+    def test_when_apply_feedback_and_guess_invalid_then_raise_error(self, guess, solver_empty):
+        with raises(ValueError, match=f"Guesses must be five letters. Input {guess} is invalid."):
+            solver_empty.apply_feedback(guess, "..g..")
+
     @mark.parametrize(
         "word, expected",
         [
@@ -347,7 +683,7 @@ class TestWordleSolver:
             ),
         ],
     )
-    @patch("game_solvers.games.wordle.report_wordle_solutions")
+    @patch("game_solvers.common.report.report_wordle_solutions")
     def test_when_solution_then_correct_solutions_passed_to_reporter(
         self, report_wordle_solutions, greens, yellows, greys, scored, no_repeat, new_char, cutdown_dictionary
     ):
@@ -356,4 +692,202 @@ class TestWordleSolver:
 
         solver.solutions()
 
-        report_wordle_solutions.assert_called_once_with(greens, yellows, greys, scored, no_repeat, new_char)
+        report_wordle_solutions.assert_called_once_with(greens, yellows, greys, scored, no_repeat, new_char, top=10)
+
+    @patch("game_solvers.common.report.report_wordle_solutions")
+    def test_when_solution_and_entropy_strategy_then_ranked_words_passed_to_reporter(
+        self, report_wordle_solutions, cutdown_dictionary
+    ):
+        solver = WordleSolver([("A", 3)], [("N", [2])], ["S", "R", "U", "T", "W", "Y"])
+        solver.dictionary = cutdown_dictionary
+
+        solver.solutions(strategy="entropy")
+
+        ranked_words = report_wordle_solutions.call_args.kwargs["ranked_words"]
+        assert report_wordle_solutions.call_args.kwargs["strategy"] == "entropy"
+        assert len(ranked_words) == 10
+        assert ranked_words == solver.guess_ranker.rank("entropy", cutdown_dictionary, solver.valid_words())[:10]
+        assert ranked_words[0][1] > 2.0
+
+    @patch("game_solvers.common.report.report_wordle_solutions")
+    def test_when_solution_and_minimax_strategy_then_ranked_words_passed_to_reporter(
+        self, report_wordle_solutions, cutdown_dictionary
+    ):
+        solver = WordleSolver([("A", 3)], [("N", [2])], ["S", "R", "U", "T", "W", "Y"])
+        solver.dictionary = cutdown_dictionary
+
+        solver.solutions(strategy="minimax")
+
+        ranked_words = report_wordle_solutions.call_args.kwargs["ranked_words"]
+        assert report_wordle_solutions.call_args.kwargs["strategy"] == "minimax"
+        assert ranked_words == solver.guess_ranker.rank("minimax", cutdown_dictionary, solver.valid_words())[:10]
+        assert ranked_words[0][1] < len(solver.valid_words())
+
+    @patch("game_solvers.common.report.report_wordle_solutions")
+    def test_when_solution_and_top_then_lists_are_prefix_of_full_ordering(
+        self, report_wordle_solutions, solver_empty, cutdown_dictionary
+    ):
+        solver_empty.dictionary = cutdown_dictionary
+
+        solver_empty.solutions(strategy="entropy", top=3)
+
+        scored, non_repeating, new_char = report_wordle_solutions.call_args.args[3:]
+        full = solver_empty._generate_scored_words(cutdown_dictionary)
+        assert scored == full[:3]
+        assert non_repeating == [(word, score) for word, score in full if len(set(word)) == 5][:3]
+        assert new_char == full[:3]
+        assert report_wordle_solutions.call_args.kwargs["top"] == 3
+        assert len(report_wordle_solutions.call_args.kwargs["ranked_words"]) == 3
+
+    @mark.parametrize("top", [None, 0, 1, 4, 10])
+    def test_when_top_scored_then_same_as_stable_sort(self, top):
+        scored_words = [("AAAAA", 3), ("BBBBB", 5), ("CCCCC", 3), ("DDDDD", 1), ("EEEEE", 5), ("FFFFF", 3)]
+
+        expected = sorted(scored_words, key=lambda scored_word: scored_word[1], reverse=True)
+
+        assert WordleSolver.top_scored(iter(scored_words), top) == expected[:top]
+
+    @mark.parametrize("strategy", ["score", "entropy", "minimax"])
+    def test_when_suggestions_and_top_then_best_of_full_suggestions(self, strategy, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        solver_empty.apply_feedback("CRANE", "..g..")
+
+        assert solver_empty.suggestions(strategy, top=5) == solver_empty.suggestions(strategy)[:5]
+
+    @patch("game_solvers.common.report.report_wordle_solutions")
+    def test_when_solution_and_json_format_then_lists_written_without_report(
+        self, report_wordle_solutions, cutdown_dictionary, capsys
+    ):
+        solver = WordleSolver([("A", 3)], [("N", [2])], ["S", "R"])
+        solver.dictionary = cutdown_dictionary
+
+        solver.solutions(strategy="minimax", top=3, output_format="json")
+
+        actual = json.loads(capsys.readouterr().out)
+        report_wordle_solutions.assert_not_called()
+        assert actual["greens"] == [["A", 3]]
+        assert actual["strategy"] == "minimax"
+        assert actual["answers"] == [list(word) for word in solver._generate_scored_words(solver.candidates, 3)]
+        assert actual["minimax_guesses"] == [list(word) for word in solver.suggestions("minimax", 3)]
+        assert list(actual) == [
+            "greens",
+            "yellows",
+            "greys",
+            "strategy",
+            "answers",
+            "non_repeating_answers",
+            "new_letter_answers",
+            "minimax_guesses",
+        ]
+
+    @patch("game_solvers.common.report.report_wordle_solutions")
+    def test_when_solution_and_profiler_then_every_stage_recorded(self, report_wordle_solutions, cutdown_dictionary):
+        profiler = StageProfiler(trace_memory=False)
+        solver = WordleSolver([("A", 3)], [], [], WordleDictionary(cutdown_dictionary), profiler=profiler)
+
+        solver.solutions(strategy="entropy", top=3)
+
+        report = {stage["stage"]: stage for stage in profiler.report()}
+        assert list(report) == [
+            "load",
+            "distribution",
+            "filter",
+            "constraint-plan",
+            "word-scores",
+            "score",
+            "sort",
+            "non-repeating",
+            "new-char",
+            "rank",
+            "render",
+        ]
+        assert all(stage["calls"] == 1 for stage in report.values())
+        report_wordle_solutions.assert_called_once()
+
+    @fixture
+    def solver_tree(self, cutdown_dictionary):
+        """Solver over the cutdown dictionary with a decision tree built for it."""
+        solver = WordleSolver([], [], [])
+        solver.dictionary = cutdown_dictionary
+        solver.decision_tree = build_decision_tree(cutdown_dictionary, workers=1)
+        return solver
+
+    def test_when_suggestions_tree_then_tree_guesses_followed(self, solver_tree):
+        tree = solver_tree.decision_tree
+        answer = "ZESTY"
+
+        assert solver_tree.suggestions("tree") == [(tree.opener, len(solver_tree.dictionary))]
+
+        while (guess := solver_tree.suggestions("tree")[0][0]) != answer:
+            solver_tree.apply_feedback(guess, feedback(guess, answer))
+            assert solver_tree.suggestions("tree")[0][1] == len(solver_tree.candidates)
+
+        assert solver_tree.candidates == [answer]
+
+    def test_when_suggestions_tree_and_game_left_tree_then_ranked_by_entropy(self, solver_tree):
+        solver_tree.apply_feedback("ZESTY", feedback("ZESTY", "CRANE"))
+
+        actual = solver_tree.suggestions("tree", top=5)
+
+        assert actual == solver_tree.guess_ranker.rank("entropy", solver_tree.dictionary, solver_tree.candidates, 5)
+
+    def test_when_suggestions_tree_and_letters_given_then_ranked_by_entropy(self, solver_tree):
+        solver_tree.add_letters([("A", 3)], [], [])
+
+        actual = solver_tree.suggestions("tree", top=5)
+
+        assert actual == solver_tree.guess_ranker.rank("entropy", solver_tree.dictionary, solver_tree.candidates, 5)
+
+    def test_when_dictionary_replaced_then_decision_tree_forgotten(self, solver_tree, cutdown_dictionary):
+        solver_tree.dictionary = cutdown_dictionary[:100]
+
+        assert solver_tree._decision_tree is None
+
+    def test_when_suggestions_in_opening_turns_then_opening_book_used(self, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        book = build_opening_book(solver_empty.dictionary, "entropy", solver_empty.guess_ranker)
+        solver_empty.word_list._built["opening_book_entropy"] = book
+
+        assert solver_empty.suggestions("entropy", top=3) == book.first[:3]
+
+        pattern = feedback(book.opener, "ZESTY")
+        solver_empty.apply_feedback(book.opener, pattern)
+        with patch.object(solver_empty.guess_ranker, "rank") as rank:
+            actual = solver_empty.suggestions("entropy", top=3)
+
+        rank.assert_not_called()
+        assert actual == book.second[pattern][1][:3]
+
+    def test_when_suggestions_and_no_opening_book_then_ranked_live(self, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+
+        actual = solver_empty.suggestions("entropy", top=3)
+
+        assert solver_empty.opening_book("entropy") is None
+        assert actual == solver_empty.guess_ranker.rank("entropy", solver_empty.dictionary, solver_empty.candidates, 3)
+
+    def test_when_suggestions_and_letters_given_then_opening_book_skipped(self, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        solver_empty.add_letters([("Z", 1)], [], [])
+
+        actual = solver_empty.suggestions("minimax", top=3)
+
+        assert actual == solver_empty.guess_ranker.rank("minimax", cutdown_dictionary, solver_empty.candidates, 3)
+        assert "opening_book_minimax" in solver_empty.word_list._built
+
+    def test_when_close_then_only_ranker_owned_by_solver_closed(self, solver_empty, cutdown_dictionary):
+        solver_empty.dictionary = cutdown_dictionary
+        shared_ranker = solver_empty.guess_ranker
+
+        with patch.object(shared_ranker, "close") as close_shared:
+            solver_empty.close()
+        close_shared.assert_not_called()
+
+        solver = WordleSolver([], [], [], solver_empty.word_list)
+        solver.ranking_workers = 2
+        ranker = solver.guess_ranker
+        assert ranker is not shared_ranker
+
+        with patch.object(ranker, "close") as close_owned:
+            solver.close()
+        close_owned.assert_called_once_with()
@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+from game_solvers.games.wordle_benchmark import benchmark_solver, synthetic_words, wordle_benchmarks
+
+
+def test_when_synthetic_words_then_words_grown_with_same_position_letters(cutdown_words):
+    actual = synthetic_words(cutdown_words, 3)
+
+    assert len(actual) == 3 * len(cutdown_words)
+    assert actual[: len(cutdown_words)] == cutdown_words
+    for position in range(5):
+        assert {word[position] for word in actual} == {word[position] for word in cutdown_words}
+
+
+def test_when_synthetic_words_and_same_seed_then_same_words(cutdown_words):
+    assert synthetic_words(cutdown_words, 2, seed=1) == synthetic_words(cutdown_words, 2, seed=1)
+    assert synthetic_words(cutdown_words, 2, seed=1) != synthetic_words(cutdown_words, 2, seed=2)
+
+
+def test_when_synthetic_words_and_scale_one_then_words_unchanged(cutdown_words):
+    assert synthetic_words(cutdown_words, 1) == cutdown_words
+
+
+def test_when_benchmark_solver_then_candidates_ready(cutdown_words):
+    actual = benchmark_solver(cutdown_words)
+
+    assert actual.candidates == [word for word in cutdown_words if actual.valid_word(word)]
+    assert actual.candidates
+
+
+def test_when_wordle_benchmarks_then_every_stage_at_every_scale_runs(cutdown_words, capsys):
+    with patch("game_solvers.games.wordle_benchmark.WordleSolver.prep_words", return_value=cutdown_words):
+        benchmarks = list(wordle_benchmarks((1, 2)))
+        for _, func in benchmarks:
+            func()
+
+    stages = [
+        "dictionary",
+        "calculate_distribution",
+        "valid_word",
+        "valid_words",
+        "generate_scored_words",
+        "generate_non_repeating_words",
+        "generate_new_char_words",
+    ]
+    assert [name for name, _ in benchmarks] == [
+        "prep_words@1x",
+        "score_word@1x",
+        *[f"{stage}@1x" for stage in stages],
+        "report_wordle_solutions@1x",
+        "rank_entropy@1x",
+        "rank_entropy_full@1x",
+        "rank_minimax@1x",
+        "rank_minimax_full@1x",
+        *[f"{stage}@2x" for stage in stages],
+    ]
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,236 @@
+import random
+
+from game_solvers.games.wordle_constraints import (
+    LETTER_BITS,
+    POSITION_BITS,
+    ConstraintPlan,
+    LetterFrequencies,
+    WordLanes,
+    WordleConstraints,
+    mask_bits,
+    word_mask,
+)
+from game_solvers.games.wordle_patterns import feedback, parse_pattern
+from pytest import fixture, mark
+
+
+@fixture(scope="module")
+def word_lanes(dictionary):
+    return WordLanes(dictionary)
+
+
+def test_when_word_mask_then_one_bit_per_position():
+    actual = word_mask("ABACK")
+
+    assert actual == (
+        POSITION_BITS[0]["A"]
+        | POSITION_BITS[1]["B"]
+        | POSITION_BITS[2]["A"]
+        | POSITION_BITS[3]["C"]
+        | POSITION_BITS[4]["K"]
+    )
+    assert mask_bits(actual) == [0, 26 + 1, 52 + 0, 78 + 2, 104 + 10]
+
+
+def test_when_word_lanes_then_one_lane_per_word():
+    word_lanes = WordLanes(["ABACK", "ABASE", "ZUNIS"])
+
+    assert word_lanes.select(word_lanes.lanes[0]) == ["ABACK", "ABASE"]
+    assert word_lanes.select(word_lanes.present["S"]) == ["ABASE", "ZUNIS"]
+    assert word_lanes.select(word_lanes.all_of(word_mask("ABASE"))) == ["ABASE"]
+    assert word_lanes.select(word_lanes.any_of(POSITION_BITS[4]["K"] | POSITION_BITS[0]["Z"])) == ["ABACK", "ZUNIS"]
+    assert word_lanes.select(word_lanes.all) == ["ABACK", "ABASE", "ZUNIS"]
+
+
+def test_when_count_between_then_words_with_that_many_bits_selected():
+    word_lanes = WordLanes(["EERIE", "STEEP", "ALIEN", "CRANK"])
+    e_bits = sum(position_bits["E"] for position_bits in POSITION_BITS)
+
+    assert word_lanes.select(word_lanes.count_between(e_bits, 2, 2)) == ["STEEP"]
+    assert word_lanes.select(word_lanes.count_between(e_bits, 1, 5)) == ["EERIE", "STEEP", "ALIEN"]
+    assert word_lanes.select(word_lanes.count_between(e_bits, 0, 1)) == ["ALIEN", "CRANK"]
+    assert word_lanes.select(word_lanes.count_between(e_bits, 0, 0)) == ["CRANK"]
+    assert word_lanes.select(word_lanes.count_between(e_bits, 3, 5)) == ["EERIE"]
+
+
+@mark.parametrize(
+    "greens, yellows, greys",
+    [
+        ([], [], []),
+        ([("A", 3), ("D", 5)], [], []),
+        ([], [("M", [3, 4]), ("Y", [1])], []),
+        ([], [], ["Z", "W", "H", "C"]),
+        ([("A", 3), ("D", 5)], [("Y", [4, 5])], ["Z", "N", "C", "H"]),
+        ([("E", 4), ("L", 5)], [("E", [3])], ["A", "R", "O", "S", "I", "N", "T", "C", "U", "D", "W", "H"]),
+        ([("E", 3)], [("E", [5]), ("N", [2])], []),
+        ([], [("Q", [1, 2, 3, 4, 5])], []),
+    ],
+)
+def test_when_filter_then_matches_reference_valid_word(
+    greens, yellows, greys, dictionary, word_lanes, reference_valid_word
+):
+    constraints = WordleConstraints(greens, yellows, greys)
+
+    expected = [word for word in dictionary if reference_valid_word(greens, yellows, greys, word)]
+
+    assert constraints.filter(word_lanes) == expected
+    assert [word for word in dictionary if constraints.matches(word_mask(word))] == expected
+
+
+def test_when_filter_random_states_then_matches_reference_valid_word(
+    random_state, dictionary, word_lanes, reference_valid_word
+):
+    rng = random.Random(20240526)  # noqa: S311
+
+    for _ in range(25):
+        greens, yellows, greys = random_state(rng, dictionary)
+
+        expected = [word for word in dictionary if reference_valid_word(greens, yellows, greys, word)]
+
+        assert WordleConstraints(greens, yellows, greys).filter(word_lanes) == expected
+
+
+def test_when_letter_frequencies_then_positions_and_copies_counted():
+    frequencies = LetterFrequencies(WordLanes(["EERIE", "STEEP", "ALIEN"]))
+
+    assert frequencies.copy_counts["E"] == (0, 1, 1, 1, 0, 0)
+    assert frequencies.copy_counts["Q"] == (3, 0, 0, 0, 0, 0)
+    assert frequencies.position_counts[mask_bits(POSITION_BITS[3]["E"])[0]] == 2
+
+
+@mark.parametrize(
+    "mask, least, most, expected",
+    [
+        (LETTER_BITS["E"], 2, 5, 2 / 3),
+        (LETTER_BITS["S"], 0, 0, 2 / 3),
+        (POSITION_BITS[0]["E"], 1, 1, 1 / 3),
+        (POSITION_BITS[0]["E"] | POSITION_BITS[4]["P"], 0, 0, 1 / 3),
+        (POSITION_BITS[0]["E"] | POSITION_BITS[3]["E"], 0, 0, 0.0),
+    ],
+)
+def test_when_letter_frequencies_share_then_estimated_from_counts(mask, least, most, expected):
+    frequencies = LetterFrequencies(WordLanes(["EERIE", "STEEP", "ALIEN"]))
+
+    assert frequencies.share(mask, least, most) == expected
+
+
+def test_when_constraint_plan_select_and_no_words_left_then_later_checks_not_made():
+    word_lanes = WordLanes(["ABACK", "ABASE", "ALOFT"])
+    plan = ConstraintPlan(WordleConstraints([("Q", 1)], [], ["B"]), LetterFrequencies(word_lanes))
+
+    assert plan.select(word_lanes) == 0
+    assert plan.stats() == {
+        "words": 3,
+        "checks": 3,
+        "constraints": [
+            {"constraint": "green Q1", "selectivity": 0.0, "eliminated": 3},
+            {"constraint": "grey B", "selectivity": 1 / 3, "eliminated": 0},
+        ],
+    }
+
+
+def test_when_constraint_plan_then_checks_ordered_most_selective_first():
+    word_lanes = WordLanes(["ABACK", "ABASE", "ALOFT", "QUEEN"])
+    constraints = WordleConstraints([("A", 1)], [("S", [5])], ["Q"])
+
+    plan = ConstraintPlan(constraints, LetterFrequencies(word_lanes))
+
+    assert plan.names == ["S at least 1", "green A1", "grey Q", "S not 5"]
+    assert plan.selectivity == [0.25, 0.75, 0.75, 1.0]
+
+
+def test_when_constraint_plan_matches_then_eliminations_counted():
+    word_lanes = WordLanes(["ABACK", "ABASE", "ZUNIS", "QUEEN", "BASIN"])
+    plan = ConstraintPlan(WordleConstraints([("A", 1)], [("S", [5])], ["Q"]), LetterFrequencies(word_lanes))
+
+    actual = [word for word in word_lanes.words if plan.matches(word_mask(word))]
+
+    assert actual == ["ABASE"]
+    assert plan.stats() == {
+        "words": 5,
+        "checks": 9,
+        "constraints": [
+            {"constraint": "green A1", "selectivity": 0.4, "eliminated": 3},
+            {"constraint": "S at least 1", "selectivity": 0.6, "eliminated": 1},
+            {"constraint": "grey Q", "selectivity": 0.8, "eliminated": 0},
+            {"constraint": "S not 5", "selectivity": 0.8, "eliminated": 0},
+        ],
+    }
+
+
+def test_when_constraint_plan_random_states_then_matches_reference_valid_word(
+    random_state, dictionary, word_lanes, reference_valid_word
+):
+    rng = random.Random(20240528)  # noqa: S311
+
+    for _ in range(25):
+        greens, yellows, greys = random_state(rng, dictionary)
+        plan = ConstraintPlan(WordleConstraints(greens, yellows, greys), LetterFrequencies(word_lanes))
+
+        expected = [word for word in dictionary if reference_valid_word(greens, yellows, greys, word)]
+
+        assert [word for word in dictionary if plan.matches(word_mask(word))] == expected
+        assert plan.words_checked - len(expected) == sum(plan.eliminated)
+
+
+def test_when_constraint_plan_select_then_same_words_and_counts_as_matches(
+    random_state, dictionary, word_lanes, reference_valid_word
+):
+    rng = random.Random(20240601)  # noqa: S311
+
+    for _ in range(25):
+        constraints = WordleConstraints(*random_state(rng, dictionary))
+        word_by_word = ConstraintPlan(constraints, LetterFrequencies(word_lanes))
+        at_once = ConstraintPlan(constraints, LetterFrequencies(word_lanes))
+
+        expected = [word for word in dictionary if word_by_word.matches(word_mask(word))]
+
+        assert word_lanes.select(at_once.select(word_lanes)) == expected
+        assert at_once.stats() == word_by_word.stats()
+
+
+@mark.parametrize(
+    "greens, yellows, greys, expected",
+    [
+        ([("E", 4)], [], ["E"], ["ALIEN", "BAKED"]),
+        ([], [("E", [1])], ["E"], ["ALIEN", "BAKED"]),
+        ([("E", 4)], [("E", [1])], ["E"], ["STEEP"]),
+        ([], [], ["E"], ["CRANK"]),
+    ],
+)
+def test_when_grey_also_green_or_yellow_then_no_more_copies_allowed(greens, yellows, greys, expected):
+    word_lanes = WordLanes(["EERIE", "STEEP", "ALIEN", "BAKED", "CRANK"])
+    constraints = WordleConstraints(greens, yellows, greys)
+
+    assert constraints.filter(word_lanes) == expected
+    assert [word for word in word_lanes.words if constraints.matches(word_mask(word))] == expected
+
+
+def test_when_history_then_letter_counts_bounded_exactly():
+    # one E is green, the other grey, so the answer has exactly one E, and it is in the fourth position
+    constraints = WordleConstraints([], [], [], [("STEEP", parse_pattern("...g."))])
+
+    assert constraints.green_mask == POSITION_BITS[3]["E"]
+    assert constraints.letter_bounds == [("E", 1, 1)]
+    assert [name for name, _, _, _ in constraints.checks] == [
+        "green E4",
+        "E not 3",
+        "grey P",
+        "grey S",
+        "grey T",
+        "E exactly 1",
+    ]
+
+
+def test_when_history_random_games_then_matches_feedback(random_history, dictionary, word_lanes):
+    rng = random.Random(20240529)  # noqa: S311
+
+    for _ in range(10):
+        history = random_history(rng, dictionary)
+        constraints = WordleConstraints([], [], [], history)
+        plan = ConstraintPlan(constraints, LetterFrequencies(word_lanes))
+
+        expected = [word for word in dictionary if all(feedback(guess, word) == pattern for guess, pattern in history)]
+
+        assert constraints.filter(word_lanes) == expected
+        assert [word for word in dictionary if plan.matches(word_mask(word))] == expected
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import PropertyMock, patch
+
+from game_solvers.games.wordle_constraints import WordLanes
+from game_solvers.games.wordle_dictionary import WordleDictionary, calculate_distribution, load_dictionary, read_words
+from pytest import fixture, raises
+
+
+@fixture
+def dictionary(cutdown_words):
+    return WordleDictionary(cutdown_words)
+
+
+def test_when_load_dictionary_then_loaded_once_per_resource(cutdown_words):
+    with (
+        patch("game_solvers.games.wordle_dictionary._loaded_dictionaries", {}),
+        patch("game_solvers.games.wordle_dictionary.read_words", return_value=cutdown_words) as read_words,
+    ):
+        first = load_dictionary("custom_words")
+        actual = load_dictionary("custom_words")
+
+    read_words.assert_called_once_with("custom_words")
+    assert actual is first
+    assert actual.words == tuple(cutdown_words)
+
+
+def test_when_load_dictionary_and_no_resource_then_bundled_dictionary_loaded():
+    assert load_dictionary().words == tuple(read_words())
+
+
+def test_when_read_words_and_compiled_word_list_stale_then_csv_read_with_warning(caplog):
+    stale = ValueError("Compiled word list is stale, its csv source has changed since it was compiled.")
+    with (
+        patch("game_solvers.games.wordle_dictionary.read_word_list_resource", side_effect=stale),
+        patch("game_solvers.games.wordle_dictionary.read_data_resource", return_value=[["aback", "zunis"]]),
+    ):
+        actual = read_words("custom_words")
+
+    assert actual == ["ABACK", "ZUNIS"]
+    assert "Compiled word list custom_words.bin is unusable" in caplog.text
+
+
+def test_when_init_then_words_copied(cutdown_words):
+    words = list(cutdown_words)
+    actual = WordleDictionary(words)
+
+    words.append("ZZZZZ")
+
+    assert actual.words == tuple(cutdown_words)
+
+
+def test_when_distribution_then_copy_returned(dictionary, cutdown_words):
+    dictionary.distribution["A"] = 0
+
+    assert dictionary.distribution == calculate_distribution(cutdown_words)
+
+
+def test_when_shared_values_changed_then_raise_error(dictionary):
+    with raises(TypeError):
+        dictionary.distribution_view["A"] = 0
+    with raises(TypeError):
+        dictionary.word_scores["ABACK"] = 0
+
+    assert isinstance(dictionary.words, tuple)
+    assert dictionary.distribution_view is dictionary.distribution_view
+
+
+def test_when_indexes_then_built_once(dictionary):
+    assert dictionary.word_lanes is dictionary.word_lanes
+    assert dictionary.word_index is dictionary.word_index
+    assert dictionary.word_scores is dictionary.word_scores
+    assert dictionary.guess_ranker.pattern_matrix is dictionary.pattern_matrix
+
+
+def test_when_indexes_needed_by_many_threads_then_built_once(dictionary):
+    with (
+        patch("game_solvers.games.wordle_dictionary.WordLanes", wraps=WordLanes) as word_lanes,
+        ThreadPoolExecutor(8) as executor,
+    ):
+        actual = list(executor.map(lambda _: dictionary.word_lanes, range(32)))
+
+    word_lanes.assert_called_once_with(dictionary.words)
+    assert all(lanes is actual[0] for lanes in actual)
+
+
+def test_when_opening_book_then_read_without_pattern_matrix():
+    with patch.object(WordleDictionary, "pattern_matrix", new_callable=PropertyMock) as pattern_matrix:
+        actual = WordleDictionary(read_words()).opening_book("entropy")
+
+    pattern_matrix.assert_not_called()
+    assert actual.strategy == "entropy"
+
+
+def test_when_opening_book_not_compiled_for_words_then_none_and_not_built(cutdown_words):
+    dictionary = WordleDictionary(cutdown_words)
+
+    with patch("game_solvers.games.wordle_openings.build_opening_book") as build:
+        actual = dictionary.opening_book("minimax")
+
+    build.assert_not_called()
+    assert actual is None
+    assert "guess_ranker" not in dictionary._built
+
+
+def test_when_preload_then_query_indexes_built(dictionary):
+    dictionary.preload()
+
+    assert {"distribution", "word_lanes", "word_scores", "pattern_rows", "guess_ranker"} <= set(dictionary._built)
@@ -0,0 +1,82 @@
+import random
+
+from game_solvers.games.wordle_constraints import POSITION_BITS, WordleConstraints
+from game_solvers.games.wordle_index import WordIndex
+from game_solvers.games.wordle_patterns import feedback
+from pytest import fixture, mark
+
+
+@fixture(scope="module")
+def word_index(dictionary):
+    return WordIndex(dictionary)
+
+
+def test_when_word_index_then_posting_lists_hold_word_ids():
+    word_index = WordIndex(["ABACK", "ABASE", "ZUNIS"])
+
+    assert word_index.positions[0] == {0, 1}
+    assert word_index.positions[POSITION_BITS[4]["S"].bit_length() - 1] == {2}
+    assert word_index.present["A"] == {0, 1}
+    assert word_index.present["S"] == {1, 2}
+    assert word_index.present["Q"] == set()
+
+
+@mark.parametrize(
+    "greens, yellows, greys, expected",
+    [
+        ([], [], [], 3),
+        ([], [], ["B"], 3),
+        ([("Z", 1)], [], [], 1),
+        ([("A", 1)], [("Z", [5])], [], 1),
+        ([], [("A", [2])], [], 2),
+    ],
+)
+def test_when_driver_size_then_smallest_required_posting_list(greens, yellows, greys, expected):
+    word_index = WordIndex(["ABACK", "ABASE", "ZUNIS"])
+
+    assert word_index.driver_size(WordleConstraints(greens, yellows, greys, [])) == expected
+
+
+@mark.parametrize(
+    "greens, yellows, greys",
+    [
+        ([], [], []),
+        ([("A", 3), ("D", 5)], [], []),
+        ([], [("M", [3, 4]), ("Y", [1])], []),
+        ([], [], ["Z", "W", "H", "C"]),
+        ([("A", 3), ("D", 5)], [("Y", [4, 5])], ["Z", "N", "C", "H"]),
+        ([("E", 4), ("L", 5)], [("E", [3])], ["A", "R", "O", "S", "I", "N", "T", "C", "U", "D", "W", "H"]),
+        ([("E", 3)], [("E", [5]), ("N", [2])], []),
+        ([], [("Q", [1, 2, 3, 4, 5])], []),
+    ],
+)
+def test_when_filter_then_matches_reference_valid_word(
+    greens, yellows, greys, dictionary, word_index, reference_valid_word
+):
+    expected = [word for word in dictionary if reference_valid_word(greens, yellows, greys, word)]
+
+    assert word_index.filter(WordleConstraints(greens, yellows, greys)) == expected
+
+
+def test_when_filter_random_states_then_matches_reference_valid_word(
+    random_state, dictionary, word_index, reference_valid_word
+):
+    rng = random.Random(20240527)  # noqa: S311
+
+    for _ in range(25):
+        greens, yellows, greys = random_state(rng, dictionary)
+
+        expected = [word for word in dictionary if reference_valid_word(greens, yellows, greys, word)]
+
+        assert word_index.filter(WordleConstraints(greens, yellows, greys)) == expected
+
+
+def test_when_filter_history_then_matches_feedback(random_history, dictionary, word_index):
+    rng = random.Random(20240530)  # noqa: S311
+
+    for _ in range(10):
+        history = random_history(rng, dictionary)
+
+        expected = [word for word in dictionary if all(feedback(guess, word) == pattern for guess, pattern in history)]
+
+        assert word_index.filter(WordleConstraints([], [], [], history)) == expected
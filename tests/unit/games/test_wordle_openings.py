@@ -0,0 +1,164 @@
+import json
+import logging
+import re
+from unittest.mock import patch
+
+from game_solvers.common.wordlist import read_word_list_resource
+from game_solvers.games.wordle_openings import (
+    OPENING_BOOK_DEPTH,
+    OpeningBook,
+    build_opening_book,
+    compile_opening_books,
+    load_opening_book,
+    opening_book_resource,
+    read_opening_book,
+    write_opening_book,
+)
+from game_solvers.games.wordle_patterns import feedback, load_pattern_matrix
+from game_solvers.games.wordle_ranking import GuessRanker
+from pytest import fixture, mark, raises
+
+
+@fixture
+def words(cutdown_words):
+    return cutdown_words[:300]
+
+
+@fixture
+def guess_ranker(words):
+    return GuessRanker(words, load_pattern_matrix(words))
+
+
+@fixture
+def book():
+    return OpeningBook(
+        "entropy",
+        [("RAISE", 5.1), ("ARISE", 5.0)],
+        {0: (40, [("CLOUT", 3.2), ("COUNT", 3.1)]), 5: (2, [("BRINE", 1.0)])},
+    )
+
+
+@mark.parametrize("strategy", ["entropy", "minimax"])
+def test_when_build_then_rankings_match_live_rankings(strategy, words, guess_ranker):
+    actual = build_opening_book(words, strategy, guess_ranker)
+
+    assert actual.first == guess_ranker.rank(strategy, words, words)[:OPENING_BOOK_DEPTH]
+    assert sum(count for count, _ in actual.second.values()) == len(words) - 1
+    for pattern, (count, ranked) in list(actual.second.items())[::10]:
+        bucket = [word for word in words if feedback(actual.opener, word) == pattern]
+        assert count == len(bucket)
+        assert ranked == guess_ranker.rank(strategy, words, bucket)[:OPENING_BOOK_DEPTH]
+
+
+def test_when_build_and_strategy_not_ranking_then_raise_error(words, guess_ranker):
+    with raises(
+        ValueError, match=re.escape("Opening books are only built for entropy, minimax. Input tree is invalid.")
+    ):
+        build_opening_book(words, "tree", guess_ranker)
+
+
+@mark.parametrize(
+    "history, candidate_count, top, expected",
+    [
+        ([], 300, 1, [("RAISE", 5.1)]),
+        ([], 300, 10, [("RAISE", 5.1), ("ARISE", 5.0)]),
+        ([("RAISE", 0)], 40, 5, [("CLOUT", 3.2), ("COUNT", 3.1)]),
+        ([("RAISE", 5)], 2, 1, [("BRINE", 1.0)]),
+    ],
+)
+def test_when_lookup_and_state_in_book_then_ranking_returned(history, candidate_count, top, expected, book):
+    assert book.lookup(history, candidate_count, 300, top) == expected
+
+
+@mark.parametrize(
+    "history, candidate_count, top",
+    [
+        ([], 300, None),
+        ([], 300, OPENING_BOOK_DEPTH + 1),
+        ([], 299, 5),
+        ([("RAISE", 0)], 39, 5),
+        ([("RAISE", 7)], 40, 5),
+        ([("ARISE", 0)], 40, 5),
+        ([("RAISE", 0), ("CLOUT", 0)], 40, 5),
+    ],
+)
+def test_when_lookup_and_state_not_in_book_then_none_returned(history, candidate_count, top, book):
+    assert book.lookup(history, candidate_count, 300, top) is None
+
+
+def test_when_write_then_read_gives_same_book(book, words, tmp_path):
+    actual = read_opening_book(words, write_opening_book(book, words, tmp_path / "book.json"))
+
+    assert actual.strategy == book.strategy
+    assert actual.first == book.first
+    assert actual.second == book.second
+
+
+def test_when_read_and_book_for_other_words_then_raise_error(book, words, tmp_path):
+    path = write_opening_book(book, words, tmp_path / "book.json")
+
+    with raises(ValueError, match="Opening book was built for a different word list."):
+        read_opening_book(words[:100], path)
+
+
+@fixture
+def resources(tmp_path):
+    (tmp_path / "data").mkdir()
+    with patch("game_solvers.games.wordle_openings.resources_path", return_value=tmp_path):
+        yield tmp_path / "data"
+
+
+def test_when_compile_then_book_of_every_strategy_written(words, book, resources):
+    with (
+        patch("game_solvers.games.wordle_openings.read_word_list_resource", return_value=words),
+        patch("game_solvers.games.wordle_openings.build_opening_book", return_value=book) as build,
+    ):
+        actual = compile_opening_books(workers=1)
+
+    assert actual == [resources / "wordle_openings_entropy.json", resources / "wordle_openings_minimax.json"]
+    assert [call.args[1] for call in build.call_args_list] == ["entropy", "minimax"]
+    assert read_opening_book(words, actual[0]).first == book.first
+
+
+@mark.parametrize("strategy", ["entropy", "minimax"])
+def test_when_load_bundled_book_then_read_for_bundled_dictionary(strategy):
+    words = read_word_list_resource("words_alpha_five_letters.bin")
+
+    with patch("game_solvers.games.wordle_openings.build_opening_book") as build:
+        actual = load_opening_book(words, strategy)
+
+    build.assert_not_called()
+    assert actual.strategy == strategy
+    assert len(actual.first) == OPENING_BOOK_DEPTH
+
+
+def test_when_load_and_book_compiled_then_read(words, book, resources):
+    write_opening_book(book, words, resources / opening_book_resource("entropy"))
+
+    actual = load_opening_book(words, "entropy")
+
+    assert actual.first == book.first
+    assert actual.second == book.second
+
+
+def test_when_load_and_no_book_then_none_returned_with_warning(words, resources, caplog):
+    with (
+        caplog.at_level(logging.WARNING, logger="WordleSolver"),
+        patch("game_solvers.games.wordle_openings.build_opening_book") as build,
+    ):
+        actual = load_opening_book(words, "entropy")
+
+    build.assert_not_called()
+    assert actual is None
+    assert "not found, ranking the opening turns live" in caplog.text
+
+
+@mark.parametrize("document", [{"version": 0}, {"version": 2, "words": "0123456789abcdef"}, {"version": 2}])
+def test_when_load_and_book_unusable_then_none_returned_with_warning(document, words, resources, caplog):
+    (resources / opening_book_resource("minimax")).write_text(json.dumps(document))
+
+    with caplog.at_level(logging.WARNING, logger="WordleSolver"):
+        actual = load_opening_book(words, "minimax")
+
+    assert actual is None
+    assert "is unusable" in caplog.text
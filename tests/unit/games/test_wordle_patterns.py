@@ -0,0 +1,90 @@
+import random
+import re
+from unittest.mock import patch
+
+from game_solvers.games.wordle_patterns import (
+    ALL_GREEN,
+    PatternRows,
+    feedback,
+    load_pattern_matrix,
+    parse_pattern,
+    pattern_matrix_path,
+    pattern_string,
+)
+from pytest import mark, raises
+
+
+@mark.parametrize(
+    "guess, answer, expected",
+    [
+        ("CRANE", "CRANE", "ggggg"),
+        ("CRANE", "SLOTH", "....."),
+        ("CRANE", "NACRE", "yyyyg"),
+        ("SPEED", "ABIDE", "..y.y"),
+        ("ABBEY", "BABES", "yygg."),
+        ("EERIE", "THEME", "y...g"),
+        ("SPEED", "ERASE", "y.yy."),
+        ("LLAMA", "HELLO", "yy..."),
+        ("EMCEE", "THEME", "yy..g"),
+        ("ALLEE", "LEVEL", ".yygy"),
+    ],
+)
+def test_when_feedback_then_duplicate_letters_follow_wordle_rules(guess, answer, expected):
+    assert pattern_string(feedback(guess, answer)) == expected
+
+
+@mark.parametrize(
+    "value, expected",
+    [("ggggg", ALL_GREEN), (".....", 0), ("y....", 1), ("g....", 2), ("....g", 162), ("GY-bX", 5), ("21000", 5)],
+)
+def test_when_parse_pattern_then_base_three_pattern_returned(value, expected):
+    assert parse_pattern(value) == expected
+
+
+@mark.parametrize("value", ["gggg", "gggggg", "gyzgg", ""])
+def test_when_parse_pattern_and_invalid_then_raise_error(value):
+    err_msg = re.escape(
+        f"Feedback patterns must be five characters of g (green), y (yellow) or . (grey). Input {value} is invalid."
+    )
+
+    with raises(ValueError, match=err_msg):
+        parse_pattern(value)
+
+
+def test_when_pattern_string_and_parse_pattern_then_round_trip():
+    assert all(parse_pattern(pattern_string(pattern)) == pattern for pattern in range(ALL_GREEN + 1))
+
+
+def test_when_pattern_rows_then_matches_feedback(dictionary):
+    rng = random.Random(20240528)  # noqa: S311
+    answers = rng.sample(dictionary, 500)
+    guesses = rng.sample(dictionary, 50) + ["EERIE", "EMCEE", "SASSY", "LLAMA", "ABBEY"]
+
+    pattern_rows = PatternRows(answers)
+
+    for guess in guesses:
+        assert list(pattern_rows.row(guess)) == [feedback(guess, answer) for answer in answers]
+
+
+def test_when_load_pattern_matrix_then_built_once_and_mapped(cache_dir, cutdown_words):
+    words = cutdown_words[:300]
+
+    matrix = load_pattern_matrix(words)
+    assert pattern_matrix_path(words).parent == cache_dir
+    assert pattern_matrix_path(words).exists()
+
+    for guess_index in range(0, 300, 37):
+        assert list(matrix.row(guess_index)) == [feedback(words[guess_index], answer) for answer in words]
+    assert matrix.pattern(5, 5) == ALL_GREEN
+    matrix.close()
+
+    with patch("game_solvers.games.wordle_patterns.build_pattern_matrix") as build_pattern_matrix:
+        reloaded = load_pattern_matrix(words)
+        build_pattern_matrix.assert_not_called()
+
+    assert reloaded.pattern(3, 7) == feedback(words[3], words[7])
+    reloaded.close()
+
+
+def test_when_load_pattern_matrix_and_words_differ_then_separate_cache(cutdown_words):
+    assert pattern_matrix_path(cutdown_words[:300]) != pattern_matrix_path(cutdown_words[1:301])
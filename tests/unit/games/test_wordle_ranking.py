@@ -0,0 +1,193 @@
+import math
+from collections import Counter
+
+from game_solvers.games.wordle_patterns import feedback, load_pattern_matrix
+from game_solvers.games.wordle_ranking import (
+    GuessRanker,
+    entropy,
+    entropy_bounds,
+    expected_bucket_size,
+    letter_bitsets,
+    worst_case_bounds,
+)
+from pytest import fixture, mark, raises
+
+
+@fixture
+def words(cutdown_words):
+    return cutdown_words[:400]
+
+
+def expected_entropy(guess, candidates):
+    sizes = Counter(feedback(guess, candidate) for candidate in candidates).values()
+    return -sum(size / len(candidates) * math.log2(size / len(candidates)) for size in sizes)
+
+
+def test_when_entropy_then_expected_information_returned():
+    assert entropy([1, 1, 1, 1], 4) == 2.0
+    assert entropy([4], 4) == 0.0
+    assert math.isclose(entropy([2, 1, 1], 4), 1.5)
+
+
+def test_when_expected_bucket_size_then_mean_candidates_left_returned():
+    assert expected_bucket_size([1, 1, 1, 1], 4) == 1.0
+    assert expected_bucket_size([4], 4) == 4.0
+    assert expected_bucket_size([2, 1, 1], 4) == 1.5
+
+
+def test_when_entropy_bounds_then_never_below_entropy(words):
+    candidates = words[100:180]
+
+    bounds = entropy_bounds(words, candidates)
+
+    assert len(bounds) == len(words)
+    for guess, bound in zip(words, bounds, strict=True):
+        assert bound >= expected_entropy(guess, candidates) - 1e-9
+        assert bound <= math.log2(len(candidates)) + 1e-9
+
+
+@mark.parametrize("guess", ["EERIE", "SASSY", "LLAMA", "ABBEY", "EEEEE"])
+def test_when_entropy_bounds_of_repeated_letters_then_never_below_entropy(guess):
+    candidates = ["EERIE", "THERE", "GEESE", "EVERY", "SASSY", "ASSAY", "LLAMA", "ALLAY", "ABBEY", "BELLE", "CRANE"]
+
+    (bound,) = entropy_bounds([guess], candidates)
+
+    assert bound >= expected_entropy(guess, candidates) - 1e-9
+
+
+def test_when_letter_bitsets_then_bits_match_candidates():
+    candidates = ["GEESE", "CRANE", "EERIE"]
+
+    every, positions, copies = letter_bitsets(candidates)
+
+    assert every == 0b111
+    assert positions[0]["E"] == 0b100
+    assert positions[4]["E"] == 0b111
+    assert positions[0].get("Z", 0) == 0
+    assert copies["E"][:4] == [0b111, 0b101, 0b101, 0]
+    assert "Z" not in copies
+
+
+def test_when_worst_case_bounds_then_size_of_a_bucket_never_above_worst_case(words):
+    candidates = words[100:180]
+
+    bounds = worst_case_bounds(words, candidates)
+
+    assert len(bounds) == len(words)
+    for guess, bound in zip(words, bounds, strict=True):
+        sizes = Counter(feedback(guess, candidate) for candidate in candidates).values()
+        assert bound in sizes or bound == 0
+        assert bound <= max(sizes)
+
+
+@mark.parametrize("use_matrix", [True, False])
+def test_when_bucket_sizes_then_match_feedback_counts(use_matrix, words):
+    ranker = GuessRanker(words, load_pattern_matrix(words) if use_matrix else None)
+    candidates = words[10:60]
+
+    for guess, sizes in ranker.bucket_sizes(words[:20], candidates):
+        assert sorted(sizes) == sorted(Counter(feedback(guess, candidate) for candidate in candidates).values())
+
+
+@mark.parametrize("use_matrix", [True, False])
+def test_when_rank_entropy_then_ordered_by_expected_information(use_matrix, words):
+    ranker = GuessRanker(words, load_pattern_matrix(words) if use_matrix else None)
+    candidates = words[100:180]
+
+    actual = ranker.rank("entropy", words, candidates)
+
+    assert len(actual) == len(words)
+    assert [score for _, score in actual] == sorted((score for _, score in actual), reverse=True)
+    for guess, score in actual[:10]:
+        assert math.isclose(score, expected_entropy(guess, candidates), abs_tol=1e-4)
+
+
+@mark.parametrize("use_matrix", [True, False])
+def test_when_rank_minimax_then_ordered_by_worst_case_then_expected_bucket(use_matrix, words):
+    ranker = GuessRanker(words, load_pattern_matrix(words) if use_matrix else None)
+    candidates = words[100:180]
+
+    actual = ranker.rank("minimax", words, candidates)
+
+    sizes = {guess: list(Counter(feedback(guess, candidate) for candidate in candidates).values()) for guess in words}
+    keys = [(max(sizes[guess]), expected_bucket_size(sizes[guess], len(candidates))) for guess, _ in actual]
+    assert len(actual) == len(words)
+    assert keys == sorted(keys)
+    assert [score for _, score in actual] == [worst for worst, _ in keys]
+
+
+@mark.parametrize("strategy", ["entropy", "minimax"])
+@mark.parametrize("use_matrix", [True, False])
+@mark.parametrize("candidates", [slice(100, 180), slice(0, 400), slice(250, 253)])
+def test_when_rank_top_then_same_as_best_of_full_ranking(strategy, use_matrix, candidates, words):
+    ranker = GuessRanker(words, load_pattern_matrix(words) if use_matrix else None)
+
+    full = ranker.rank(strategy, words, words[candidates])
+
+    for top in (1, 5, 25):
+        assert ranker.rank(strategy, words, words[candidates], top=top) == full[:top]
+
+
+def test_when_rank_minimax_top_then_no_more_guesses_bucketed_than_entropy(words):
+    ranker = GuessRanker(words, load_pattern_matrix(words))
+    bucket_sizes = ranker.bucket_sizes
+    bucketed = Counter()
+
+    def count_bucketed(guesses, candidates):
+        for guess, sizes in bucket_sizes(guesses, candidates):
+            bucketed[strategy] += 1
+            yield guess, sizes
+
+    ranker.bucket_sizes = count_bucketed
+    for strategy in ("entropy", "minimax"):
+        ranker.rank(strategy, words, words[0:400:3], top=10)
+
+    assert 0 < bucketed["minimax"] <= bucketed["entropy"] < len(words)
+
+
+@mark.parametrize("strategy", ["entropy", "minimax"])
+def test_when_rank_top_zero_then_nothing_ranked(strategy, words):
+    assert GuessRanker(words).rank(strategy, words, words[:5], top=0) == []
+
+
+def test_when_rank_and_scores_tie_then_possible_answers_first(words):
+    ranker = GuessRanker(words)
+
+    actual = ranker.rank("entropy", words, [words[250]])
+
+    assert actual[0] == (words[250], 0.0)
+
+
+@mark.parametrize("strategy", ["entropy", "minimax"])
+def test_when_rank_and_no_candidates_then_nothing_ranked(strategy, words):
+    assert GuessRanker(words).rank(strategy, words, []) == []
+
+
+def test_when_rank_and_unknown_strategy_then_raise_error(words):
+    with raises(ValueError, match="Unknown ranking strategy magic."):
+        GuessRanker(words).rank("magic", words, words[:5])
+
+
+@fixture
+def parallel_ranker(words):
+    ranker = GuessRanker(words, load_pattern_matrix(words), workers=2)
+    ranker.parallel_min_patterns = 0
+    yield ranker
+    ranker.close()
+
+
+@mark.parametrize("strategy", ["entropy", "minimax"])
+@mark.parametrize("top", [None, 1, 25])
+def test_when_rank_with_workers_then_same_as_ranking_in_process(strategy, top, parallel_ranker, words):
+    expected = GuessRanker(words, load_pattern_matrix(words)).rank(strategy, words, words[100:180], top)
+
+    assert parallel_ranker.rank(strategy, words, words[100:180], top) == expected
+    assert parallel_ranker._executor is not None
+
+
+def test_when_rank_with_workers_and_ranking_small_then_ranked_in_process(words):
+    ranker = GuessRanker(words, workers=2)
+
+    ranker.rank("entropy", words, words[:5], top=5)
+
+    assert ranker._executor is None
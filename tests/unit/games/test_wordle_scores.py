@@ -0,0 +1,45 @@
+from game_solvers.games.wordle import WordleSolver
+from game_solvers.games.wordle_constraints import WordLanes
+from game_solvers.games.wordle_scores import LetterCounts, letter_score, letter_score_table
+from pytest import mark
+
+
+@mark.parametrize(
+    "count, occurrence, expected",
+    [(1000, 0, 1000), (1000, 1, 500), (1000, 2, 250), (1000, 3, 125), (1000, 4, 68), (7, 1, 4), (5, 4, 0)],
+)
+def test_when_letter_score_then_occurrence_decayed(count, occurrence, expected):
+    assert letter_score(count, occurrence) == expected
+
+
+def test_when_letter_score_table_then_occurrence_scores_totalled():
+    assert letter_score_table(1000) == [0, 1000, 1500, 1750, 1875, 1943]
+
+
+def test_when_letter_counts_then_columns_hold_count_of_each_letter():
+    actual = LetterCounts(WordLanes(["EERIE", "ABBEY", "SLOTH"]))
+
+    assert actual.columns["E"] == bytes([3, 1, 0])
+    assert actual.columns["B"] == bytes([0, 2, 0])
+    assert actual.columns["Z"] == bytes([0, 0, 0])
+
+
+def test_when_distribution_then_same_as_calculate_distribution(dictionary):
+    actual = LetterCounts(WordLanes(dictionary)).distribution()
+
+    assert actual == WordleSolver.calculate_distribution(dictionary)
+
+
+def test_when_scores_then_same_as_score_word(dictionary):
+    words = [*dictionary, "AAAAA", "EEEEZ", "QQXQQ"]
+    distribution = WordleSolver.calculate_distribution(dictionary)
+
+    actual = LetterCounts(WordLanes(words)).scores(distribution)
+
+    assert actual == [WordleSolver.score_word(word, distribution) for word in words]
+
+
+def test_when_scores_and_letter_not_in_distribution_then_letter_scores_nothing():
+    actual = LetterCounts(WordLanes(["ABBEY", "SLOTH"])).scores({"B": 10, "S": 4})
+
+    assert actual == [15, 4]
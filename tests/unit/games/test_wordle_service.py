@@ -0,0 +1,189 @@
+import json
+import logging
+import os
+import re
+from unittest.mock import Mock, call, patch
+
+from game_solvers.common.cache import StateCache
+from game_solvers.games import wordle_service
+from game_solvers.games.wordle import WordleSolver
+from game_solvers.games.wordle_dictionary import WordleDictionary
+from game_solvers.games.wordle_patterns import feedback, pattern_string
+from game_solvers.games.wordle_service import (
+    cache_stats,
+    canonical_state,
+    handle_request,
+    init_worker,
+    log_cache_stats,
+    solve,
+)
+from pytest import fixture, mark, raises
+
+
+@fixture
+def solver(cutdown_words):
+    return init_worker(cutdown_words)
+
+
+def test_when_solve_and_letters_then_candidates_and_suggestions_returned(solver, cutdown_words):
+    actual = solve(solver, {"greens": [["a", 3]], "yellows": [["N", [2]]], "greys": ["s", "R"], "limit": 3})
+
+    expected = WordleSolver([("A", 3)], [("N", [2])], ["S", "R"])
+    expected.dictionary = cutdown_words
+    assert actual == {
+        "strategy": "score",
+        "candidate_count": len(expected.valid_words()),
+        "candidates": expected.valid_words()[:3],
+        "suggestions": [[word, score] for word, score in expected.suggestions()[:3]],
+    }
+
+
+def test_when_solve_and_history_then_candidates_match_feedback(solver, cutdown_words):
+    history = [[guess, pattern_string(feedback(guess, "ABACK"))] for guess in ["SLATE", "CRONY"]]
+
+    actual = solve(solver, {"history": history, "strategy": "minimax", "limit": 2})
+
+    expected = [
+        word for word in cutdown_words if all(feedback(guess, word) == feedback(guess, "ABACK") for guess, _ in history)
+    ]
+    assert actual["candidate_count"] == len(expected)
+    assert actual["candidates"] == expected[:2]
+    assert "ABACK" in expected
+    assert len(actual["suggestions"]) == 2
+    assert actual["strategy"] == "minimax"
+
+
+def test_when_solve_then_previous_request_forgotten(solver, cutdown_words):
+    solve(solver, {"greys": ["A", "E"]})
+
+    actual = solve(solver, {})
+
+    assert actual["candidate_count"] == len(cutdown_words)
+
+
+@mark.parametrize(
+    "request_value,err_msg",
+    [
+        ({"strategy": "magic"}, "Strategy must be one of score, entropy, minimax, tree. Input magic is invalid."),
+        ({"limit": 0}, "Limit must be a positive integer. Input 0 is invalid."),
+        ({"limit": True}, "Limit must be a positive integer. Input True is invalid."),
+        ({"greens": "A3"}, "Field greens must be a list. Input A3 is invalid."),
+        (
+            {"greens": [["A", 6]]},
+            "Each green letter must be a letter and a number from 1-5. Input ['A', 6] is invalid.",
+        ),
+        (
+            {"greens": [["AB", 1]]},
+            "Each green letter must be a letter and a number from 1-5. Input ['AB', 1] is invalid.",
+        ),
+        (
+            {"yellows": [["N", []]]},
+            "Each yellow letter must be a letter and a list of one to four numbers from 1-5. Input ['N', []] is invalid.",
+        ),
+        (
+            {"yellows": [["N", 2]]},
+            "Each yellow letter must be a letter and a list of one to four numbers from 1-5. Input ['N', 2] is invalid.",
+        ),
+        ({"greys": ["1"]}, "Each grey letter must be a single letter. Input 1 is invalid."),
+        ({"history": [["CRANE"]]}, "Each history entry must be a guess and its feedback. Input ['CRANE'] is invalid."),
+        ({"history": [["CRANE", "gyy"]]}, "Feedback patterns must be five characters"),
+    ],
+)
+def test_when_solve_and_request_invalid_then_raise_error(solver, request_value, err_msg):
+    with raises(ValueError, match=re.escape(err_msg)):
+        solve(solver, request_value)
+
+
+def test_when_handle_request_then_worker_solver_loaded_once(cutdown_words):
+    with (
+        patch.object(wordle_service, "_worker_solver", None),
+        patch(
+            "game_solvers.games.wordle.load_dictionary", return_value=WordleDictionary(cutdown_words)
+        ) as load_dictionary,
+    ):
+        handle_request({"greys": ["A"]})
+        actual = handle_request({})
+
+    load_dictionary.assert_called_once_with()
+    assert actual["candidate_count"] == len(cutdown_words)
+
+
+def test_when_canonical_state_then_equivalent_states_equal():
+    actual = canonical_state(
+        [("E", 5), ("A", 3), ("E", 5)], [("N", [4]), ("L", [1]), ("N", [2, 4])], ["S", "R", "S"], [("CRANE", 27)]
+    )
+
+    assert actual == ([("A", 3), ("E", 5)], [("L", [1]), ("N", [2, 4])], ["R", "S"], [("CRANE", 27)])
+
+
+def test_when_solve_and_equivalent_state_cached_then_cached_response_returned(solver):
+    cache = StateCache(10)
+    expected = solve(solver, {"greens": [["a", 3]], "yellows": [["N", [2]], ["n", [4]]], "greys": ["s", "R"]}, cache)
+
+    with patch.object(solver, "suggestions") as suggestions:
+        actual = solve(solver, {"greys": ["R", "S", "r"], "yellows": [["N", [4, 2]]], "greens": [["A", 3]]}, cache)
+
+    suggestions.assert_not_called()
+    assert actual == expected
+    assert cache.stats() == {"size": 1, "hits": 1, "store_hits": 0, "misses": 1, "evictions": 0}
+
+
+def test_when_solve_and_state_differs_then_not_answered_from_cache(solver):
+    cache = StateCache(10)
+    solve(solver, {"greys": ["S"], "strategy": "score", "limit": 3}, cache)
+
+    solve(solver, {"greys": ["S"], "strategy": "score", "limit": 4}, cache)
+    solve(solver, {"greys": ["S"], "strategy": "entropy", "limit": 3}, cache)
+    solve(solver, {"history": [["CRANE", "....."]]}, cache)
+    solve(solver, {"history": [["crane", "....."]]}, cache)
+
+    assert cache.stats() == {"size": 4, "hits": 1, "store_hits": 0, "misses": 4, "evictions": 0}
+
+
+def test_when_handle_request_and_cache_file_then_responses_shared_between_workers(cutdown_words, tmp_path):
+    cache_file = str(tmp_path / "states.db")
+    with patch.object(wordle_service, "_worker_solver", None), patch.object(wordle_service, "_worker_cache", None):
+        init_worker(cutdown_words, cache_file=cache_file)
+        expected = handle_request({"greys": ["A"]})
+
+        init_worker(cutdown_words, cache_file=cache_file)
+        actual = handle_request({"greys": ["a"]})
+        stats = cache_stats()
+
+    assert actual == expected
+    assert stats == {"size": 1, "hits": 1, "store_hits": 1, "misses": 0, "evictions": 0}
+
+
+def test_when_handle_request_for_stats_then_worker_cache_counters_returned(cutdown_words):
+    with patch.object(wordle_service, "_worker_solver", None), patch.object(wordle_service, "_worker_cache", None):
+        init_worker(cutdown_words)
+        handle_request({"greys": ["A"]})
+        handle_request({"greys": ["a"]})
+        actual = handle_request({"stats": True})
+
+    assert actual == {
+        "worker": os.getpid(),
+        "cache": {"size": 1, "hits": 1, "store_hits": 0, "misses": 1, "evictions": 0},
+    }
+
+
+def test_when_log_cache_stats_then_worker_counters_logged(solver, caplog):
+    handle_request({"greys": ["A"]})
+
+    with caplog.at_level(logging.INFO, logger="WordleService"):
+        log_cache_stats()
+
+    assert caplog.messages == [f"Worker {os.getpid()} response cache: {json.dumps(cache_stats())}"]
+
+
+@mark.parametrize("in_worker_process", [True, False])
+def test_when_init_worker_then_counters_logged_at_exit_of_worker_processes_only(cutdown_words, in_worker_process):
+    parent = Mock() if in_worker_process else None
+
+    with (
+        patch("multiprocessing.parent_process", return_value=parent),
+        patch("game_solvers.games.wordle_service.Finalize") as finalize,
+    ):
+        init_worker(cutdown_words)
+
+    assert finalize.call_args_list == ([call(None, log_cache_stats, exitpriority=0)] if in_worker_process else [])
@@ -0,0 +1,109 @@
+from unittest.mock import patch
+
+from game_solvers.games.wordle_patterns import feedback, load_pattern_matrix
+from game_solvers.games.wordle_simulation import SimulationResult, WordleSimulator, simulate
+from game_solvers.games.wordle_tree import build_decision_tree
+from pytest import fixture, mark, raises
+
+
+@fixture
+def words(cutdown_words):
+    return cutdown_words[:300]
+
+
+@mark.parametrize("strategy", ["score", "entropy", "minimax"])
+def test_when_play_then_every_guess_fits_the_feedback_so_far(strategy, words):
+    simulator = WordleSimulator(words, strategy, None, load_pattern_matrix(words))
+
+    for answer in words[::25]:
+        guesses = simulator.play(answer)
+
+        assert guesses[0] == simulator.opener
+        assert guesses[-1] == answer
+        assert len(set(guesses)) == len(guesses)
+        for index, guess in enumerate(guesses[1:], start=1):
+            assert all(feedback(previous, guess) == feedback(previous, answer) for previous in guesses[:index])
+
+
+def test_when_simulator_and_no_opener_then_highest_scoring_word_opens(words):
+    simulator = WordleSimulator(words, "score", None, load_pattern_matrix(words))
+
+    assert simulator.opener == words[simulator.scores.index(max(simulator.scores))]
+    assert simulator.play(simulator.opener) == [simulator.opener]
+
+
+def test_when_simulator_and_opener_not_in_dictionary_then_raise_error(words):
+    with raises(ValueError, match="Opener zzzzz is not in the dictionary."):
+        WordleSimulator(words, "score", "zzzzz", load_pattern_matrix(words))
+
+
+def test_when_simulator_and_unknown_strategy_then_raise_error(words):
+    with raises(ValueError, match="Unknown ranking strategy magic."):
+        WordleSimulator(words, "magic", None, load_pattern_matrix(words))
+
+
+def test_when_simulation_result_then_statistics_calculated():
+    result = SimulationResult("score", "CRANE", [1, 3, 3, 4, 7, 9], 2.0)
+
+    assert result.games == 6
+    assert result.distribution == {1: 1, 3: 2, 4: 1, 7: 1, 9: 1}
+    assert result.failures == 2
+    assert result.failure_rate == 2 / 6
+    assert result.mean_guesses == 4.5
+    assert result.games_per_second == 3.0
+
+
+def test_when_simulation_result_and_no_games_then_statistics_zero():
+    result = SimulationResult("score", "CRANE", [], 0.0)
+
+    assert result.distribution == {}
+    assert result.failure_rate == 0.0
+    assert result.mean_guesses == 0.0
+    assert result.games_per_second == 0.0
+
+
+def test_when_simulate_then_game_played_against_every_word(words):
+    simulator = WordleSimulator(words, "entropy", words[5], load_pattern_matrix(words))
+
+    actual = simulate(words, "entropy", words[5].lower(), workers=1)
+
+    assert actual.games == len(words)
+    assert actual.opener == words[5]
+    assert actual.mean_guesses == sum(len(simulator.play(answer)) for answer in words) / len(words)
+
+
+def test_when_simulate_in_worker_processes_then_same_as_in_process(words):
+    answers = words[:40]
+
+    expected = simulate(words, "minimax", answers=answers, workers=1)
+    actual = simulate(words, "minimax", answers=answers, workers=2)
+
+    assert actual.distribution == expected.distribution
+    assert actual.opener == expected.opener
+
+
+def test_when_simulate_and_answer_not_in_dictionary_then_raise_error(words):
+    with raises(ValueError, match="Answers ZZZZZ are not in the dictionary."):
+        simulate(words, answers=["zzzzz"], workers=1)
+
+
+def test_when_simulate_tree_then_same_as_strategy_tree_was_built_with(words):
+    tree = build_decision_tree(words, strategy="minimax", workers=1)
+
+    with patch("game_solvers.games.wordle_simulation.read_decision_tree_resource", return_value=tree):
+        actual = simulate(words, strategy="tree", workers=1)
+
+    expected = simulate(words, strategy="minimax", opener=tree.opener, workers=1)
+    assert actual.opener == tree.opener
+    assert actual.distribution == expected.distribution
+
+
+def test_when_simulator_tree_and_other_opener_then_raise_error(words):
+    tree = build_decision_tree(words, workers=1)
+    opener = next(word for word in words if word != tree.opener)
+
+    with (
+        patch("game_solvers.games.wordle_simulation.read_decision_tree_resource", return_value=tree),
+        raises(ValueError, match=f"The decision tree opens with {tree.opener}. Input {opener} is invalid."),
+    ):
+        WordleSimulator(words, "tree", opener, load_pattern_matrix(words))
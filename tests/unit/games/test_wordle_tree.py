@@ -0,0 +1,117 @@
+import re
+
+from game_solvers.games.wordle_patterns import ALL_GREEN, feedback, load_pattern_matrix
+from game_solvers.games.wordle_simulation import WordleSimulator
+from game_solvers.games.wordle_tree import (
+    build_decision_tree,
+    pack_decision_tree,
+    read_decision_tree_resource,
+    unpack_decision_tree,
+)
+from pytest import fixture, mark, raises
+
+
+@fixture
+def words(cutdown_words):
+    return cutdown_words[:400]
+
+
+@fixture
+def tree(words):
+    return build_decision_tree(words, strategy="entropy", workers=1)
+
+
+def play(tree, answer):
+    node = 0
+    guesses = [tree.guess(node)]
+    while guesses[-1] != answer:
+        node = tree.child(node, feedback(guesses[-1], answer))
+        guesses.append(tree.guess(node))
+
+    return guesses
+
+
+def test_when_build_then_every_answer_is_one_node(tree, words):
+    assert sorted(tree.guesses) == list(range(len(words)))
+    assert tree.answers[0] == len(words)
+
+
+def test_when_build_then_games_match_simulator(tree, words):
+    simulator = WordleSimulator(words, "entropy", tree.opener, load_pattern_matrix(words))
+
+    for answer in words:
+        assert play(tree, answer) == simulator.play(answer)
+
+
+def test_when_build_then_edges_ordered_and_answers_split(tree):
+    for node in range(len(tree.guesses)):
+        start, end = tree.edge_starts[node], tree.edge_starts[node + 1]
+        patterns = list(tree.edge_patterns[start:end])
+        children = tree.edge_children[start:end]
+
+        assert patterns == sorted(set(patterns))
+        assert ALL_GREEN not in patterns
+        assert sum(tree.answers[child] for child in children) == tree.answers[node] - 1
+
+
+def test_when_build_in_worker_processes_then_same_as_in_process(tree, words):
+    actual = build_decision_tree(words, strategy="entropy", workers=2)
+
+    assert pack_decision_tree(actual) == pack_decision_tree(tree)
+
+
+def test_when_child_and_no_answer_gives_pattern_then_none_returned(tree):
+    assert tree.child(0, ALL_GREEN) is None
+
+
+def test_when_follow_then_node_of_feedback_reached(tree, words):
+    answer = words[123]
+    guesses = play(tree, answer)
+
+    node = tree.follow([(guess, feedback(guess, answer)) for guess in guesses[:-1]])
+
+    assert tree.guess(node) == answer
+    assert node == tree.walk([feedback(guess, answer) for guess in guesses[:-1]])
+
+
+def test_when_follow_and_guess_not_from_tree_then_none_returned(tree, words):
+    guess = next(word for word in words if word != tree.opener)
+
+    assert tree.follow([(guess, 0)]) is None
+
+
+def test_when_pack_then_unpack_gives_same_tree(tree, words):
+    data = pack_decision_tree(tree)
+
+    actual = unpack_decision_tree(words, data)
+
+    assert actual.opener == tree.opener
+    assert actual.guesses == tree.guesses
+    assert actual.answers == tree.answers
+    assert actual.edge_starts == tree.edge_starts
+    assert actual.edge_patterns == tree.edge_patterns
+    assert actual.edge_children == tree.edge_children
+
+
+@mark.parametrize(
+    "corrupt, err_msg",
+    [
+        (lambda data: b"XXXX" + data[4:], "Unsupported decision tree format (magic=b'XXXX', version=1)."),
+        (lambda data: data[:-1], "Compiled decision tree is truncated."),
+    ],
+)
+def test_when_unpack_and_data_invalid_then_raise_error(corrupt, err_msg, tree, words):
+    with raises(ValueError, match=re.escape(err_msg)):
+        unpack_decision_tree(words, corrupt(pack_decision_tree(tree)))
+
+
+def test_when_unpack_and_different_words_then_raise_error(tree, words):
+    with raises(ValueError, match="Decision tree was built for a different word list."):
+        unpack_decision_tree(words[:-1], pack_decision_tree(tree))
+
+
+def test_when_read_bundled_tree_then_covers_bundled_dictionary(dictionary):
+    actual = read_decision_tree_resource(dictionary)
+
+    assert sorted(actual.guesses) == list(range(len(dictionary)))
+    assert actual.answers[0] == len(dictionary)
@@ -1,7 +1,14 @@
+import json
 import re
-from unittest.mock import Mock, call, patch
+import sys
+import tracemalloc
+from unittest.mock import AsyncMock, Mock, call, patch
 
-from game_solvers.cli import WordleCLI
+from game_solvers.cli import WordleCLI, cli_main, serve
+from game_solvers.common.benchmark import read_results, write_results
+from game_solvers.games.wordle import STRATEGIES
+from game_solvers.games.wordle_patterns import feedback, parse_pattern
+from game_solvers.games.wordle_service import handle_request, init_worker
 from pytest import fixture, mark, raises
 
 
@@ -121,27 +128,410 @@ class TestWordleCLI:
         with raises(ValueError, match=err_msg):
             wordle_cli.parse_grey("4")
 
+    @mark.parametrize(
+        "input_value,expected",
+        [
+            (None, []),
+            ("crane:gy..g", [("CRANE", 2 + 3 + 2 * 81)]),
+            ("CRANE:.....,sloth:..G..", [("CRANE", 0), ("SLOTH", 2 * 9)]),
+        ],
+    )
+    def test_when_parse_history_then_correct_values_returned(self, wordle_cli, input_value, expected):
+        actual = wordle_cli.parse_history(input_value)
+        assert actual == expected
+
+    @mark.parametrize("input_value", ["cran:gy..g", "cr4ne:gy..g", "cranes"])
+    def test_when_parse_history_and_guess_invalid_then_raise_error(self, wordle_cli, input_value):
+        err_msg = re.escape(
+            f"Each input for history must be a five letter guess, a colon and its feedback. Input {input_value} is invalid."
+        )
+
+        with raises(ValueError, match=err_msg):
+            wordle_cli.parse_history(input_value)
+
+    def test_when_parse_history_and_feedback_invalid_then_raise_error(self, wordle_cli):
+        err_msg = re.escape("Feedback patterns must be five characters of g (green), y (yellow) or . (grey).")
+
+        with raises(ValueError, match=err_msg):
+            wordle_cli.parse_history("crane:gyz.g")
+
     def test_when_solutions_then_correct_calls_made(self, wordle_cli):
         opts = Mock(
             green_letters="a4",
             yellow_letters="b123",
             grey_letters="g,f,q",
+            strategy="entropy",
+            top=5,
+            history_input="crane:gy..g",
+            output_format="json",
+            workers=4,
+            profile=False,
+            profile_dir=None,
         )
 
-        wordle_cli.parse_green = Mock(return_value=[("A", 4)])
-        wordle_cli.parse_yellow = Mock(return_value=[("B", [1, 2, 3])])
-        wordle_cli.parse_grey = Mock(return_value=["G", "F", "Q"])
-
-        with patch("game_solvers.cli.WordleSolver") as wordle_solver:
+        with (
+            patch.object(wordle_cli, "parse_green", Mock(return_value=[("A", 4)])) as parse_green,
+            patch.object(wordle_cli, "parse_yellow", Mock(return_value=[("B", [1, 2, 3])])) as parse_yellow,
+            patch.object(wordle_cli, "parse_grey", Mock(return_value=["G", "F", "Q"])) as parse_grey,
+            patch("game_solvers.cli.WordleSolver") as wordle_solver,
+        ):
             wordle_cli.solutions(opts)
 
-        wordle_cli.parse_green.assert_called_once_with("a4")
-        wordle_cli.parse_yellow.assert_called_once_with("b123")
-        wordle_cli.parse_grey.assert_called_once_with("g,f,q")
+        parse_green.assert_called_once_with("a4")
+        parse_yellow.assert_called_once_with("b123")
+        parse_grey.assert_called_once_with("g,f,q")
 
         wordle_solver.assert_has_calls(
             [
-                call([("A", 4)], [("B", [1, 2, 3])], ["G", "F", "Q"]),
-                call().solutions(),
+                call([("A", 4)], [("B", [1, 2, 3])], ["G", "F", "Q"], profiler=None),
+                call().apply_feedback("CRANE", 2 + 3 + 2 * 81),
+                call().solutions(strategy="entropy", top=5, output_format="json"),
+                call().close(),
             ]
         )
+        assert wordle_solver.return_value.ranking_workers == 4
+
+    def test_when_solutions_and_solving_fails_then_solver_closed(self, wordle_cli):
+        opts = Mock(
+            green_letters=None,
+            yellow_letters=None,
+            grey_letters=None,
+            history_input=None,
+            strategy="entropy",
+            top=5,
+            output_format="json",
+            workers=4,
+            profile=False,
+            profile_dir=None,
+        )
+
+        with patch("game_solvers.cli.WordleSolver") as wordle_solver, raises(RuntimeError):
+            wordle_solver.return_value.solutions.side_effect = RuntimeError("Ranking failed.")
+            wordle_cli.solutions(opts)
+
+        wordle_solver.return_value.close.assert_called_once_with()
+
+    def test_when_solutions_and_history_then_answers_give_same_feedback(self, wordle_cli, capsys):
+        opts = Mock(
+            green_letters=None,
+            yellow_letters=None,
+            grey_letters=None,
+            history_input="CRANE:..g..,SLOTH:.y...",
+            strategy="score",
+            top=50,
+            output_format="json",
+            workers=1,
+            profile=False,
+            profile_dir=None,
+        )
+
+        wordle_cli.solutions(opts)
+
+        answers = [word for word, _ in json.loads(capsys.readouterr().out)["answers"]]
+        assert answers
+        assert all(feedback("CRANE", word) == parse_pattern("..g..") for word in answers)
+        assert all(feedback("SLOTH", word) == parse_pattern(".y...") for word in answers)
+
+    def test_when_solutions_and_profile_then_stage_report_written_to_stderr(self, wordle_cli, tmp_path, capsys):
+        opts = Mock(
+            green_letters="a3",
+            yellow_letters=None,
+            grey_letters="s,r",
+            history_input=None,
+            strategy="score",
+            top=3,
+            output_format="json",
+            workers=1,
+            profile=True,
+            profile_dir=str(tmp_path / "profiles"),
+        )
+
+        wordle_cli.solutions(opts)
+
+        captured = capsys.readouterr()
+        report = json.loads(captured.err)
+        assert len(json.loads(captured.out)["answers"]) == 3
+        assert [stage["stage"] for stage in report["stages"]] == [
+            "load",
+            "distribution",
+            "filter",
+            "constraint-plan",
+            "word-scores",
+            "score",
+            "sort",
+            "non-repeating",
+            "new-char",
+            "rank",
+            "render",
+        ]
+        assert all(stage["calls"] >= 1 and stage["seconds"] >= 0 for stage in report["stages"])
+        assert report["profiles"] == [
+            str(tmp_path / "profiles" / f"{stage['stage']}.prof") for stage in report["stages"]
+        ]
+        assert [constraint["constraint"] for constraint in report["constraints"]["constraints"]] == [
+            "green A3",
+            "grey S",
+            "grey R",
+        ]
+        assert not tracemalloc.is_tracing()
+
+    @mark.parametrize("sample,expected_answers", [(None, None), (2, ["BBBBB", "AAAAA"])])
+    def test_when_simulate_then_correct_calls_made(self, wordle_cli, sample, expected_answers):
+        opts = Mock(strategy="minimax", opener="crane", sample=sample, seed=3, workers=2)
+        result = Mock()
+
+        with (
+            patch("game_solvers.cli.WordleSolver") as wordle_solver,
+            patch("game_solvers.games.wordle_simulation.simulate", return_value=result) as simulate_wordle,
+            patch("game_solvers.common.report.report_wordle_simulation") as report_wordle_simulation,
+            patch("random.Random") as random_class,
+        ):
+            wordle_solver.prep_words.return_value = ["AAAAA", "BBBBB", "CCCCC"]
+            random_class.return_value.sample.return_value = ["BBBBB", "AAAAA"]
+
+            wordle_cli.simulate(opts)
+
+        simulate_wordle.assert_called_once_with(
+            ["AAAAA", "BBBBB", "CCCCC"], strategy="minimax", opener="crane", answers=expected_answers, workers=2
+        )
+        report_wordle_simulation.assert_called_once_with(
+            result.strategy,
+            result.opener,
+            result.games,
+            result.distribution,
+            result.failure_rate,
+            result.mean_guesses,
+            result.games_per_second,
+        )
+
+    @mark.parametrize(
+        "input_value,expected_call",
+        [
+            ("crane gy..g", call.apply_feedback("crane", "gy..g")),
+            ("  CRANE  21002 ", call.apply_feedback("crane", "21002")),
+            ("green a2,y5", call.add_letters([("A", 2), ("Y", 5)], [], [])),
+            ("Yellow b12", call.add_letters([], [("B", [1, 2])], [])),
+            ("grey r,c", call.add_letters([], [], ["R", "C"])),
+            ("new", call.reset()),
+        ],
+    )
+    def test_when_play_turn_then_solver_updated(self, input_value, expected_call):
+        solver = Mock()
+
+        actual = WordleCLI.play_turn(solver, input_value, "score")
+
+        assert actual == "score"
+        assert solver.mock_calls == [expected_call]
+
+    def test_when_play_turn_and_strategy_then_strategy_changed(self):
+        solver = Mock()
+
+        actual = WordleCLI.play_turn(solver, "strategy Entropy", "score")
+
+        assert actual == "entropy"
+        assert solver.mock_calls == []
+
+    @mark.parametrize(
+        "input_value,err_msg",
+        [
+            ("strategy magic", "Strategy must be one of score, entropy, minimax, tree. Input magic is invalid."),
+            ("crane", "Unrecognised input crane, enter help to list what can be entered."),
+            ("crane gy ..g", "Unrecognised input crane gy ..g, enter help to list what can be entered."),
+            (
+                "green a7",
+                "Each input for green letters must a letter followed by a number from 1-5. Input a7 is invalid.",
+            ),
+        ],
+    )
+    def test_when_play_turn_and_input_invalid_then_raise_error(self, input_value, err_msg):
+        with raises(ValueError, match=re.escape(err_msg)):
+            WordleCLI.play_turn(Mock(), input_value, "score")
+
+    def test_when_play_then_turns_applied_until_quit(self, capsys):
+        inputs = iter(["", "crane gy..g", "foo", "strategy entropy", "quit", "new"])
+
+        with (
+            patch("game_solvers.cli.WordleSolver") as wordle_solver,
+            patch("builtins.input", side_effect=lambda prompt: next(inputs)),
+        ):
+            WordleCLI.play(Mock(strategy="minimax", top=10, workers=2))
+
+        solver = wordle_solver.return_value
+        wordle_solver.assert_called_once_with([], [], [])
+        assert solver.ranking_workers == 2
+        solver.apply_feedback.assert_called_once_with("crane", "gy..g")
+        solver.reset.assert_not_called()
+        assert solver.solutions.call_args_list == [call(strategy="minimax", top=10), call(strategy="entropy", top=10)]
+        assert "Unrecognised input foo" in capsys.readouterr().out
+        solver.close.assert_called_once_with()
+
+    def test_when_play_and_input_ends_then_session_ends(self):
+        with (
+            patch("game_solvers.cli.WordleSolver") as wordle_solver,
+            patch("builtins.input", side_effect=EOFError),
+        ):
+            WordleCLI.play(Mock(strategy="score"))
+
+        wordle_solver.return_value.solutions.assert_not_called()
+        wordle_solver.return_value.close.assert_called_once_with()
+
+    def test_when_batch_then_responses_written_in_order(self, wordle_cli, tmp_path):
+        input_path = tmp_path / "games.jsonl"
+        output_path = tmp_path / "ranked.jsonl"
+        input_path.write_text('{"greys": ["A"]}\n{"id": "b", "strategy": "minimax"}\n')
+        opts = Mock(
+            input_path=str(input_path),
+            output_path=str(output_path),
+            strategy="entropy",
+            limit=3,
+            workers=1,
+            chunk_size=1,
+            cache_size=100,
+            cache_file=None,
+        )
+
+        with (
+            patch("game_solvers.games.wordle_service.init_worker") as init_worker,
+            patch(
+                "game_solvers.games.wordle_service.handle_request", side_effect=lambda request: request
+            ) as handle_request,
+            patch("game_solvers.games.wordle_service.log_cache_stats") as log_cache_stats,
+        ):
+            wordle_cli.batch(opts)
+
+        init_worker.assert_called_once_with(cache_size=100, cache_file=None)
+        log_cache_stats.assert_called_once_with()
+        assert handle_request.call_args_list == [
+            call({"strategy": "entropy", "limit": 3, "greys": ["A"]}),
+            call({"strategy": "minimax", "limit": 3}),
+        ]
+        assert output_path.read_text().splitlines() == [
+            '{"id": 1, "ok": true, "strategy": "entropy", "limit": 3, "greys": ["A"]}',
+            '{"id": "b", "ok": true, "strategy": "minimax", "limit": 3}',
+        ]
+
+    def test_when_solutions_help_then_every_strategy_listed(self, capsys):
+        with raises(SystemExit):
+            cli_main(["wordle", "solutions", "--help"])
+
+        help_text = " ".join(capsys.readouterr().out.split())
+        assert f"How to rank guesses, one of {', '.join(STRATEGIES)}." in help_text
+
+    @mark.parametrize("chunk_size", [0, -1])
+    def test_when_batch_and_chunk_size_invalid_then_raise_error(self, chunk_size, wordle_cli, tmp_path):
+        output_path = tmp_path / "ranked.jsonl"
+        opts = Mock(
+            input_path="-",
+            output_path=str(output_path),
+            strategy="score",
+            limit=10,
+            workers=1,
+            chunk_size=chunk_size,
+            cache_size=4096,
+            cache_file=None,
+        )
+
+        err_msg = f"Chunk size must be a positive number. Input {chunk_size} is invalid."
+
+        with raises(ValueError, match=re.escape(err_msg)):
+            wordle_cli.batch(opts)
+        assert not output_path.exists()
+
+    def test_when_batch_with_workers_then_pool_used(self, wordle_cli, capsys):
+        opts = Mock(
+            input_path="-",
+            output_path="-",
+            strategy="score",
+            limit=10,
+            workers=3,
+            chunk_size=50,
+            cache_size=4096,
+            cache_file=None,
+        )
+
+        with (
+            patch("concurrent.futures.ProcessPoolExecutor") as executor_class,
+            patch("game_solvers.common.batch.iter_batch", return_value=iter(["{}", "{}"])) as iter_batch,
+            patch("game_solvers.games.wordle_service.log_cache_stats") as log_cache_stats,
+        ):
+            wordle_cli.batch(opts)
+
+        executor_class.assert_called_once_with(3, initializer=init_worker, initargs=(None, 4096, None))
+        iter_batch.assert_called_once_with(
+            sys.stdin,
+            handle_request,
+            executor_class.return_value.__enter__.return_value,
+            defaults={"strategy": "score", "limit": 10},
+            chunk_size=50,
+            max_pending=6,
+        )
+        assert capsys.readouterr().out == "{}\n{}\n"
+        log_cache_stats.assert_not_called()
+
+    def test_when_benchmark_and_no_baseline_then_results_written(self, wordle_cli, tmp_path, capsys):
+        output_path = tmp_path / "results.json"
+        opts = Mock(output_path=str(output_path), baseline_path=None, threshold=0.25, scales="1,10", repeat=2)
+        results = {"a@1x": {"seconds": 0.001, "mean_seconds": 0.001, "number": 10}}
+
+        with (
+            patch("game_solvers.games.wordle_benchmark.wordle_benchmarks") as wordle_benchmarks,
+            patch("game_solvers.common.benchmark.run_benchmarks", return_value=results) as run_benchmarks,
+        ):
+            actual = wordle_cli.benchmark(opts)
+
+        assert actual == 0
+        wordle_benchmarks.assert_called_once_with((1, 10))
+        run_benchmarks.assert_called_once_with(wordle_benchmarks.return_value, 2)
+        assert read_results(output_path) == results
+        assert capsys.readouterr().out.split() == ["a@1x", "1.0000ms"]
+
+    @mark.parametrize("seconds,expected", [(0.0011, 0), (0.002, 1)])
+    def test_when_benchmark_and_baseline_then_regressions_fail(self, seconds, expected, wordle_cli, tmp_path, capsys):
+        baseline_path = write_results({"a@1x": {"seconds": 0.001}}, tmp_path / "baseline.json")
+        opts = Mock(
+            output_path=str(tmp_path / "results.json"),
+            baseline_path=str(baseline_path),
+            threshold=0.25,
+            scales="1",
+            repeat=1,
+        )
+
+        with (
+            patch("game_solvers.games.wordle_benchmark.wordle_benchmarks"),
+            patch("game_solvers.common.benchmark.run_benchmarks", return_value={"a@1x": {"seconds": seconds}}),
+        ):
+            actual = wordle_cli.benchmark(opts)
+
+        assert actual == expected
+        assert ("REGRESSED" in capsys.readouterr().out) == bool(expected)
+
+    @mark.parametrize("scales", ["", "1,x", "0", "1,-2"])
+    def test_when_benchmark_and_scales_invalid_then_raise_error(self, scales, wordle_cli):
+        opts = Mock(output_path="results.json", baseline_path=None, threshold=0.25, scales=scales, repeat=1)
+
+        err_msg = f"Scales must be a comma separated list of positive numbers. Input {scales} is invalid."
+
+        with raises(ValueError, match=re.escape(err_msg)):
+            wordle_cli.benchmark(opts)
+
+
+@fixture(params=[False, True], ids=["tcp", "unix"])
+def socket_path(request, tmp_path):
+    return str(tmp_path / "solver.sock") if request.param else None
+
+
+def test_when_serve_then_server_run_with_worker_pool(socket_path):
+    opts = Mock(socket_path=socket_path, host="127.0.0.1", port=9000, workers=3, cache_size=100, cache_file="states.db")
+
+    with (
+        patch("game_solvers.games.wordle_dictionary.load_dictionary") as load_dictionary,
+        patch("concurrent.futures.ProcessPoolExecutor") as executor_class,
+        patch("game_solvers.common.server.SolverServer") as server_class,
+    ):
+        server_class.return_value.serve = AsyncMock()
+        serve(opts)
+
+    load_dictionary.return_value.preload.assert_called_once_with()
+    executor_class.assert_called_once_with(max_workers=3, initializer=init_worker, initargs=(None, 100, "states.db"))
+    server_class.assert_called_once_with(handle_request, executor_class.return_value.__enter__.return_value)
+    server_class.return_value.serve.assert_awaited_once_with(socket_path, "127.0.0.1", 9000)
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from unittest.mock import patch
+
+import game_solvers
+from game_solvers import __version__
+from game_solvers.__main__ import main
+from pytest import mark, raises
+
+# most time importing the cli, and everything it imports, may take, in microseconds. generous enough for a slow
+# machine, tight enough to catch a heavy dependency being imported at startup again
+IMPORT_TIME_BUDGET_US = 750_000
+
+
+def import_times(*args):
+    """Run the cli with import timing, returning the cumulative import time of each module in microseconds."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-m", "game_solvers", *args], capture_output=True, text=True, check=True
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            _, cumulative, module = line.split("|")
+            times[module.strip()] = int(cumulative)
+
+    return times
+
+
+def test_when_version_then_printed_without_loading_cli(capsys):
+    with patch.object(sys, "argv", ["__main__.py", "--version"]), patch("game_solvers.cli.cli_main") as cli_main:
+        main()
+
+    cli_main.assert_not_called()
+    assert capsys.readouterr().out == f"__main__.py version: {__version__}\n"
+
+
+def test_when_version_then_read_from_installed_package():
+    assert __version__ == version("game-solvers")
+
+
+def test_when_version_and_package_not_installed_then_unknown():
+    with (
+        patch.dict(vars(game_solvers)),
+        patch("importlib.metadata.version", side_effect=PackageNotFoundError("game-solvers")),
+    ):
+        vars(game_solvers).pop("__version__", None)
+
+        assert game_solvers.__version__ == "unknown"
+
+
+def test_when_other_attribute_missing_then_raise_error():
+    with raises(AttributeError, match="has no attribute 'missing'"):
+        game_solvers.missing  # noqa: B018
+
+
+def test_when_version_then_cli_never_imported():
+    times = import_times("--version")
+
+    assert "game_solvers" in times
+    assert "game_solvers.cli" not in times
+    assert "pyapp" not in times
+
+
+@mark.parametrize("args", [["--help"], ["wordle", "--help"]])
+def test_when_help_then_heavy_modules_not_imported_and_within_budget(args):
+    times = import_times(*args)
+
+    assert not [module for module in times if module == "rich" or module.startswith("rich.")]
+    assert "concurrent.futures.process" not in times
+    assert "game_solvers.common.report" not in times
+    assert times["game_solvers.cli"] <= IMPORT_TIME_BUDGET_US
+
+
+def test_when_solutions_in_machine_readable_format_then_rich_not_imported():
+    times = import_times("wordle", "solutions", "--green", "A2", "--top", "3", "--format", "tsv")
+
+    assert "game_solvers.common.formats" in times
+    assert not [module for module in times if module == "rich" or module.startswith("rich.")]